@@ -3,19 +3,66 @@ package bridge
 import (
 	"context"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/sungur/ccbox/internal/docker"
 	"github.com/sungur/ccbox/internal/log"
 )
 
+// containerHealthTTL is how long a positive health check is reused, so most
+// refreshes skip the exec. The TTL bounds how long a restarted container can
+// be reported healthy before its entrypoint has recreated the marker.
+const containerHealthTTL = 30 * time.Second
+
+// healthyContainers maps container IDs to the time their health marker was
+// last seen.
+var (
+	healthyContainersMu sync.Mutex
+	healthyContainers   = make(map[string]time.Time)
+)
+
 // CheckHealth checks if the container entrypoint has completed successfully
 // by testing for the health marker file (/tmp/ccbox-healthy).
 func CheckHealth(ctx context.Context, containerID string) bool {
-	result, err := docker.Exec(ctx, containerID, []string{
+	healthyContainersMu.Lock()
+	seen, ok := healthyContainers[containerID]
+	healthyContainersMu.Unlock()
+	if ok && time.Since(seen) < containerHealthTTL {
+		return true
+	}
+
+	exitCode, err := docker.ExecExitCode(ctx, containerID, []string{
 		"test", "-f", "/tmp/ccbox-healthy",
 	})
-	return err == nil && result.ExitCode == 0
+	healthy := err == nil && exitCode == 0
+
+	healthyContainersMu.Lock()
+	if healthy {
+		healthyContainers[containerID] = time.Now()
+	} else {
+		delete(healthyContainers, containerID)
+	}
+	healthyContainersMu.Unlock()
+	return healthy
+}
+
+// forgetGoneContainers drops cached health results for containers that are
+// no longer in the latest listing. A container that stopped or restarted is
+// probed again once it is back, and the cache stays bounded.
+func forgetGoneContainers(containers []ContainerInfo) {
+	current := make(map[string]bool, len(containers))
+	for _, c := range containers {
+		current[c.ID] = true
+	}
+
+	healthyContainersMu.Lock()
+	defer healthyContainersMu.Unlock()
+	for id := range healthyContainers {
+		if !current[id] {
+			delete(healthyContainers, id)
+		}
+	}
 }
 
 // DiscoverSessions lists Claude Code sessions inside a running container by
@@ -35,32 +82,37 @@ func DiscoverSessions(ctx context.Context, containerID string) []Session {
 		return nil
 	}
 
-	output := strings.TrimSpace(result.Stdout)
-	if output == "" {
-		return nil
-	}
+	return parseSessionPaths(result.Stdout, time.Now())
+}
 
+// parseSessionPaths turns find output (one session file path per line) into
+// sessions. It walks the output line by line instead of splitting it, and
+// then each path, into intermediate slices.
+func parseSessionPaths(output string, createdAt time.Time) []Session {
 	var sessions []Session
-	for _, line := range strings.Split(output, "\n") {
+	for output != "" {
+		var line string
+		line, output, _ = strings.Cut(output, "\n")
 		line = strings.TrimSpace(line)
 		if line == "" {
 			continue
 		}
 
 		// Path format: /ccbox/.claude/projects/<project>/<session-id>.jsonl
-		parts := strings.Split(line, "/")
-		if len(parts) < 2 {
+		slash := strings.LastIndexByte(line, '/')
+		if slash < 0 {
 			continue
 		}
 
-		sessionFile := parts[len(parts)-1]
-		projectDir := parts[len(parts)-2]
+		sessionFile := line[slash+1:]
+		projectDir := line[:slash]
+		projectDir = projectDir[strings.LastIndexByte(projectDir, '/')+1:]
 		sessionID := strings.TrimSuffix(sessionFile, ".jsonl")
 
 		sessions = append(sessions, Session{
 			ID:        sessionID,
 			Project:   projectDir,
-			CreatedAt: time.Now(), // Approximate; could stat the file for mtime.
+			CreatedAt: createdAt, // Approximate; could stat the file for mtime.
 		})
 	}
 	return sessions
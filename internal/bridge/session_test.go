@@ -0,0 +1,141 @@
+package bridge
+
+import (
+	"bufio"
+	"context"
+	"net"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/docker/docker/api/types"
+	"github.com/docker/docker/api/types/container"
+
+	"github.com/sungur/ccbox/internal/docker"
+)
+
+func TestParseSessionPaths(t *testing.T) {
+	now := time.Now()
+	tests := []struct {
+		name   string
+		output string
+		want   []Session
+	}{
+		{
+			name:   "empty output",
+			output: "",
+			want:   nil,
+		},
+		{
+			name:   "single session",
+			output: "/ccbox/.claude/projects/myproj/abc-123.jsonl\n",
+			want:   []Session{{ID: "abc-123", Project: "myproj", CreatedAt: now}},
+		},
+		{
+			name:   "blank lines and padding",
+			output: "\n  /ccbox/.claude/projects/a/s1.jsonl  \n\n/ccbox/.claude/projects/b/s2.jsonl",
+			want: []Session{
+				{ID: "s1", Project: "a", CreatedAt: now},
+				{ID: "s2", Project: "b", CreatedAt: now},
+			},
+		},
+		{
+			name:   "line without a directory",
+			output: "orphan.jsonl\nproj/s3.jsonl\n",
+			want:   []Session{{ID: "s3", Project: "proj", CreatedAt: now}},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := parseSessionPaths(tt.output, now)
+			if len(got) != len(tt.want) {
+				t.Fatalf("parseSessionPaths() returned %d sessions, want %d: %v", len(got), len(tt.want), got)
+			}
+			for i := range got {
+				if got[i] != tt.want[i] {
+					t.Errorf("session[%d] = %+v, want %+v", i, got[i], tt.want[i])
+				}
+			}
+		})
+	}
+}
+
+// fakeHealthDocker answers the exec calls made by CheckHealth.
+// Other DockerAPI methods are not implemented.
+type fakeHealthDocker struct {
+	docker.DockerAPI
+	exitCode int
+	probes   int
+}
+
+func (f *fakeHealthDocker) ContainerExecCreate(ctx context.Context, id string, options container.ExecOptions) (container.ExecCreateResponse, error) {
+	f.probes++
+	return container.ExecCreateResponse{ID: "exec"}, nil
+}
+
+func (f *fakeHealthDocker) ContainerExecAttach(ctx context.Context, execID string, options container.ExecAttachOptions) (types.HijackedResponse, error) {
+	conn, peer := net.Pipe()
+	_ = peer.Close()
+	return types.HijackedResponse{Conn: conn, Reader: bufio.NewReader(strings.NewReader(""))}, nil
+}
+
+func (f *fakeHealthDocker) ContainerExecInspect(ctx context.Context, execID string) (container.ExecInspect, error) {
+	return container.ExecInspect{ExitCode: f.exitCode}, nil
+}
+
+func TestCheckHealthCache(t *testing.T) {
+	fake := &fakeHealthDocker{}
+	docker.SetClientForTest(fake)
+	t.Cleanup(func() {
+		docker.SetClientForTest(nil)
+		forgetGoneContainers(nil)
+	})
+	ctx := context.Background()
+
+	if !CheckHealth(ctx, "c1") || fake.probes != 1 {
+		t.Fatalf("first check: want healthy after 1 probe, got probes=%d", fake.probes)
+	}
+	if !CheckHealth(ctx, "c1") || fake.probes != 1 {
+		t.Fatalf("within TTL: want cached healthy result, got probes=%d", fake.probes)
+	}
+
+	// Expired entry is probed again
+	healthyContainersMu.Lock()
+	healthyContainers["c1"] = time.Now().Add(-containerHealthTTL)
+	healthyContainersMu.Unlock()
+	if !CheckHealth(ctx, "c1") || fake.probes != 2 {
+		t.Fatalf("after TTL: want re-probe, got probes=%d", fake.probes)
+	}
+
+	// Restart: the container drops out of a listing, so its entry is
+	// forgotten and the marker is probed again once it is back.
+	forgetGoneContainers(nil)
+	fake.exitCode = 1
+	if CheckHealth(ctx, "c1") {
+		t.Error("restarted container reported healthy before its marker exists")
+	}
+	if fake.probes != 3 {
+		t.Errorf("restart should re-probe, got probes=%d", fake.probes)
+	}
+}
+
+func TestForgetGoneContainers(t *testing.T) {
+	now := time.Now()
+	healthyContainersMu.Lock()
+	healthyContainers["gone"] = now
+	healthyContainers["kept"] = now
+	healthyContainersMu.Unlock()
+	t.Cleanup(func() { forgetGoneContainers(nil) })
+
+	forgetGoneContainers([]ContainerInfo{{ID: "kept"}})
+
+	healthyContainersMu.Lock()
+	defer healthyContainersMu.Unlock()
+	if _, ok := healthyContainers["gone"]; ok {
+		t.Error("container missing from the listing should be forgotten")
+	}
+	if _, ok := healthyContainers["kept"]; !ok {
+		t.Error("listed container should stay cached")
+	}
+}
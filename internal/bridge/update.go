@@ -174,6 +174,7 @@ func buildFlatItems(containers []ContainerInfo) []FlatItem {
 func refreshData() tea.Cmd {
 	return func() tea.Msg {
 		containers := listRunningContainers()
+		forgetGoneContainers(containers)
 		// Discover sessions inside each container.
 		ctx, cancel := context.WithTimeout(context.Background(), 4*time.Second)
 		defer cancel()
@@ -29,6 +29,17 @@ var cleanCmd = &cobra.Command{
 		}
 
 		if !yes {
+			// Query disk usage in the background so the daemon round-trip
+			// overlaps with printing the summary instead of delaying it.
+			usageCh := make(chan docker.DiskUsage, 1)
+			go func() {
+				usage, err := docker.GetDiskUsage(ctx)
+				if err != nil {
+					log.Debugf("Disk usage: %v", err)
+				}
+				usageCh <- usage
+			}()
+
 			if deep {
 				log.Yellow("This will remove ALL ccbox resources:")
 				log.Info("  - All ccbox containers (running + stopped)")
@@ -37,9 +48,26 @@ var cleanCmd = &cobra.Command{
 			} else {
 				log.Yellow("This will remove ccbox containers and images.")
 			}
+
+			// Wait for the report before pruning so it reflects the
+			// state being cleaned.
+			if usage := <-usageCh; usage.Total() > 0 {
+				log.Dimf("Disk usage: %.1f MB (containers %.1f MB, images %.1f MB)",
+					float64(usage.Total())/1024/1024,
+					float64(usage.Containers)/1024/1024,
+					float64(usage.Images)/1024/1024)
+			}
 			log.Newline()
 		}
 
+		// Temp files are independent of Docker, so delete them while
+		// containers and images are pruned.
+		var tempDone <-chan int
+		if deep {
+			log.Dim("Removing temp files...")
+			tempDone = cleanTempFiles()
+		}
+
 		log.Dim("Removing containers...")
 		containersRemoved, _ := docker.PruneContainers(ctx)
 
@@ -47,9 +75,8 @@ var cleanCmd = &cobra.Command{
 		imagesRemoved, _ := docker.PruneImages(ctx)
 
 		tempFilesRemoved := 0
-		if deep {
-			log.Dim("Removing temp files...")
-			tempFilesRemoved = cleanTempFiles()
+		if tempDone != nil {
+			tempFilesRemoved = <-tempDone
 		}
 
 		log.Newline()
@@ -84,17 +111,33 @@ func init() {
 	cleanCmd.Flags().BoolP("yes", "y", false, "Skip confirmation prompts")
 }
 
-// cleanTempFiles removes the ccbox temp directory tree.
-// Returns 1 if files were removed, 0 otherwise.
-func cleanTempFiles() int {
+// cleanTempFiles removes the ccbox temp directory tree in the background.
+// The tree is first renamed aside, which is instant and keeps new builds from
+// seeing a half-deleted directory; the slow recursive delete then runs in a
+// goroutine. The returned channel yields 1 if files were removed, 0 otherwise.
+func cleanTempFiles() <-chan int {
+	done := make(chan int, 1)
+
 	tmpDir := filepath.Join(os.TempDir(), "ccbox")
 	info, err := os.Stat(tmpDir)
 	if err != nil || !info.IsDir() {
-		return 0
+		done <- 0
+		return done
 	}
-	if err := os.RemoveAll(tmpDir); err != nil {
-		log.Warnf("Failed to remove temp directory %s: %v", tmpDir, err)
-		return 0
+
+	target := tmpDir
+	trash := fmt.Sprintf("%s-del-%d-%d", tmpDir, os.Getpid(), time.Now().UnixNano())
+	if err := os.Rename(tmpDir, trash); err == nil {
+		target = trash
 	}
-	return 1
+
+	go func() {
+		if err := os.RemoveAll(target); err != nil {
+			log.Warnf("Failed to remove temp directory %s: %v", target, err)
+			done <- 0
+			return
+		}
+		done <- 1
+	}()
+	return done
 }
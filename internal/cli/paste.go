@@ -3,16 +3,13 @@ package cli
 import (
 	"context"
 	"fmt"
-	"os"
-	"os/exec"
-	"path/filepath"
 	"time"
 
 	"github.com/spf13/cobra"
 	"github.com/sungur/ccbox/internal/clipboard"
+	"github.com/sungur/ccbox/internal/config"
 	"github.com/sungur/ccbox/internal/docker"
 	"github.com/sungur/ccbox/internal/log"
-	"github.com/sungur/ccbox/internal/paths"
 )
 
 var pasteCmd = &cobra.Command{
@@ -20,7 +17,7 @@ var pasteCmd = &cobra.Command{
 	Short: "Paste clipboard image into a running container",
 	Long:  "Reads a PNG image from the system clipboard and copies it into a running ccbox container at /tmp/clipboard.png.",
 	RunE: func(cmd *cobra.Command, args []string) error {
-		ctx := context.Background()
+		ctx := cmd.Context()
 		containerName, _ := cmd.Flags().GetString("name")
 
 		if err := docker.EnsureRunning(ctx, 30*time.Second); err != nil {
@@ -37,19 +34,13 @@ var pasteCmd = &cobra.Command{
 			return fmt.Errorf("no image found in clipboard")
 		}
 
-		// Write to temp file.
-		tmpFile := filepath.Join(os.TempDir(), fmt.Sprintf("ccbox-paste-%d.png", time.Now().UnixMilli()))
-		if err := os.WriteFile(tmpFile, imgData, 0644); err != nil {
-			return fmt.Errorf("failed to write temp file: %w", err)
-		}
-		defer os.Remove(tmpFile)
-
-		// Copy to container via docker cp.
-		destPath := "/tmp/clipboard.png"
+		// Copy into the container through the Engine API.
+		destDir, destName := "/tmp", "clipboard.png"
+		destPath := destDir + "/" + destName
 		log.Dim("Copying to container...")
-		cpCmd := exec.CommandContext(ctx, "docker", "cp", tmpFile, containerName+":"+destPath)
-		cpCmd.Env = paths.GetDockerEnv()
-		if err := cpCmd.Run(); err != nil {
+		copyCtx, cancel := context.WithTimeout(ctx, config.DockerCommandTimeout)
+		defer cancel()
+		if err := docker.CopyFile(copyCtx, containerName, destDir, destName, imgData, 0o644); err != nil {
 			return fmt.Errorf("failed to copy to container %s: %w", containerName, err)
 		}
 
@@ -3,6 +3,7 @@ package cli
 import (
 	"context"
 	"fmt"
+	"sort"
 	"strings"
 
 	"github.com/spf13/cobra"
@@ -62,6 +63,10 @@ var rebuildCmd = &cobra.Command{
 					log.Warn("No recognized stacks in installed images. Building base.")
 					stacksToRebuild = []config.LanguageStack{config.StackBase}
 				}
+				// Build parents before the stacks layered on top of them.
+				sort.SliceStable(stacksToRebuild, func(i, j int) bool {
+					return len(config.StackAncestors[stacksToRebuild[i]]) < len(config.StackAncestors[stacksToRebuild[j]])
+				})
 			}
 
 		case stackName != "":
@@ -69,10 +74,8 @@ var rebuildCmd = &cobra.Command{
 			if err != nil {
 				return err
 			}
-			// Also rebuild parent dependency if it has one.
-			if parent := config.StackDependencies[stack]; parent != "" {
-				stacksToRebuild = append(stacksToRebuild, parent)
-			}
+			// Also rebuild every parent dependency, root first.
+			stacksToRebuild = append(stacksToRebuild, config.StackAncestors[stack]...)
 			stacksToRebuild = append(stacksToRebuild, stack)
 
 		default:
@@ -18,13 +18,7 @@ var stacksCmd = &cobra.Command{
 		if filter != "" {
 			stacks = config.FilterStacks(filter)
 		} else {
-			values := config.GetStackValues()
-			for _, v := range values {
-				s, ok := config.ParseStack(v)
-				if ok {
-					stacks = append(stacks, s)
-				}
-			}
+			stacks = config.AllStacks()
 		}
 
 		if len(stacks) == 0 {
@@ -63,7 +57,7 @@ var stacksCmd = &cobra.Command{
 			log.Newline()
 		}
 
-		log.Dim(fmt.Sprintf("%d stack(s) available", len(stacks)))
+		log.Dimf("%d stack(s) available", len(stacks))
 		return nil
 	},
 }
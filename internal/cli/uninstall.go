@@ -1,7 +1,6 @@
 package cli
 
 import (
-	"context"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -25,7 +24,9 @@ var uninstallCmd = &cobra.Command{
 The binary itself cannot be removed automatically.
 Its location will be printed so you can remove it manually.`,
 	RunE: func(cmd *cobra.Command, args []string) error {
-		ctx := context.Background()
+		// Use the command context so Ctrl+C cancels long Docker operations
+		// such as the build cache prune instead of waiting them out.
+		ctx := cmd.Context()
 		yes, _ := cmd.Flags().GetBool("yes")
 
 		if !yes {
@@ -60,13 +61,13 @@ Its location will be printed so you can remove it manually.`,
 		removeConfigDir()
 
 		log.Dim("Removing temp files...")
-		cleanTempFiles()
+		<-cleanTempFiles()
 
 		log.Newline()
 		log.Success("Uninstall complete")
 
 		if exe, err := os.Executable(); err == nil {
-			log.Dim(fmt.Sprintf("To remove the binary: rm %s", exe))
+			log.Dimf("To remove the binary: rm %s", exe)
 		}
 
 		return nil
@@ -21,7 +21,7 @@ var voiceCmd = &cobra.Command{
 			Duration: duration,
 		}
 
-		log.Dim(fmt.Sprintf("Recording for %d seconds (press Ctrl+C to stop early)...", duration))
+		log.Dimf("Recording for %d seconds (press Ctrl+C to stop early)...", duration)
 
 		text, err := voice.Pipeline(opts)
 		if err != nil {
@@ -3,6 +3,7 @@ package config
 
 import (
 	"crypto/rand"
+	"encoding/hex"
 	"fmt"
 	"net/url"
 	"os"
@@ -76,6 +77,7 @@ const (
 	CcboxPrefix = "ccbox"
 
 	// Docker container labels for ccbox resource identification.
+	LabelManaged = "ccbox=true" // key=value set on every ccbox container
 	LabelStack   = "ccbox.stack"
 	LabelProject = "ccbox.project"
 )
@@ -235,19 +237,37 @@ func GetCcboxTempVoice() string {
 
 // --- Container/Image Naming ---
 
-// safeNameRe matches characters not allowed in Docker container names.
-var safeNameRe = regexp.MustCompile(`[^a-z0-9_-]`)
-var multiHyphenRe = regexp.MustCompile(`-{2,}`)
+// sanitizeName lowercases name and replaces every character not allowed in
+// Docker container names with a hyphen, collapsing runs of hyphens, in a
+// single pass.
+func sanitizeName(name string) string {
+	name = strings.ToLower(name)
+	var b strings.Builder
+	b.Grow(len(name))
+	prevHyphen := false
+	for _, r := range name {
+		if (r < 'a' || r > 'z') && (r < '0' || r > '9') && r != '_' {
+			r = '-'
+		}
+		if r == '-' {
+			if prevHyphen {
+				continue
+			}
+			prevHyphen = true
+		} else {
+			prevHyphen = false
+		}
+		b.WriteRune(r)
+	}
+	return b.String()
+}
 
 // GetContainerName generates a Docker container name for a project.
 // If unique is true, a random 6-character suffix is appended.
 func GetContainerName(projectName string, unique bool) string {
 	const maxProjectNameLength = 50
 
-	safeName := strings.ToLower(projectName)
-	safeName = safeNameRe.ReplaceAllString(safeName, "-")
-	safeName = multiHyphenRe.ReplaceAllString(safeName, "-")
-	safeName = strings.Trim(safeName, "-")
+	safeName := strings.Trim(sanitizeName(projectName), "-")
 
 	if len(safeName) > maxProjectNameLength {
 		safeName = safeName[:maxProjectNameLength]
@@ -274,9 +294,5 @@ func GetImageName(stack string) string {
 func randomHex(length int) string {
 	b := make([]byte, (length+1)/2)
 	_, _ = rand.Read(b)
-	hex := fmt.Sprintf("%x", b)
-	if len(hex) > length {
-		hex = hex[:length]
-	}
-	return hex
+	return hex.EncodeToString(b)[:length]
 }
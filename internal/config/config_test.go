@@ -41,6 +41,29 @@ func TestGetContainerNameUnique(t *testing.T) {
 	}
 }
 
+func TestSanitizeName(t *testing.T) {
+	tests := []struct {
+		input string
+		want  string
+	}{
+		{"myproject", "myproject"},
+		{"My Project", "my-project"},
+		{"a  --  b", "a-b"},
+		{"under_score-ok", "under_score-ok"},
+		{"café.app", "caf-app"},
+		{"--x--", "-x-"},
+		{"", ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.input, func(t *testing.T) {
+			if got := sanitizeName(tt.input); got != tt.want {
+				t.Errorf("sanitizeName(%q) = %q, want %q", tt.input, got, tt.want)
+			}
+		})
+	}
+}
+
 func TestGetImageName(t *testing.T) {
 	result := GetImageName("go")
 	if result != "ccbox_go:latest" {
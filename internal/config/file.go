@@ -4,6 +4,7 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"sync"
 
 	"github.com/sungur/ccbox/internal/log"
 	"gopkg.in/yaml.v3"
@@ -47,17 +48,48 @@ func loadProjectConfig(projectPath string) *CcboxConfig {
 	return nil
 }
 
+var (
+	globalConfig     *CcboxConfig
+	globalConfigOnce sync.Once
+)
+
 // loadGlobalConfig loads the global config file.
+// ccbox never writes this file, so it is read at most once per process.
+// Callers get their own copy, so changes to a merged config cannot leak
+// into the cached one through shared pointer or map fields.
 func loadGlobalConfig() *CcboxConfig {
-	path := globalConfigPath()
-	if path == "" {
+	globalConfigOnce.Do(func() {
+		path := globalConfigPath()
+		if path == "" {
+			return
+		}
+		globalConfig = loadConfigFile(path)
+		if globalConfig != nil {
+			log.Debugf("Loaded global config: %s", path)
+		}
+	})
+	return cloneConfig(globalConfig)
+}
+
+// cloneConfig returns a deep copy of cfg, or nil if cfg is nil.
+func cloneConfig(cfg *CcboxConfig) *CcboxConfig {
+	if cfg == nil {
 		return nil
 	}
-	cfg := loadConfigFile(path)
-	if cfg != nil {
-		log.Debugf("Loaded global config: %s", path)
+	c := *cfg
+	for _, p := range []**bool{&c.ZeroResidue, &c.Cache, &c.Prune, &c.Fresh, &c.Headless, &c.Unrestricted, &c.ReadOnly} {
+		if *p != nil {
+			v := **p
+			*p = &v
+		}
+	}
+	if cfg.Env != nil {
+		c.Env = make(map[string]string, len(cfg.Env))
+		for k, v := range cfg.Env {
+			c.Env[k] = v
+		}
 	}
-	return cfg
+	return &c
 }
 
 // loadConfigFile reads and parses a single config file using yaml.v3.
@@ -3,6 +3,7 @@ package config
 import (
 	"os"
 	"path/filepath"
+	"reflect"
 	"testing"
 )
 
@@ -210,6 +211,57 @@ func TestMergeConfigs(t *testing.T) {
 	})
 }
 
+func TestLoadConfigDoesNotAliasGlobalConfig(t *testing.T) {
+	cache := true
+	saved := globalConfig
+	globalConfig = &CcboxConfig{Cache: &cache, Env: map[string]string{"A": "1"}}
+	globalConfigOnce.Do(func() {}) // treat the seeded config as already loaded
+	t.Cleanup(func() { globalConfig = saved })
+
+	cfg := LoadConfig(t.TempDir())
+	*cfg.Cache = false
+	cfg.Env["A"] = "2"
+
+	again := LoadConfig(t.TempDir())
+	if again.Cache == nil || !*again.Cache {
+		t.Error("modifying a loaded config changed the cached global Cache value")
+	}
+	if again.Env["A"] != "1" {
+		t.Errorf("Env[A] = %q after modifying an earlier load, want %q", again.Env["A"], "1")
+	}
+}
+
+// TestCloneConfigSharesNothing fills every reference field of CcboxConfig and
+// checks that cloneConfig copies it, so a field added later cannot be
+// silently aliased between the cached global config and its clones.
+func TestCloneConfigSharesNothing(t *testing.T) {
+	src := &CcboxConfig{}
+	v := reflect.ValueOf(src).Elem()
+	for i := 0; i < v.NumField(); i++ {
+		f := v.Field(i)
+		switch f.Kind() {
+		case reflect.Ptr:
+			f.Set(reflect.New(f.Type().Elem()))
+		case reflect.Map:
+			f.Set(reflect.MakeMap(f.Type()))
+		case reflect.Slice:
+			f.Set(reflect.MakeSlice(f.Type(), 1, 1))
+		case reflect.Interface, reflect.Chan, reflect.Func, reflect.Struct, reflect.Array:
+			t.Fatalf("field %s has kind %s; update cloneConfig and this test", v.Type().Field(i).Name, f.Kind())
+		}
+	}
+
+	cloned := reflect.ValueOf(cloneConfig(src)).Elem()
+	for i := 0; i < v.NumField(); i++ {
+		switch v.Field(i).Kind() {
+		case reflect.Ptr, reflect.Map, reflect.Slice:
+			if cloned.Field(i).Pointer() == v.Field(i).Pointer() {
+				t.Errorf("cloneConfig shares field %s with the original", v.Type().Field(i).Name)
+			}
+		}
+	}
+}
+
 func TestConfigEnvToArray(t *testing.T) {
 	t.Run("nil map", func(t *testing.T) {
 		cfg := CcboxConfig{}
@@ -44,6 +44,20 @@ var allStacks = []LanguageStack{
 	StackData, StackAI, StackMobile, StackGame, StackFullstack,
 }
 
+// knownStacks indexes allStacks for constant-time validation in ParseStack.
+var knownStacks = func() map[LanguageStack]struct{} {
+	m := make(map[LanguageStack]struct{}, len(allStacks))
+	for _, s := range allStacks {
+		m[s] = struct{}{}
+	}
+	return m
+}()
+
+// AllStacks returns every stack in display order.
+func AllStacks() []LanguageStack {
+	return append([]LanguageStack(nil), allStacks...)
+}
+
 // StackInfo holds metadata about a language stack.
 type StackInfo struct {
 	Description string
@@ -99,6 +113,41 @@ var StackDependencies = map[LanguageStack]LanguageStack{
 	StackFullstack:  StackWeb,
 }
 
+// StackAncestors maps each stack to its transitive parent chain, ordered from
+// the root image down to the direct parent (e.g. data -> [base, python]).
+// It is computed once from StackDependencies so callers never re-walk the
+// chain, and stacks sharing a parent reuse its already-resolved chain.
+var StackAncestors = buildStackAncestors()
+
+// buildStackAncestors resolves the transitive closure of StackDependencies,
+// memoizing each stack's chain as it is computed.
+func buildStackAncestors() map[LanguageStack][]LanguageStack {
+	ancestors := make(map[LanguageStack][]LanguageStack, len(StackDependencies))
+
+	var resolve func(stack LanguageStack) []LanguageStack
+	resolve = func(stack LanguageStack) []LanguageStack {
+		if chain, ok := ancestors[stack]; ok {
+			return chain
+		}
+		parent := StackDependencies[stack]
+		if parent == "" {
+			ancestors[stack] = nil
+			return nil
+		}
+		parentChain := resolve(parent)
+		chain := make([]LanguageStack, 0, len(parentChain)+1)
+		chain = append(chain, parentChain...)
+		chain = append(chain, parent)
+		ancestors[stack] = chain
+		return chain
+	}
+
+	for stack := range StackDependencies {
+		resolve(stack)
+	}
+	return ancestors
+}
+
 // stackCategories groups stacks by category for filtering.
 var stackCategories = map[string][]LanguageStack{
 	"core": {
@@ -116,11 +165,9 @@ var stackCategories = map[string][]LanguageStack{
 // ParseStack parses a string into a LanguageStack.
 // Returns the stack and true if valid, or empty string and false if not.
 func ParseStack(value string) (LanguageStack, bool) {
-	normalized := strings.ToLower(value)
-	for _, s := range allStacks {
-		if string(s) == normalized {
-			return s, true
-		}
+	stack := LanguageStack(strings.ToLower(value))
+	if _, ok := knownStacks[stack]; ok {
+		return stack, true
 	}
 	return "", false
 }
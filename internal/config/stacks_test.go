@@ -90,3 +90,32 @@ func TestGetStackValues(t *testing.T) {
 		t.Error("GetStackValues should include 'base'")
 	}
 }
+
+func TestStackAncestors(t *testing.T) {
+	tests := []struct {
+		stack LanguageStack
+		want  []LanguageStack
+	}{
+		{StackBase, nil},
+		{StackGo, nil},
+		{StackPython, []LanguageStack{StackBase}},
+		{StackData, []LanguageStack{StackBase, StackPython}},
+		{StackJVM, []LanguageStack{StackJava}},
+		{StackGame, []LanguageStack{StackBase, StackCpp}},
+	}
+
+	for _, tt := range tests {
+		t.Run(string(tt.stack), func(t *testing.T) {
+			got := StackAncestors[tt.stack]
+			if len(got) != len(tt.want) {
+				t.Fatalf("StackAncestors[%s] = %v, want %v", tt.stack, got, tt.want)
+			}
+			for i := range got {
+				if got[i] != tt.want[i] {
+					t.Errorf("StackAncestors[%s] = %v, want %v", tt.stack, got, tt.want)
+					break
+				}
+			}
+		})
+	}
+}
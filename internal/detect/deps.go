@@ -1,14 +1,18 @@
 package detect
 
 import (
+	"bytes"
 	"crypto/sha256"
 	"encoding/hex"
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"sort"
 	"strings"
+	"sync"
+	"time"
 )
 
 // DepsMode controls dependency installation scope.
@@ -25,6 +29,7 @@ const (
 	PriorityHighest = 10
 	PriorityHigh    = 5
 	PriorityLow     = 3
+	PriorityLowest  = 1
 )
 
 // DepsInfo holds detected dependency information for a project.
@@ -45,7 +50,13 @@ type packageManager struct {
 	installProd string
 	hasDev      bool
 	priority    int
-	detectFn    string
+	detectFn    detectFn
+
+	// literals and suffixes split detect into exact filenames and "*.ext"
+	// globs once at init, so detection never re-parses the patterns.
+	literals []string
+	suffixes []string
+	bit      uint64 // this manager name's bit in managerBits
 }
 
 // allPackageManagers defines all supported package managers with detection rules.
@@ -54,22 +65,22 @@ var allPackageManagers = []packageManager{
 	{name: "uv", detect: []string{"uv.lock"}, installAll: "uv sync --all-extras", installProd: "uv sync --no-dev", hasDev: true, priority: PriorityHighest},
 	{name: "poetry", detect: []string{"poetry.lock"}, installAll: "poetry install", installProd: "poetry install --no-dev", hasDev: true, priority: PriorityHighest},
 	{name: "pdm", detect: []string{"pdm.lock"}, installAll: "pdm install", installProd: "pdm sync --prod", hasDev: true, priority: PriorityHighest},
-	{name: "pdm", detect: []string{"pyproject.toml"}, detectFn: "detectPdmPyproject", priority: PriorityHigh},
+	{name: "pdm", detect: []string{"pyproject.toml"}, detectFn: detectPdmPyproject, priority: PriorityHigh},
 	{name: "pipenv", detect: []string{"Pipfile.lock", "Pipfile"}, installAll: "pipenv install --dev", installProd: "pipenv install", hasDev: true, priority: PriorityHighest},
-	{name: "pip", detect: []string{"pyproject.toml"}, detectFn: "detectPipPyproject", priority: PriorityHigh},
-	{name: "pip", detect: []string{"requirements.txt"}, detectFn: "detectPipRequirements", priority: PriorityHigh},
-	{name: "pip", detect: []string{"setup.py", "setup.cfg"}, detectFn: "detectPipSetup", priority: PriorityHigh},
+	{name: "pip", detect: []string{"pyproject.toml"}, detectFn: detectPipPyproject, priority: PriorityHigh},
+	{name: "pip", detect: []string{"requirements.txt"}, detectFn: detectPipRequirements, priority: PriorityHigh},
+	{name: "pip", detect: []string{"setup.py", "setup.cfg"}, detectFn: detectPipSetup, priority: PriorityHigh},
 	{name: "conda", detect: []string{"environment.yml", "environment.yaml"}, installAll: "conda env update -f environment.yml", installProd: "conda env update -f environment.yml", hasDev: false, priority: PriorityHighest},
 
 	// JavaScript / TypeScript (including Deno)
 	{name: "deno", detect: []string{"deno.lock"}, installAll: "deno install", installProd: "deno install", hasDev: false, priority: PriorityHighest},
 	{name: "deno", detect: []string{"deno.json", "deno.jsonc"}, installAll: "deno install", installProd: "deno install", hasDev: false, priority: PriorityHigh},
 	{name: "bun", detect: []string{"bun.lockb", "bun.lock"}, installAll: "bun install", installProd: "bun install --production", hasDev: true, priority: PriorityHighest},
-	{name: "bun", detect: []string{"bunfig.toml", "package.json"}, detectFn: "detectBun", priority: PriorityHighest},
+	{name: "bun", detect: []string{"bunfig.toml", "package.json"}, detectFn: detectBun, priority: PriorityHighest},
 	{name: "pnpm", detect: []string{"pnpm-lock.yaml"}, installAll: "pnpm install", installProd: "pnpm install --prod", hasDev: true, priority: PriorityHighest},
-	{name: "yarn", detect: []string{"yarn.lock"}, detectFn: "detectYarn", priority: PriorityHighest},
+	{name: "yarn", detect: []string{"yarn.lock"}, detectFn: detectYarn, priority: PriorityHighest},
 	{name: "npm", detect: []string{"package-lock.json"}, installAll: "npm install", installProd: "npm install --production", hasDev: true, priority: PriorityHighest},
-	{name: "node", detect: []string{"package.json"}, detectFn: "detectNodePackageManager", priority: PriorityHigh},
+	{name: "node", detect: []string{"package.json"}, detectFn: detectNodePackageManager, priority: PriorityHigh},
 
 	// Go
 	{name: "go", detect: []string{"go.mod"}, installAll: "go mod download", installProd: "go mod download", hasDev: false, priority: PriorityHigh},
@@ -89,7 +100,7 @@ var allPackageManagers = []packageManager{
 	{name: "composer", detect: []string{"composer.json", "composer.lock"}, installAll: "composer install", installProd: "composer install --no-dev", hasDev: true, priority: PriorityHigh},
 
 	// .NET / C#
-	{name: "dotnet", detect: []string{"*.csproj", "*.fsproj", "*.sln", "packages.config"}, detectFn: "detectDotnet", priority: PriorityHigh},
+	{name: "dotnet", detect: []string{"*.csproj", "*.fsproj", "*.sln", "packages.config"}, detectFn: detectDotnet, priority: PriorityHigh},
 	{name: "nuget", detect: []string{"nuget.config", "packages.config"}, installAll: "nuget restore", installProd: "nuget restore", hasDev: false, priority: PriorityLow},
 
 	// Elixir / Erlang / Gleam (BEAM VM languages)
@@ -99,7 +110,7 @@ var allPackageManagers = []packageManager{
 
 	// Haskell
 	{name: "stack", detect: []string{"stack.yaml"}, installAll: "stack build --only-dependencies", installProd: "stack build --only-dependencies", hasDev: false, priority: PriorityHighest},
-	{name: "cabal", detect: []string{"cabal.project", "*.cabal"}, detectFn: "detectCabal", priority: PriorityHigh},
+	{name: "cabal", detect: []string{"cabal.project", "*.cabal"}, detectFn: detectCabal, priority: PriorityHigh},
 
 	// Swift
 	{name: "swift", detect: []string{"Package.swift"}, installAll: "swift package resolve", installProd: "swift package resolve", hasDev: false, priority: PriorityHigh},
@@ -108,7 +119,7 @@ var allPackageManagers = []packageManager{
 	{name: "pub", detect: []string{"pubspec.yaml"}, installAll: "dart pub get 2>/dev/null || flutter pub get", installProd: "dart pub get 2>/dev/null || flutter pub get", hasDev: false, priority: PriorityHigh},
 
 	// Lua
-	{name: "luarocks", detect: []string{"*.rockspec"}, detectFn: "detectLuarocks", priority: PriorityHigh},
+	{name: "luarocks", detect: []string{"*.rockspec"}, detectFn: detectLuarocks, priority: PriorityHigh},
 
 	// R
 	{name: "renv", detect: []string{"renv.lock"}, installAll: `Rscript -e 'renv::restore()'`, installProd: `Rscript -e 'renv::restore()'`, hasDev: false, priority: PriorityHigh},
@@ -124,10 +135,10 @@ var allPackageManagers = []packageManager{
 	{name: "zig", detect: []string{"build.zig.zon"}, installAll: "zig fetch", installProd: "zig fetch", hasDev: false, priority: PriorityHigh},
 
 	// Nim
-	{name: "nimble", detect: []string{"*.nimble"}, detectFn: "detectNimble", priority: PriorityHigh},
+	{name: "nimble", detect: []string{"*.nimble"}, detectFn: detectNimble, priority: PriorityHigh},
 
 	// OCaml
-	{name: "opam", detect: []string{"*.opam", "dune-project"}, detectFn: "detectOpam", priority: PriorityHigh},
+	{name: "opam", detect: []string{"*.opam", "dune-project"}, detectFn: detectOpam, priority: PriorityHigh},
 
 	// Perl
 	{name: "cpanm", detect: []string{"cpanfile"}, installAll: "cpanm --installdeps .", installProd: "cpanm --installdeps . --without-develop", hasDev: true, priority: PriorityHigh},
@@ -137,99 +148,273 @@ var allPackageManagers = []packageManager{
 	{name: "vcpkg", detect: []string{"vcpkg.json"}, installAll: "vcpkg install", installProd: "vcpkg install", hasDev: false, priority: PriorityHigh},
 
 	// Make-based (generic)
-	{name: "make", detect: []string{"Makefile"}, detectFn: "detectMake", priority: 1},
+	{name: "make", detect: []string{"Makefile"}, detectFn: detectMake, priority: PriorityLowest},
+}
+
+// literalIndex maps each literal detection filename to the indices of the
+// package managers that declare it, and suffixIndex does the same for the
+// extension of each "*.ext" pattern. globManagers lists managers with
+// suffixes that aren't a single extension, which must always be checked.
+// All are built at init so detection only visits managers that can match
+// the directory's actual entries.
+var (
+	literalIndex = make(map[string][]int)
+	suffixIndex  = make(map[string][]int)
+	globManagers []int
+)
+
+// managerBits assigns every manager name a bit, so one detection tracks the
+// names it has already reported in a single uint64 instead of a map.
+var managerBits = make(map[string]uint64)
+
+func init() {
+	// Order the table by priority once so results come out already sorted
+	// in the common case; the stable sort keeps same-priority precedence.
+	sort.SliceStable(allPackageManagers, func(i, j int) bool {
+		return allPackageManagers[i].priority > allPackageManagers[j].priority
+	})
+
+	for i := range allPackageManagers {
+		pm := &allPackageManagers[i]
+		unindexed := false
+		for _, pattern := range pm.detect {
+			if strings.Contains(pattern, "*") {
+				ext := strings.Replace(pattern, "*", "", 1)
+				pm.suffixes = append(pm.suffixes, ext)
+				if strings.LastIndex(ext, ".") == 0 {
+					suffixIndex[ext] = append(suffixIndex[ext], i)
+				} else {
+					unindexed = true
+				}
+			} else {
+				pm.literals = append(pm.literals, pattern)
+				literalIndex[pattern] = append(literalIndex[pattern], i)
+			}
+		}
+		if unindexed {
+			globManagers = append(globManagers, i)
+		}
+
+		if _, ok := managerBits[pm.name]; !ok {
+			if len(managerBits) == 64 {
+				panic("detect: more than 64 package manager names")
+			}
+			managerBits[pm.name] = 1 << len(managerBits)
+		}
+		pm.bit = managerBits[pm.name]
+	}
 }
 
 // detectFn is a custom detection function type.
-type detectFn func(dir string, files []string) *DepsInfo
+type detectFn func(ls *dirListing, files []string) (DepsInfo, bool)
+
+// dirListing is a single read of the project root shared by every detector
+// in one DetectDependencies call, replacing per-file stats and repeated
+// directory scans with in-memory lookups.
+type dirListing struct {
+	dir   string
+	names map[string]bool // every entry, like os.Stat succeeding on it
+	files []string        // non-directory entries, in ReadDir (sorted) order
+	reads map[fileReadKey]fileRead
+}
+
+// fileReadKey identifies a memoized read: a file and the byte limit it was
+// read with (-1 for the whole file).
+type fileReadKey struct {
+	name  string
+	limit int64
+}
+
+// fileRead is a memoized file read result.
+type fileRead struct {
+	data []byte
+	err  error
+}
 
-// readdirGlob returns filenames in dir that end with the given suffix.
-func readdirGlob(dir, ext string) []string {
+// manifestHeadBytes bounds how much of a text manifest (pyproject.toml,
+// Makefile) is scanned for markers. Sections and targets that matter for
+// detection sit near the top; generated files can be far larger.
+const manifestHeadBytes = 64 << 10
+
+// listDir reads dir once. An unreadable directory yields an empty listing.
+func listDir(dir string) *dirListing {
+	ls := &dirListing{dir: dir, names: make(map[string]bool), reads: make(map[fileReadKey]fileRead)}
 	entries, err := os.ReadDir(dir)
 	if err != nil {
-		return nil
+		return ls
 	}
-	var result []string
 	for _, e := range entries {
-		if !e.IsDir() && strings.HasSuffix(e.Name(), ext) {
-			result = append(result, e.Name())
+		name := e.Name()
+		// Keep os.Stat semantics for symlinks: dangling links don't exist.
+		if e.Type()&os.ModeSymlink != 0 {
+			if _, err := os.Stat(filepath.Join(dir, name)); err != nil {
+				continue
+			}
+		}
+		ls.names[name] = true
+		if !e.IsDir() {
+			ls.files = append(ls.files, name)
 		}
 	}
-	return result
+	return ls
 }
 
-func detectPdmPyproject(dir string, files []string) *DepsInfo {
-	pyprojectPath := filepath.Join(dir, "pyproject.toml")
-	if _, err := os.Stat(pyprojectPath); err != nil {
-		return nil
+// has reports whether the directory contains an entry with the given name.
+func (ls *dirListing) has(name string) bool {
+	return ls.names[name]
+}
+
+// read returns the full contents of a file in the directory, reading it at
+// most once per listing; several detectors inspect the same manifest.
+func (ls *dirListing) read(name string) ([]byte, error) {
+	return ls.readLimited(name, -1)
+}
+
+// head returns at most manifestHeadBytes from the start of a file, for
+// marker scans that don't need the whole file.
+func (ls *dirListing) head(name string) ([]byte, error) {
+	return ls.readLimited(name, manifestHeadBytes)
+}
+
+func (ls *dirListing) readLimited(name string, limit int64) ([]byte, error) {
+	key := fileReadKey{name: name, limit: limit}
+	r, ok := ls.reads[key]
+	if !ok {
+		path := filepath.Join(ls.dir, name)
+		if limit < 0 {
+			r.data, r.err = os.ReadFile(path)
+		} else {
+			r.data, r.err = readFileHead(path, limit)
+		}
+		ls.reads[key] = r
+	}
+	return r.data, r.err
+}
+
+// readFileHead reads up to limit bytes from the start of path.
+func readFileHead(path string, limit int64) ([]byte, error) {
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, err
+	}
+	defer f.Close()
+	return io.ReadAll(io.LimitReader(f, limit))
+}
+
+// withSuffix returns the non-directory entries ending with ext.
+func (ls *dirListing) withSuffix(ext string) []string {
+	return ls.withSuffixes(ext)[0]
+}
+
+// hasSuffix reports whether any non-directory entry ends with one of exts,
+// stopping at the first match.
+func (ls *dirListing) hasSuffix(exts ...string) bool {
+	for _, name := range ls.files {
+		for _, ext := range exts {
+			if strings.HasSuffix(name, ext) {
+				return true
+			}
+		}
+	}
+	return false
+}
+
+// withSuffixes buckets the non-directory entries by suffix in a single pass
+// over the listing; bucket i holds the entries ending with exts[i].
+func (ls *dirListing) withSuffixes(exts ...string) [][]string {
+	buckets := make([][]string, len(exts))
+	for _, name := range ls.files {
+		for i, ext := range exts {
+			if strings.HasSuffix(name, ext) {
+				buckets[i] = append(buckets[i], name)
+			}
+		}
+	}
+	return buckets
+}
+
+// Install commands for the pip detectors. They are fixed strings, so they
+// live here as constants rather than being assembled on every detection.
+const (
+	pipRequirementsInstall = "pip install --break-system-packages -r requirements.txt"
+
+	pipPyprojectInstallAll = `python3 -c "` +
+		`import tomllib as T,subprocess as S,sys;` +
+		`d=T.load(open('pyproject.toml','rb')).get('project',{});` +
+		`o=d.get('optional-dependencies',{});` +
+		`a=d.get('dependencies',[])+o.get('dev',[])+o.get('test',[]);` +
+		`S.run([sys.executable,'-m','pip','install','--break-system-packages']+a,check=1)if a else 0` +
+		`"`
+
+	pipPyprojectInstallProd = `python3 -c "` +
+		`import tomllib as T,subprocess as S,sys;` +
+		`d=T.load(open('pyproject.toml','rb')).get('project',{}).get('dependencies',[]);` +
+		`S.run([sys.executable,'-m','pip','install','--break-system-packages']+d,check=1)if d else 0` +
+		`"`
+
+	pipSetupInstall = `python3 -c "` +
+		`import subprocess as S,sys,glob as G;` +
+		`S.run([sys.executable,'setup.py','egg_info'],capture_output=1);` +
+		`r=G.glob('*.egg-info/requires.txt');` +
+		`d=[l.strip()for l in open(r[0])if l.strip()and not l.startswith('[')]if r else[];` +
+		`S.run([sys.executable,'-m','pip','install','--break-system-packages']+d,check=1)if d else 0` +
+		`"`
+)
+
+func detectPdmPyproject(ls *dirListing, files []string) (DepsInfo, bool) {
+	if !ls.has("pyproject.toml") {
+		return DepsInfo{}, false
 	}
 	// Skip if lock file already detected
-	if fileExists(filepath.Join(dir, "pdm.lock")) {
-		return nil
+	if ls.has("pdm.lock") {
+		return DepsInfo{}, false
 	}
-	if fileExists(filepath.Join(dir, "poetry.lock")) || fileExists(filepath.Join(dir, "uv.lock")) {
-		return nil
+	if ls.has("poetry.lock") || ls.has("uv.lock") {
+		return DepsInfo{}, false
 	}
 
-	content, err := os.ReadFile(pyprojectPath)
+	content, err := ls.head("pyproject.toml")
 	if err != nil {
-		return nil
+		return DepsInfo{}, false
 	}
-	if !strings.Contains(string(content), "[tool.pdm]") {
-		return nil
+	if !bytes.Contains(content, []byte("[tool.pdm]")) {
+		return DepsInfo{}, false
 	}
 
-	return &DepsInfo{Name: "pdm", Files: files, InstallAll: "pdm install", InstallProd: "pdm sync --prod", HasDev: true, Priority: PriorityHigh}
+	return DepsInfo{Name: "pdm", Files: files, InstallAll: "pdm install", InstallProd: "pdm sync --prod", HasDev: true, Priority: PriorityHigh}, true
 }
 
-func detectPipPyproject(dir string, files []string) *DepsInfo {
-	pyprojectPath := filepath.Join(dir, "pyproject.toml")
-	if _, err := os.Stat(pyprojectPath); err != nil {
-		return nil
+func detectPipPyproject(ls *dirListing, files []string) (DepsInfo, bool) {
+	if !ls.has("pyproject.toml") {
+		return DepsInfo{}, false
 	}
-	if fileExists(filepath.Join(dir, "poetry.lock")) || fileExists(filepath.Join(dir, "uv.lock")) || fileExists(filepath.Join(dir, "pdm.lock")) {
-		return nil
+	if ls.has("poetry.lock") || ls.has("uv.lock") || ls.has("pdm.lock") {
+		return DepsInfo{}, false
 	}
 
-	data, err := os.ReadFile(pyprojectPath)
+	content, err := ls.head("pyproject.toml")
 	if err != nil {
-		return nil
+		return DepsInfo{}, false
 	}
-	content := string(data)
-	if strings.Contains(content, "[tool.pdm]") {
-		return nil
+	if bytes.Contains(content, []byte("[tool.pdm]")) {
+		return DepsInfo{}, false
 	}
 
 	hasDev := false
 	devMarkers := []string{"optional-dependencies", "[project.optional-dependencies]", "dev =", "test ="}
 	for _, m := range devMarkers {
-		if strings.Contains(content, m) {
+		if bytes.Contains(content, []byte(m)) {
 			hasDev = true
 			break
 		}
 	}
 
-	installAll := `python3 -c "` +
-		`import tomllib as T,subprocess as S,sys;` +
-		`d=T.load(open('pyproject.toml','rb')).get('project',{});` +
-		`o=d.get('optional-dependencies',{});` +
-		`a=d.get('dependencies',[])+o.get('dev',[])+o.get('test',[]);` +
-		`S.run([sys.executable,'-m','pip','install','--break-system-packages']+a,check=1)if a else 0` +
-		`"`
-
-	installProd := `python3 -c "` +
-		`import tomllib as T,subprocess as S,sys;` +
-		`d=T.load(open('pyproject.toml','rb')).get('project',{}).get('dependencies',[]);` +
-		`S.run([sys.executable,'-m','pip','install','--break-system-packages']+d,check=1)if d else 0` +
-		`"`
-
-	return &DepsInfo{Name: "pip", Files: files, InstallAll: installAll, InstallProd: installProd, HasDev: hasDev, Priority: PriorityHigh}
+	return DepsInfo{Name: "pip", Files: files, InstallAll: pipPyprojectInstallAll, InstallProd: pipPyprojectInstallProd, HasDev: hasDev, Priority: PriorityHigh}, true
 }
 
-func detectPipRequirements(dir string, files []string) *DepsInfo {
-	reqPath := filepath.Join(dir, "requirements.txt")
-	if _, err := os.Stat(reqPath); err != nil {
-		return nil
+func detectPipRequirements(ls *dirListing, files []string) (DepsInfo, bool) {
+	if !ls.has("requirements.txt") {
+		return DepsInfo{}, false
 	}
 
 	devFileNames := []string{
@@ -242,210 +427,187 @@ func detectPipRequirements(dir string, files []string) *DepsInfo {
 	}
 	var foundDev []string
 	for _, f := range devFileNames {
-		if fileExists(filepath.Join(dir, f)) {
+		if ls.has(f) {
 			foundDev = append(foundDev, f)
 		}
 	}
 
-	pipBase := "pip install --break-system-packages"
-
 	if len(foundDev) > 0 {
-		allFiles := append([]string{"requirements.txt"}, foundDev...)
-		var rArgs []string
-		for _, f := range allFiles {
-			rArgs = append(rArgs, "-r "+f)
-		}
-		devInstall := strings.Join(rArgs, " ")
+		installAll := pipRequirementsInstall + " -r " + strings.Join(foundDev, " -r ")
 
 		combinedFiles := append(append([]string{}, files...), foundDev...)
-		return &DepsInfo{
+		return DepsInfo{
 			Name:        "pip",
 			Files:       combinedFiles,
-			InstallAll:  fmt.Sprintf("%s %s", pipBase, devInstall),
-			InstallProd: fmt.Sprintf("%s -r requirements.txt", pipBase),
+			InstallAll:  installAll,
+			InstallProd: pipRequirementsInstall,
 			HasDev:      true,
 			Priority:    PriorityHigh,
-		}
+		}, true
 	}
 
-	return &DepsInfo{
+	return DepsInfo{
 		Name:        "pip",
 		Files:       files,
-		InstallAll:  fmt.Sprintf("%s -r requirements.txt", pipBase),
-		InstallProd: fmt.Sprintf("%s -r requirements.txt", pipBase),
+		InstallAll:  pipRequirementsInstall,
+		InstallProd: pipRequirementsInstall,
 		HasDev:      false,
 		Priority:    PriorityHigh,
-	}
+	}, true
 }
 
-func detectPipSetup(dir string, files []string) *DepsInfo {
-	setupPy := filepath.Join(dir, "setup.py")
-	setupCfg := filepath.Join(dir, "setup.cfg")
-
-	if !fileExists(setupPy) && !fileExists(setupCfg) {
-		return nil
+func detectPipSetup(ls *dirListing, files []string) (DepsInfo, bool) {
+	if !ls.has("setup.py") && !ls.has("setup.cfg") {
+		return DepsInfo{}, false
 	}
-	if fileExists(filepath.Join(dir, "pyproject.toml")) {
-		return nil
+	if ls.has("pyproject.toml") {
+		return DepsInfo{}, false
 	}
 
-	installScript := `python3 -c "` +
-		`import subprocess as S,sys,glob as G;` +
-		`S.run([sys.executable,'setup.py','egg_info'],capture_output=1);` +
-		`r=G.glob('*.egg-info/requires.txt');` +
-		`d=[l.strip()for l in open(r[0])if l.strip()and not l.startswith('[')]if r else[];` +
-		`S.run([sys.executable,'-m','pip','install','--break-system-packages']+d,check=1)if d else 0` +
-		`"`
-
-	return &DepsInfo{Name: "pip", Files: files, InstallAll: installScript, InstallProd: installScript, HasDev: false, Priority: PriorityHigh}
+	return DepsInfo{Name: "pip", Files: files, InstallAll: pipSetupInstall, InstallProd: pipSetupInstall, HasDev: false, Priority: PriorityHigh}, true
 }
 
-func detectDotnet(dir string, _ []string) *DepsInfo {
-	csproj := readdirGlob(dir, ".csproj")
-	fsproj := readdirGlob(dir, ".fsproj")
-	sln := readdirGlob(dir, ".sln")
+func detectDotnet(ls *dirListing, _ []string) (DepsInfo, bool) {
+	projects := ls.withSuffixes(".csproj", ".fsproj", ".sln")
 
-	if len(csproj) > 0 || len(fsproj) > 0 || len(sln) > 0 {
-		var allFiles []string
-		allFiles = append(allFiles, csproj...)
-		allFiles = append(allFiles, fsproj...)
-		allFiles = append(allFiles, sln...)
-		return &DepsInfo{Name: "dotnet", Files: allFiles, InstallAll: "dotnet restore", InstallProd: "dotnet restore", HasDev: false, Priority: PriorityHigh}
+	var allFiles []string
+	for _, bucket := range projects {
+		allFiles = append(allFiles, bucket...)
+	}
+	if len(allFiles) > 0 {
+		return DepsInfo{Name: "dotnet", Files: allFiles, InstallAll: "dotnet restore", InstallProd: "dotnet restore", HasDev: false, Priority: PriorityHigh}, true
 	}
-	return nil
+	return DepsInfo{}, false
 }
 
-func detectCabal(dir string, _ []string) *DepsInfo {
-	cabalFiles := readdirGlob(dir, ".cabal")
-	cabalProject := fileExists(filepath.Join(dir, "cabal.project"))
+func detectCabal(ls *dirListing, _ []string) (DepsInfo, bool) {
+	cabalFiles := ls.withSuffix(".cabal")
+	cabalProject := ls.has("cabal.project")
 
 	if len(cabalFiles) > 0 || cabalProject {
 		files := append([]string{}, cabalFiles...)
 		if cabalProject {
 			files = append(files, "cabal.project")
 		}
-		return &DepsInfo{
+		return DepsInfo{
 			Name:        "cabal",
 			Files:       files,
 			InstallAll:  "cabal update && cabal build --only-dependencies",
 			InstallProd: "cabal update && cabal build --only-dependencies",
 			HasDev:      false,
 			Priority:    PriorityHigh,
-		}
+		}, true
 	}
-	return nil
+	return DepsInfo{}, false
 }
 
-func detectLuarocks(dir string, _ []string) *DepsInfo {
-	rockspecs := readdirGlob(dir, ".rockspec")
+func detectLuarocks(ls *dirListing, _ []string) (DepsInfo, bool) {
+	rockspecs := ls.withSuffix(".rockspec")
 	if len(rockspecs) > 0 {
-		return &DepsInfo{
+		return DepsInfo{
 			Name:        "luarocks",
 			Files:       rockspecs,
 			InstallAll:  "luarocks install --only-deps *.rockspec",
 			InstallProd: "luarocks install --only-deps *.rockspec",
 			HasDev:      false,
 			Priority:    PriorityHigh,
-		}
+		}, true
 	}
-	return nil
+	return DepsInfo{}, false
 }
 
-func detectNimble(dir string, _ []string) *DepsInfo {
-	nimbleFiles := readdirGlob(dir, ".nimble")
+func detectNimble(ls *dirListing, _ []string) (DepsInfo, bool) {
+	nimbleFiles := ls.withSuffix(".nimble")
 	if len(nimbleFiles) > 0 {
-		return &DepsInfo{Name: "nimble", Files: nimbleFiles, InstallAll: "nimble install -d", InstallProd: "nimble install -d", HasDev: false, Priority: PriorityHigh}
+		return DepsInfo{Name: "nimble", Files: nimbleFiles, InstallAll: "nimble install -d", InstallProd: "nimble install -d", HasDev: false, Priority: PriorityHigh}, true
 	}
-	return nil
+	return DepsInfo{}, false
 }
 
-func detectOpam(dir string, _ []string) *DepsInfo {
-	opamFiles := readdirGlob(dir, ".opam")
-	duneProject := fileExists(filepath.Join(dir, "dune-project"))
+func detectOpam(ls *dirListing, _ []string) (DepsInfo, bool) {
+	opamFiles := ls.withSuffix(".opam")
+	duneProject := ls.has("dune-project")
 
 	if len(opamFiles) > 0 || duneProject {
 		files := append([]string{}, opamFiles...)
 		if duneProject {
 			files = append(files, "dune-project")
 		}
-		return &DepsInfo{
+		return DepsInfo{
 			Name:        "opam",
 			Files:       files,
 			InstallAll:  "opam install . --deps-only -y",
 			InstallProd: "opam install . --deps-only -y",
 			HasDev:      false,
 			Priority:    PriorityHigh,
-		}
+		}, true
 	}
-	return nil
+	return DepsInfo{}, false
 }
 
-func detectBun(dir string, files []string) *DepsInfo {
-	if fileExists(filepath.Join(dir, "bunfig.toml")) {
-		return &DepsInfo{Name: "bun", Files: files, InstallAll: "bun install", InstallProd: "bun install --production", HasDev: true, Priority: PriorityHighest}
+func detectBun(ls *dirListing, files []string) (DepsInfo, bool) {
+	if ls.has("bunfig.toml") {
+		return DepsInfo{Name: "bun", Files: files, InstallAll: "bun install", InstallProd: "bun install --production", HasDev: true, Priority: PriorityHighest}, true
 	}
 
-	packageJSONPath := filepath.Join(dir, "package.json")
-	data, err := os.ReadFile(packageJSONPath)
+	data, err := ls.read("package.json")
 	if err != nil {
-		return nil
+		return DepsInfo{}, false
 	}
 
 	var pkg struct {
 		PackageManager string `json:"packageManager"`
 	}
 	if err := json.Unmarshal(data, &pkg); err != nil {
-		return nil
+		return DepsInfo{}, false
 	}
 	if pkg.PackageManager == "bun" || strings.HasPrefix(pkg.PackageManager, "bun@") {
-		return &DepsInfo{Name: "bun", Files: files, InstallAll: "bun install", InstallProd: "bun install --production", HasDev: true, Priority: PriorityHighest}
+		return DepsInfo{Name: "bun", Files: files, InstallAll: "bun install", InstallProd: "bun install --production", HasDev: true, Priority: PriorityHighest}, true
 	}
 
-	return nil
+	return DepsInfo{}, false
 }
 
-func detectYarn(dir string, files []string) *DepsInfo {
-	lockPath := filepath.Join(dir, "yarn.lock")
-	if !fileExists(lockPath) {
-		return nil
+func detectYarn(ls *dirListing, files []string) (DepsInfo, bool) {
+	if !ls.has("yarn.lock") {
+		return DepsInfo{}, false
 	}
 
-	content := readHead(lockPath, 500)
+	content := readHead(ls, "yarn.lock", 500)
 	isYarnBerry := strings.Contains(content, "__metadata:") || strings.Contains(content, "cacheKey:")
 
 	if isYarnBerry {
-		return &DepsInfo{Name: "yarn", Files: files, InstallAll: "yarn install", InstallProd: "yarn install", HasDev: true, Priority: PriorityHighest}
+		return DepsInfo{Name: "yarn", Files: files, InstallAll: "yarn install", InstallProd: "yarn install", HasDev: true, Priority: PriorityHighest}, true
 	}
 
-	return &DepsInfo{Name: "yarn", Files: files, InstallAll: "yarn install", InstallProd: "yarn install --production", HasDev: true, Priority: PriorityHighest}
+	return DepsInfo{Name: "yarn", Files: files, InstallAll: "yarn install", InstallProd: "yarn install --production", HasDev: true, Priority: PriorityHighest}, true
 }
 
-func detectNodePackageManager(dir string, files []string) *DepsInfo {
-	packageJSONPath := filepath.Join(dir, "package.json")
-	if !fileExists(packageJSONPath) {
-		return nil
+func detectNodePackageManager(ls *dirListing, files []string) (DepsInfo, bool) {
+	if !ls.has("package.json") {
+		return DepsInfo{}, false
 	}
 
 	lockFiles := []string{"bun.lockb", "bun.lock", "pnpm-lock.yaml", "yarn.lock", "package-lock.json"}
 	for _, f := range lockFiles {
-		if fileExists(filepath.Join(dir, f)) {
-			return nil
+		if ls.has(f) {
+			return DepsInfo{}, false
 		}
 	}
-	if fileExists(filepath.Join(dir, "bunfig.toml")) {
-		return nil
+	if ls.has("bunfig.toml") {
+		return DepsInfo{}, false
 	}
 
-	data, err := os.ReadFile(packageJSONPath)
+	data, err := ls.read("package.json")
 	if err != nil {
-		return &DepsInfo{Name: "npm", Files: files, InstallAll: "npm install", InstallProd: "npm install --production", HasDev: true, Priority: PriorityLow}
+		return DepsInfo{Name: "npm", Files: files, InstallAll: "npm install", InstallProd: "npm install --production", HasDev: true, Priority: PriorityLow}, true
 	}
 
 	var pkg struct {
 		PackageManager string `json:"packageManager"`
 	}
 	if err := json.Unmarshal(data, &pkg); err != nil {
-		return &DepsInfo{Name: "npm", Files: files, InstallAll: "npm install", InstallProd: "npm install --production", HasDev: true, Priority: PriorityLow}
+		return DepsInfo{Name: "npm", Files: files, InstallAll: "npm install", InstallProd: "npm install --production", HasDev: true, Priority: PriorityLow}, true
 	}
 
 	if pkg.PackageManager != "" {
@@ -463,98 +625,200 @@ func detectNodePackageManager(dir string, files []string) *DepsInfo {
 		}
 		for prefix, info := range managers {
 			if pm == prefix || strings.HasPrefix(pm, prefix+"@") {
-				return &DepsInfo{Name: info.name, Files: files, InstallAll: info.installAll, InstallProd: info.installProd, HasDev: true, Priority: PriorityHigh}
+				return DepsInfo{Name: info.name, Files: files, InstallAll: info.installAll, InstallProd: info.installProd, HasDev: true, Priority: PriorityHigh}, true
 			}
 		}
 	}
 
-	return &DepsInfo{Name: "npm", Files: files, InstallAll: "npm install", InstallProd: "npm install --production", HasDev: true, Priority: PriorityLow}
+	return DepsInfo{Name: "npm", Files: files, InstallAll: "npm install", InstallProd: "npm install --production", HasDev: true, Priority: PriorityLow}, true
 }
 
-func detectMake(dir string, files []string) *DepsInfo {
-	makefilePath := filepath.Join(dir, "Makefile")
-	data, err := os.ReadFile(makefilePath)
+func detectMake(ls *dirListing, files []string) (DepsInfo, bool) {
+	content, err := ls.head("Makefile")
 	if err != nil {
-		return nil
+		return DepsInfo{}, false
 	}
 
-	content := string(data)
 	targets := []string{"deps", "dependencies", "install", "setup"}
 	for _, target := range targets {
-		if strings.Contains(content, target+":") {
-			return &DepsInfo{Name: "make", Files: files, InstallAll: "make " + target, InstallProd: "make " + target, HasDev: false, Priority: 1}
+		if bytes.Contains(content, []byte(target+":")) {
+			return DepsInfo{Name: "make", Files: files, InstallAll: "make " + target, InstallProd: "make " + target, HasDev: false, Priority: PriorityLowest}, true
 		}
 	}
-	return nil
+	return DepsInfo{}, false
 }
 
-// detectFunctions maps function name strings to actual Go functions.
-var detectFunctions = map[string]detectFn{
-	"detectPdmPyproject":       detectPdmPyproject,
-	"detectPipPyproject":       detectPipPyproject,
-	"detectPipRequirements":    detectPipRequirements,
-	"detectPipSetup":           detectPipSetup,
-	"detectDotnet":             detectDotnet,
-	"detectCabal":              detectCabal,
-	"detectLuarocks":           detectLuarocks,
-	"detectNimble":             detectNimble,
-	"detectOpam":               detectOpam,
-	"detectBun":                detectBun,
-	"detectYarn":               detectYarn,
-	"detectNodePackageManager": detectNodePackageManager,
-	"detectMake":               detectMake,
+// anyDetectMatch reports whether any of the manager's detection patterns
+// matches, without collecting the matching names.
+func anyDetectMatch(ls *dirListing, pm *packageManager) bool {
+	for _, name := range pm.literals {
+		if ls.has(name) {
+			return true
+		}
+	}
+	return len(pm.suffixes) > 0 && ls.hasSuffix(pm.suffixes...)
 }
 
-// fileExists returns true if the path exists and is accessible.
-func fileExists(path string) bool {
-	_, err := os.Stat(path)
-	return err == nil
+// matchDetectPatterns returns the directory entries matching the manager's
+// detection patterns.
+func matchDetectPatterns(ls *dirListing, pm *packageManager) []string {
+	var matched []string
+	for _, name := range pm.literals {
+		if ls.has(name) {
+			matched = append(matched, name)
+		}
+	}
+	if len(pm.suffixes) > 0 {
+		for _, bucket := range ls.withSuffixes(pm.suffixes...) {
+			matched = append(matched, bucket...)
+		}
+	}
+	return matched
+}
+
+// depsContentFiles are the files whose contents, not just presence, feed
+// into detection, so their mtimes are part of the cache key.
+var depsContentFiles = []string{"pyproject.toml", "package.json", "yarn.lock", "Makefile"}
+
+type depsCacheEntry struct {
+	key  string
+	deps []DepsInfo
 }
 
-// matchesDetectPattern checks if directory contains a file matching the pattern.
-// Returns the list of matched filenames.
-func matchesDetectPattern(dir, pattern string) []string {
-	if strings.Contains(pattern, "*") {
-		ext := strings.Replace(pattern, "*", "", 1)
-		return readdirGlob(dir, ext)
+var (
+	depsCacheMu sync.Mutex
+	depsCache   = make(map[string]depsCacheEntry)
+)
+
+// dirCacheMaxEntries bounds each per-directory cache; when a new directory
+// would exceed it the cache is cleared. A CLI run sees one or two projects,
+// so the bound only matters for long-running callers.
+const dirCacheMaxEntries = 64
+
+// racyWindow is how recent an mtime can be before it is not trusted as a
+// fingerprint: a file rewritten within the same timestamp tick keeps its
+// mtime. Like git's "racily clean" index entries, such directories are
+// rescanned until the timestamps age past the filesystem's granularity.
+const racyWindow = 2 * time.Second
+
+// dirCacheKey fingerprints everything a detection over dir depends on: the
+// root's mtime and size (which change when entries are added, removed or
+// renamed) and the mtime and size of each content-sensitive file. It
+// reports false when dir can't be stat'ed, and returns an empty key when a
+// fingerprinted mtime is too recent to trust, so the result isn't cached.
+func dirCacheKey(dir string, contentFiles []string) (string, bool) {
+	info, err := os.Stat(dir)
+	if err != nil {
+		return "", false
+	}
+	racy := time.Since(info.ModTime()) < racyWindow
+	var b strings.Builder
+	fmt.Fprintf(&b, "%d:%d", info.ModTime().UnixNano(), info.Size())
+	for _, name := range contentFiles {
+		if fi, err := os.Stat(filepath.Join(dir, name)); err == nil {
+			racy = racy || time.Since(fi.ModTime()) < racyWindow
+			fmt.Fprintf(&b, "|%s:%d:%d", name, fi.ModTime().UnixNano(), fi.Size())
+		}
 	}
-	if fileExists(filepath.Join(dir, pattern)) {
-		return []string{pattern}
+	if racy {
+		return "", true
 	}
-	return nil
+	return b.String(), true
+}
+
+// cloneDeps copies deps so callers can't mutate a cached result.
+func cloneDeps(deps []DepsInfo) []DepsInfo {
+	if deps == nil {
+		return nil
+	}
+	out := make([]DepsInfo, len(deps))
+	for i, d := range deps {
+		d.Files = append([]string(nil), d.Files...)
+		out[i] = d
+	}
+	return out
 }
 
 // DetectDependencies detects all dependency managers in a project.
 // A project may have multiple dependency files (e.g., Python + Node for fullstack).
 // Managers are returned sorted by priority (highest first).
+// Results are memoized per directory until its contents change.
 func DetectDependencies(dir string) []DepsInfo {
+	key, _ := dirCacheKey(dir, depsContentFiles)
+	if key != "" {
+		depsCacheMu.Lock()
+		entry, hit := depsCache[dir]
+		depsCacheMu.Unlock()
+		if hit && entry.key == key {
+			return cloneDeps(entry.deps)
+		}
+	}
+
+	deps := detectDependencies(dir)
+	if key != "" {
+		depsCacheMu.Lock()
+		if _, ok := depsCache[dir]; !ok && len(depsCache) >= dirCacheMaxEntries {
+			depsCache = make(map[string]depsCacheEntry)
+		}
+		depsCache[dir] = depsCacheEntry{key: key, deps: cloneDeps(deps)}
+		depsCacheMu.Unlock()
+	}
+	return deps
+}
+
+// detectDependencies runs detection against the filesystem.
+func detectDependencies(dir string) []DepsInfo {
+	ls := listDir(dir)
 	var results []DepsInfo
-	detectedManagers := make(map[string]bool)
+	var detected uint64 // managerBits of the names reported so far
+
+	// Mark the managers reachable from the directory's entries; iterating
+	// the marks in table order keeps the original precedence.
+	candidates := make([]bool, len(allPackageManagers))
+	for name := range ls.names {
+		for _, i := range literalIndex[name] {
+			candidates[i] = true
+		}
+	}
+	for _, name := range ls.files {
+		for _, i := range suffixIndex[filepath.Ext(name)] {
+			candidates[i] = true
+		}
+	}
+	for _, i := range globManagers {
+		candidates[i] = true
+	}
 
-	for _, pm := range allPackageManagers {
-		var matchedFiles []string
-		for _, pattern := range pm.detect {
-			matchedFiles = append(matchedFiles, matchesDetectPattern(dir, pattern)...)
+	for i := range allPackageManagers {
+		if !candidates[i] {
+			continue
 		}
+		pm := &allPackageManagers[i]
 
-		if len(matchedFiles) == 0 {
+		// A static manager whose name is already taken can only be skipped,
+		// so don't probe the filesystem for it.
+		if pm.detectFn == nil && detected&pm.bit != 0 {
 			continue
 		}
 
-		if pm.detectFn != "" {
-			fn, ok := detectFunctions[pm.detectFn]
-			if !ok {
+		// Glob-based detectors collect their own files, so for them the
+		// patterns only gate the call and the first match is enough.
+		var matchedFiles []string
+		if pm.detectFn != nil && len(pm.suffixes) > 0 {
+			if !anyDetectMatch(ls, pm) {
 				continue
 			}
-			result := fn(dir, matchedFiles)
-			if result != nil && !detectedManagers[result.Name] {
-				results = append(results, *result)
-				detectedManagers[result.Name] = true
-			}
+		} else if matchedFiles = matchDetectPatterns(ls, pm); len(matchedFiles) == 0 {
 			continue
 		}
 
-		if detectedManagers[pm.name] {
+		if pm.detectFn != nil {
+			result, ok := pm.detectFn(ls, matchedFiles)
+			// Detectors only report names from the table, which all have a bit.
+			if bit := managerBits[result.Name]; ok && detected&bit == 0 {
+				results = append(results, result)
+				detected |= bit
+			}
 			continue
 		}
 
@@ -566,12 +830,17 @@ func DetectDependencies(dir string) []DepsInfo {
 			HasDev:      pm.hasDev,
 			Priority:    pm.priority,
 		})
-		detectedManagers[pm.name] = true
+		detected |= pm.bit
 	}
 
-	sort.Slice(results, func(i, j int) bool {
+	// Custom detectors may report a priority other than their table entry
+	// (e.g. the npm fallback), so only those results can be out of order.
+	byPriority := func(i, j int) bool {
 		return results[i].Priority > results[j].Priority
-	})
+	}
+	if !sort.SliceIsSorted(results, byPriority) {
+		sort.SliceStable(results, byPriority)
+	}
 	return results
 }
 
@@ -581,12 +850,18 @@ func GetInstallCommands(deps []DepsInfo, mode DepsMode) []string {
 		return nil
 	}
 
-	var cmds []string
-	for _, d := range deps {
-		if mode == DepsModeAll {
-			cmds = append(cmds, d.InstallAll)
-		} else {
-			cmds = append(cmds, d.InstallProd)
+	if len(deps) == 0 {
+		return nil
+	}
+
+	cmds := make([]string, len(deps))
+	if mode == DepsModeAll {
+		for i, d := range deps {
+			cmds[i] = d.InstallAll
+		}
+	} else {
+		for i, d := range deps {
+			cmds[i] = d.InstallProd
 		}
 	}
 	return cmds
@@ -3,7 +3,9 @@ package detect
 import (
 	"os"
 	"path/filepath"
+	"strconv"
 	"testing"
+	"time"
 )
 
 func TestDetectDependencies(t *testing.T) {
@@ -66,6 +68,90 @@ func TestDetectDependencies(t *testing.T) {
 	}
 }
 
+func TestDetectDependenciesCache(t *testing.T) {
+	dir := t.TempDir()
+	if err := os.WriteFile(filepath.Join(dir, "go.mod"), []byte("module foo\n"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+
+	backdate(t, dir, filepath.Join(dir, "go.mod"))
+
+	first := DetectDependencies(dir)
+	if len(first) != 1 || first[0].Name != "go" {
+		t.Fatalf("unexpected deps: %v", first)
+	}
+	depsCacheMu.Lock()
+	_, cached := depsCache[dir]
+	depsCacheMu.Unlock()
+	if !cached {
+		t.Fatal("expected result to be cached")
+	}
+
+	// Mutating a returned result must not leak into the cache.
+	first[0].Files[0] = "mutated"
+	if again := DetectDependencies(dir); again[0].Files[0] != "go.mod" {
+		t.Errorf("cached result was mutated: %v", again)
+	}
+
+	// Adding a file changes the directory and invalidates the entry.
+	if err := os.WriteFile(filepath.Join(dir, "Cargo.toml"), []byte("[package]\n"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+	if got := DetectDependencies(dir); len(got) != 2 {
+		t.Errorf("expected cache invalidation after adding Cargo.toml, got %v", got)
+	}
+}
+
+func TestDetectDependenciesCacheSkipsRacyDirs(t *testing.T) {
+	dir := t.TempDir()
+	if err := os.WriteFile(filepath.Join(dir, "package.json"), []byte("{}"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+
+	// Just written: a same-tick rewrite would keep the mtime, so the
+	// fingerprint can't be trusted yet.
+	DetectDependencies(dir)
+	depsCacheMu.Lock()
+	_, cached := depsCache[dir]
+	depsCacheMu.Unlock()
+	if cached {
+		t.Error("result for a just-modified directory should not be cached")
+	}
+}
+
+func TestDetectDependenciesCacheBounded(t *testing.T) {
+	depsCacheMu.Lock()
+	for i := 0; i < dirCacheMaxEntries; i++ {
+		depsCache["/fake/"+strconv.Itoa(i)] = depsCacheEntry{}
+	}
+	depsCacheMu.Unlock()
+
+	dir := t.TempDir()
+	backdate(t, dir)
+	DetectDependencies(dir)
+
+	depsCacheMu.Lock()
+	defer depsCacheMu.Unlock()
+	if len(depsCache) > dirCacheMaxEntries {
+		t.Errorf("cache grew to %d entries, want at most %d", len(depsCache), dirCacheMaxEntries)
+	}
+	if _, ok := depsCache[dir]; !ok {
+		t.Error("new entry should be cached after clearing")
+	}
+}
+
+// backdate moves the mtimes of paths an hour into the past so their
+// fingerprints are old enough to cache.
+func backdate(t *testing.T, paths ...string) {
+	t.Helper()
+	old := time.Now().Add(-time.Hour)
+	for _, p := range paths {
+		if err := os.Chtimes(p, old, old); err != nil {
+			t.Fatal(err)
+		}
+	}
+}
+
 func TestGetInstallCommands(t *testing.T) {
 	deps := []DepsInfo{
 		{Name: "npm", InstallAll: "npm install", InstallProd: "npm install --production"},
@@ -14,6 +14,7 @@ import (
 	"path/filepath"
 	"sort"
 	"strings"
+	"sync"
 
 	"github.com/sungur/ccbox/internal/config"
 	cclog "github.com/sungur/ccbox/internal/log"
@@ -214,15 +215,85 @@ var languagePatterns = map[string][]patternEntry{
 	},
 }
 
+// patternSuffixes maps each "*.ext" pattern in languagePatterns to the
+// extension it matches, so probes compare suffixes without re-parsing the
+// pattern.
+var patternSuffixes = make(map[string]string)
+
+// Reverse indexes from directory entries to the languages whose patterns
+// they can satisfy. nameLanguages is keyed by literal filename (or the
+// top-level directory of a nested pattern), extLanguages by the extension
+// of a "*.ext" pattern. globLanguages lists languages with multi-extension
+// "*.a.b" patterns, which are always checked. matchesPattern compares any
+// other wildcard pattern (tsconfig.*.json) literally, so those are indexed
+// by name.
+var (
+	nameLanguages = make(map[string][]string)
+	extLanguages  = make(map[string][]string)
+	globLanguages []string
+)
+
+func init() {
+	for lang, patterns := range languagePatterns {
+		glob := false
+		for _, pe := range patterns {
+			switch {
+			case strings.HasPrefix(pe.pattern, "*.") && strings.LastIndex(pe.pattern, ".") == 1:
+				patternSuffixes[pe.pattern] = pe.pattern[1:]
+				extLanguages[pe.pattern[1:]] = appendUnique(extLanguages[pe.pattern[1:]], lang)
+			case strings.HasPrefix(pe.pattern, "*."):
+				patternSuffixes[pe.pattern] = pe.pattern[1:]
+				glob = true
+			default:
+				name, _, _ := strings.Cut(pe.pattern, "/")
+				nameLanguages[name] = appendUnique(nameLanguages[name], lang)
+			}
+		}
+		if glob {
+			globLanguages = append(globLanguages, lang)
+		}
+	}
+}
+
+func appendUnique(langs []string, lang string) []string {
+	for _, l := range langs {
+		if l == lang {
+			return langs
+		}
+	}
+	return append(langs, lang)
+}
+
+// candidateLanguages returns the languages with at least one pattern that
+// could match an entry in the listing, found by looking each entry up in
+// the reverse indexes rather than probing every language's patterns.
+func candidateLanguages(ls *dirListing) map[string]bool {
+	candidates := make(map[string]bool)
+	for name := range ls.names {
+		for _, lang := range nameLanguages[name] {
+			candidates[lang] = true
+		}
+	}
+	for _, name := range ls.files {
+		for _, lang := range extLanguages[filepath.Ext(name)] {
+			candidates[lang] = true
+		}
+	}
+	for _, lang := range globLanguages {
+		candidates[lang] = true
+	}
+	return candidates
+}
+
 // contentValidator validates ambiguous config files by peeking inside.
 // Returns adjusted confidence (0 = reject, original = confirm).
-type contentValidator func(directory string, originalConfidence int) int
+type contentValidator func(ls *dirListing, originalConfidence int) int
 
 // contentValidators maps language -> pattern -> validator.
 var contentValidators = map[string]map[string]contentValidator{
 	"python": {
-		"pyproject.toml": func(dir string, conf int) int {
-			content := readHead(filepath.Join(dir, "pyproject.toml"), 2048)
+		"pyproject.toml": func(ls *dirListing, conf int) int {
+			content := readHead(ls, "pyproject.toml", 2048)
 			markers := []string{
 				"[project]",
 				"[tool.poetry]",
@@ -241,8 +312,8 @@ var contentValidators = map[string]map[string]contentValidator{
 		},
 	},
 	"r": {
-		"DESCRIPTION": func(dir string, conf int) int {
-			content := readHead(filepath.Join(dir, "DESCRIPTION"), 2048)
+		"DESCRIPTION": func(ls *dirListing, conf int) int {
+			content := readHead(ls, "DESCRIPTION", 2048)
 			markers := []string{"Package:", "Type:", "Imports:", "Depends:", "License:"}
 			matchCount := 0
 			for _, m := range markers {
@@ -257,8 +328,8 @@ var contentValidators = map[string]map[string]contentValidator{
 		},
 	},
 	"julia": {
-		"Project.toml": func(dir string, conf int) int {
-			content := readHead(filepath.Join(dir, "Project.toml"), 2048)
+		"Project.toml": func(ls *dirListing, conf int) int {
+			content := readHead(ls, "Project.toml", 2048)
 			markers := []string{"uuid", "[deps]", "[compat]", "julia ="}
 			for _, m := range markers {
 				if strings.Contains(content, m) {
@@ -269,8 +340,8 @@ var contentValidators = map[string]map[string]contentValidator{
 		},
 	},
 	"gleam": {
-		"manifest.toml": func(dir string, conf int) int {
-			content := readHead(filepath.Join(dir, "manifest.toml"), 2048)
+		"manifest.toml": func(ls *dirListing, conf int) int {
+			content := readHead(ls, "manifest.toml", 2048)
 			if strings.Contains(content, "[packages]") {
 				return conf
 			}
@@ -278,8 +349,8 @@ var contentValidators = map[string]map[string]contentValidator{
 		},
 	},
 	"cpp": {
-		"Makefile": func(dir string, conf int) int {
-			content := readHead(filepath.Join(dir, "Makefile"), 4096)
+		"Makefile": func(ls *dirListing, conf int) int {
+			content := readHead(ls, "Makefile", 4096)
 			markers := []string{"gcc", "g++", "clang", "clang++", "$(CC)", "$(CXX)", ".cpp", ".c ", ".o "}
 			for _, m := range markers {
 				if strings.Contains(content, m) {
@@ -291,6 +362,49 @@ var contentValidators = map[string]map[string]contentValidator{
 	},
 }
 
+// detectorContentFiles are the files whose contents or nested location
+// feed into project detection beyond the root listing: package.json, every
+// validated file and nested patterns. Their mtimes are part of the cache key.
+var detectorContentFiles = func() []string {
+	set := map[string]bool{"package.json": true}
+	for _, validators := range contentValidators {
+		for name := range validators {
+			set[name] = true
+		}
+	}
+	for _, patterns := range languagePatterns {
+		for _, pe := range patterns {
+			if strings.Contains(pe.pattern, "/") {
+				set[pe.pattern] = true
+			}
+		}
+	}
+	files := make([]string, 0, len(set))
+	for name := range set {
+		files = append(files, name)
+	}
+	sort.Strings(files)
+	return files
+}()
+
+type detectionCacheEntry struct {
+	key    string
+	result DetectionResult
+}
+
+var (
+	detectionCacheMu sync.Mutex
+	detectionCache   = make(map[string]detectionCacheEntry)
+)
+
+// cloneDetection copies r so callers can't mutate a cached result.
+func cloneDetection(r DetectionResult) DetectionResult {
+	if r.DetectedLanguages != nil {
+		r.DetectedLanguages = append([]LanguageDetection(nil), r.DetectedLanguages...)
+	}
+	return r
+}
+
 // sourceExtensions lists extensions that benefit from count-based scaling.
 var sourceExtensions = map[string][]string{
 	"cpp":  {".cpp", ".hpp", ".cc", ".cxx", ".hxx"},
@@ -322,17 +436,14 @@ var webFamily = map[string]bool{
 	"deno":       true,
 }
 
-// readHead reads the first n bytes of a file as a string.
-// Returns empty string on any error.
-func readHead(path string, bytes int) string {
-	f, err := os.Open(path)
+// readHead reads the first n bytes of a listed file as a string, through
+// the listing's read cache. Returns empty string on any error.
+func readHead(ls *dirListing, name string, n int64) string {
+	data, err := ls.readLimited(name, n)
 	if err != nil {
 		return ""
 	}
-	defer f.Close()
-	buf := make([]byte, bytes)
-	n, _ := f.Read(buf)
-	return string(buf[:n])
+	return string(data)
 }
 
 // matchesPattern checks if a filename matches a detection pattern.
@@ -345,29 +456,25 @@ func matchesPattern(filename, pattern string) bool {
 	return filename == pattern
 }
 
-// getDirFiles returns all file names in a directory (non-recursive).
-func getDirFiles(directory string) []string {
-	entries, err := os.ReadDir(directory)
-	if err != nil {
-		return nil
-	}
-	var files []string
-	for _, e := range entries {
-		if !e.IsDir() {
-			files = append(files, e.Name())
-		}
+// hasMatchingFile checks if the listed directory contains a file matching
+// the pattern. Literal names are answered from the listing; only nested
+// paths (project/build.properties) need a stat, and only when their parent
+// directory is present. "*.ext" patterns use their precomputed suffix.
+func hasMatchingFile(ls *dirListing, pattern string) bool {
+	if suffix, ok := patternSuffixes[pattern]; ok {
+		return ls.hasSuffix(suffix)
 	}
-	return files
-}
-
-// hasMatchingFile checks if a directory contains a file matching the pattern.
-func hasMatchingFile(directory, pattern string) bool {
 	if !strings.Contains(pattern, "*") {
-		_, err := os.Stat(filepath.Join(directory, pattern))
-		return err == nil
+		if parent, _, nested := strings.Cut(pattern, "/"); nested {
+			if !ls.has(parent) {
+				return false
+			}
+			_, err := os.Stat(filepath.Join(ls.dir, pattern))
+			return err == nil
+		}
+		return ls.has(pattern)
 	}
-	files := getDirFiles(directory)
-	for _, name := range files {
+	for _, name := range ls.files {
 		if matchesPattern(name, pattern) {
 			return true
 		}
@@ -375,25 +482,32 @@ func hasMatchingFile(directory, pattern string) bool {
 	return false
 }
 
+// countSourceFiles counts, per language in sourceExtensions, the files in
+// the listing with one of its extensions. It runs once per detection so
+// every source-extension match is scaled from the same pass.
+func countSourceFiles(ls *dirListing) map[string]int {
+	counts := make(map[string]int, len(sourceExtensions))
+	for _, f := range ls.files {
+		for lang, extensions := range sourceExtensions {
+			for _, ext := range extensions {
+				if strings.HasSuffix(f, ext) {
+					counts[lang]++
+					break
+				}
+			}
+		}
+	}
+	return counts
+}
+
 // scaleSourceConfidence scales confidence based on source file count.
 // 1 file = SOURCE_EXTENSION_SINGLE (15), 2+ = SOURCE_EXTENSION (30).
-func scaleSourceConfidence(directory, lang string, baseConfidence int) int {
-	extensions, ok := sourceExtensions[lang]
-	if !ok || baseConfidence != ConfSourceExtension {
+func scaleSourceConfidence(sourceCounts map[string]int, lang string, baseConfidence int) int {
+	if _, ok := sourceExtensions[lang]; !ok || baseConfidence != ConfSourceExtension {
 		return baseConfidence
 	}
 
-	files := getDirFiles(directory)
-	count := 0
-	for _, f := range files {
-		for _, ext := range extensions {
-			if strings.HasSuffix(f, ext) {
-				count++
-				break
-			}
-		}
-	}
-
+	count := sourceCounts[lang]
 	if count == 0 {
 		return ConfContentRejected
 	}
@@ -404,9 +518,11 @@ func scaleSourceConfidence(directory, lang string, baseConfidence int) int {
 }
 
 // detectPackageManager checks package.json for the packageManager field.
-func detectPackageManager(directory string) string {
-	pkgPath := filepath.Join(directory, "package.json")
-	data, err := os.ReadFile(pkgPath)
+func detectPackageManager(ls *dirListing) string {
+	if !ls.has("package.json") {
+		return ""
+	}
+	data, err := ls.read("package.json")
 	if err != nil {
 		return ""
 	}
@@ -480,20 +596,67 @@ func LanguageToStack(lang string) config.LanguageStack {
 //
 // Returns BASE stack if directory doesn't exist or is unreadable.
 //
-//nolint:gocyclo // inherent complexity from 20+ language detection rules
+// Results are cached per directory until its listing or a content-checked
+// file changes. Verbose calls always rescan so the scoring trace is logged.
 func DetectProjectType(directory string, verbose bool) DetectionResult {
-	// Defensive: verify directory exists before scanning
-	if _, err := os.Stat(directory); err != nil {
-		return DetectionResult{
-			RecommendedStack:  config.StackBase,
-			DetectedLanguages: nil,
+	// Defensive: verify directory exists before scanning (the same stat
+	// seeds the cache key)
+	key, ok := dirCacheKey(directory, detectorContentFiles)
+	if !ok {
+		return noDetection
+	}
+
+	if !verbose && key != "" {
+		detectionCacheMu.Lock()
+		entry, hit := detectionCache[directory]
+		detectionCacheMu.Unlock()
+		if hit && entry.key == key {
+			return cloneDetection(entry.result)
 		}
 	}
 
+	result := detectProjectType(directory, verbose)
+	if key != "" {
+		detectionCacheMu.Lock()
+		if _, ok := detectionCache[directory]; !ok && len(detectionCache) >= dirCacheMaxEntries {
+			detectionCache = make(map[string]detectionCacheEntry)
+		}
+		detectionCache[directory] = detectionCacheEntry{key: key, result: cloneDetection(result)}
+		detectionCacheMu.Unlock()
+	}
+	return result
+}
+
+// noDetection is the result when nothing in the directory identifies a
+// language.
+var noDetection = DetectionResult{
+	RecommendedStack:  config.StackBase,
+	DetectedLanguages: nil,
+}
+
+// detectProjectType runs detection against the filesystem.
+//
+//nolint:gocyclo // inherent complexity from 20+ language detection rules
+func detectProjectType(directory string, verbose bool) DetectionResult {
+	// One directory read answers every pattern probe below.
+	ls := listDir(directory)
+
+	if verbose {
+		cclog.Debugf("Scanning %s (%d files)", directory, len(ls.files))
+	}
+
+	// Directories with no entry any pattern could match (home folders,
+	// scratch dirs) are rejected before any scoring work.
+	candidates := candidateLanguages(ls)
+	if len(candidates) == 0 {
+		return noDetection
+	}
+	sourceCounts := countSourceFiles(ls)
+
 	var detections []LanguageDetection
 
 	// Check packageManager field first (most reliable for JS ecosystem)
-	pkgManager := detectPackageManager(directory)
+	pkgManager := detectPackageManager(ls)
 	switch pkgManager {
 	case "bun":
 		detections = append(detections, LanguageDetection{
@@ -511,28 +674,26 @@ func DetectProjectType(directory string, verbose bool) DetectionResult {
 		})
 	}
 
-	if verbose {
-		files := getDirFiles(directory)
-		cclog.Debugf("Scanning %s (%d files)", directory, len(files))
-	}
-
-	// Build set of already-detected languages (from packageManager)
+	// Build set of already-detected languages (from packageManager). It is
+	// kept current through scanning and suppression so the exclusion and
+	// promotion rules below read one set instead of rebuilding it.
 	detectedLangs := make(map[string]bool)
 	for _, d := range detections {
 		detectedLangs[d.Language] = true
 	}
 
 	// Scan for language patterns - pick highest confidence match per language
-	for lang, patterns := range languagePatterns {
+	for lang := range candidates {
 		if detectedLangs[lang] {
 			continue
 		}
+		patterns := languagePatterns[lang]
 
 		bestConfidence := 0
 		bestTrigger := ""
 
 		for _, pe := range patterns {
-			if !hasMatchingFile(directory, pe.pattern) {
+			if !hasMatchingFile(ls, pe.pattern) {
 				continue
 			}
 
@@ -541,7 +702,7 @@ func DetectProjectType(directory string, verbose bool) DetectionResult {
 			// Content validation: peek inside ambiguous files
 			if validators, ok := contentValidators[lang]; ok {
 				if validator, ok := validators[pe.pattern]; ok {
-					adjustedConfidence = validator(directory, pe.confidence)
+					adjustedConfidence = validator(ls, pe.confidence)
 					if verbose && adjustedConfidence != pe.confidence {
 						cclog.Debugf("  content-check: %s <- %s (%d -> %d)", lang, pe.pattern, pe.confidence, adjustedConfidence)
 					}
@@ -549,7 +710,7 @@ func DetectProjectType(directory string, verbose bool) DetectionResult {
 			}
 
 			// Source extension count scaling
-			adjustedConfidence = scaleSourceConfidence(directory, lang, adjustedConfidence)
+			adjustedConfidence = scaleSourceConfidence(sourceCounts, lang, adjustedConfidence)
 
 			if verbose && adjustedConfidence > 0 {
 				cclog.Debugf("  match: %s <- %s (%d)", lang, pe.pattern, adjustedConfidence)
@@ -559,6 +720,12 @@ func DetectProjectType(directory string, verbose bool) DetectionResult {
 				bestConfidence = adjustedConfidence
 				bestTrigger = pe.pattern
 			}
+
+			// No pattern scores above a lock file, so the language's
+			// remaining patterns (and their content checks) can't win.
+			if bestConfidence >= ConfLockFile {
+				break
+			}
 		}
 
 		if bestConfidence > 0 {
@@ -568,9 +735,16 @@ func DetectProjectType(directory string, verbose bool) DetectionResult {
 				Trigger:    bestTrigger,
 				Stack:      LanguageToStack(lang),
 			})
+			detectedLangs[lang] = true
 		}
 	}
 
+	// Nothing matched (the common case for arbitrary folders): skip the
+	// suppression, ranking and promotion passes.
+	if len(detections) == 0 {
+		return noDetection
+	}
+
 	// Makefile context-dependent scoring:
 	// If a primary language (not cpp) is detected with high confidence,
 	// demote Makefile-triggered cpp detection since Makefile is multi-purpose.
@@ -601,12 +775,8 @@ func DetectProjectType(directory string, verbose bool) DetectionResult {
 
 	// Apply mutual exclusion rules: remove suppressed languages
 	suppressedLangs := make(map[string]bool)
-	detectedLangSet := make(map[string]bool)
-	for _, d := range detections {
-		detectedLangSet[d.Language] = true
-	}
 	for _, rule := range suppressionRules {
-		if detectedLangSet[rule.ifLang] && detectedLangSet[rule.suppress] {
+		if detectedLangs[rule.ifLang] && detectedLangs[rule.suppress] {
 			suppressedLangs[rule.suppress] = true
 			if verbose {
 				cclog.Debugf("  suppress: %s (%s detected)", rule.suppress, rule.ifLang)
@@ -616,6 +786,9 @@ func DetectProjectType(directory string, verbose bool) DetectionResult {
 
 	var filtered []LanguageDetection
 	if len(suppressedLangs) > 0 {
+		for lang := range suppressedLangs {
+			delete(detectedLangs, lang)
+		}
 		for _, d := range detections {
 			if !suppressedLangs[d.Language] {
 				filtered = append(filtered, d)
@@ -637,20 +810,15 @@ func DetectProjectType(directory string, verbose bool) DetectionResult {
 	}
 
 	// Apply promotion rules: multi-language -> combined stack
-	detectedLangSet2 := make(map[string]bool)
-	for _, d := range filtered {
-		detectedLangSet2[d.Language] = true
-	}
-
 	// Promotion: web + python -> fullstack
 	hasWeb := false
-	for lang := range detectedLangSet2 {
+	for lang := range detectedLangs {
 		if webFamily[lang] {
 			hasWeb = true
 			break
 		}
 	}
-	if hasWeb && detectedLangSet2["python"] {
+	if hasWeb && detectedLangs["python"] {
 		if verbose {
 			cclog.Debug("  promote: web+python -> fullstack")
 		}
@@ -87,6 +87,30 @@ func TestDetectProjectTypeNonexistentDir(t *testing.T) {
 	}
 }
 
+func TestDetectProjectTypeCache(t *testing.T) {
+	dir := t.TempDir()
+	writeFile(t, filepath.Join(dir, "pyproject.toml"), []byte("random content without markers"))
+
+	if got := DetectProjectType(dir, false); got.RecommendedStack != config.StackBase {
+		t.Fatalf("unvalidated pyproject.toml should return StackBase, got %q", got.RecommendedStack)
+	}
+
+	// Rewriting a content-checked file leaves the listing unchanged but must
+	// still invalidate the cached result.
+	writeFile(t, filepath.Join(dir, "pyproject.toml"), []byte("[project]\nname = \"foo\"\n"))
+	backdate(t, dir, filepath.Join(dir, "pyproject.toml"))
+	first := DetectProjectType(dir, false)
+	if first.RecommendedStack != config.StackPython {
+		t.Fatalf("expected StackPython after rewrite, got %q", first.RecommendedStack)
+	}
+
+	// Mutating a returned result must not leak into the cache.
+	first.DetectedLanguages[0].Language = "mutated"
+	if again := DetectProjectType(dir, false); again.DetectedLanguages[0].Language != "python" {
+		t.Errorf("cached result was mutated: %v", again.DetectedLanguages)
+	}
+}
+
 func writeFile(t *testing.T, path string, content []byte) {
 	t.Helper()
 	if err := os.WriteFile(path, content, 0o600); err != nil {
@@ -185,7 +209,7 @@ func TestDetectPackageManager(t *testing.T) {
 	t.Run("bun", func(t *testing.T) {
 		dir := t.TempDir()
 		writeFile(t, filepath.Join(dir, "package.json"), []byte(`{"packageManager":"bun@1.2.9"}`))
-		got := detectPackageManager(dir)
+		got := detectPackageManager(listDir(dir))
 		if got != "bun" {
 			t.Errorf("detectPackageManager() = %q, want %q", got, "bun")
 		}
@@ -194,7 +218,7 @@ func TestDetectPackageManager(t *testing.T) {
 	t.Run("pnpm", func(t *testing.T) {
 		dir := t.TempDir()
 		writeFile(t, filepath.Join(dir, "package.json"), []byte(`{"packageManager":"pnpm@8.0.0"}`))
-		got := detectPackageManager(dir)
+		got := detectPackageManager(listDir(dir))
 		if got != "pnpm" {
 			t.Errorf("detectPackageManager() = %q, want %q", got, "pnpm")
 		}
@@ -203,7 +227,7 @@ func TestDetectPackageManager(t *testing.T) {
 	t.Run("no field", func(t *testing.T) {
 		dir := t.TempDir()
 		writeFile(t, filepath.Join(dir, "package.json"), []byte(`{"name":"foo"}`))
-		got := detectPackageManager(dir)
+		got := detectPackageManager(listDir(dir))
 		if got != "" {
 			t.Errorf("detectPackageManager() = %q, want empty", got)
 		}
@@ -212,7 +236,7 @@ func TestDetectPackageManager(t *testing.T) {
 	t.Run("invalid json", func(t *testing.T) {
 		dir := t.TempDir()
 		writeFile(t, filepath.Join(dir, "package.json"), []byte(`not json`))
-		got := detectPackageManager(dir)
+		got := detectPackageManager(listDir(dir))
 		if got != "" {
 			t.Errorf("detectPackageManager() = %q, want empty", got)
 		}
@@ -220,7 +244,7 @@ func TestDetectPackageManager(t *testing.T) {
 
 	t.Run("no package.json", func(t *testing.T) {
 		dir := t.TempDir()
-		got := detectPackageManager(dir)
+		got := detectPackageManager(listDir(dir))
 		if got != "" {
 			t.Errorf("detectPackageManager() = %q, want empty", got)
 		}
@@ -231,7 +255,7 @@ func TestScaleSourceConfidence(t *testing.T) {
 	t.Run("single cpp file", func(t *testing.T) {
 		dir := t.TempDir()
 		writeFile(t, filepath.Join(dir, "main.cpp"), []byte("int main(){}"))
-		got := scaleSourceConfidence(dir, "cpp", ConfSourceExtension)
+		got := scaleSourceConfidence(countSourceFiles(listDir(dir)), "cpp", ConfSourceExtension)
 		if got != ConfSourceExtSingle {
 			t.Errorf("single file should return %d, got %d", ConfSourceExtSingle, got)
 		}
@@ -241,7 +265,7 @@ func TestScaleSourceConfidence(t *testing.T) {
 		dir := t.TempDir()
 		writeFile(t, filepath.Join(dir, "main.cpp"), []byte("int main(){}"))
 		writeFile(t, filepath.Join(dir, "util.cpp"), []byte("void util(){}"))
-		got := scaleSourceConfidence(dir, "cpp", ConfSourceExtension)
+		got := scaleSourceConfidence(countSourceFiles(listDir(dir)), "cpp", ConfSourceExtension)
 		if got != ConfSourceExtension {
 			t.Errorf("multiple files should return %d, got %d", ConfSourceExtension, got)
 		}
@@ -249,7 +273,7 @@ func TestScaleSourceConfidence(t *testing.T) {
 
 	t.Run("no files", func(t *testing.T) {
 		dir := t.TempDir()
-		got := scaleSourceConfidence(dir, "cpp", ConfSourceExtension)
+		got := scaleSourceConfidence(countSourceFiles(listDir(dir)), "cpp", ConfSourceExtension)
 		if got != ConfContentRejected {
 			t.Errorf("no files should return %d, got %d", ConfContentRejected, got)
 		}
@@ -257,7 +281,7 @@ func TestScaleSourceConfidence(t *testing.T) {
 
 	t.Run("non-source confidence", func(t *testing.T) {
 		dir := t.TempDir()
-		got := scaleSourceConfidence(dir, "cpp", ConfPrimaryConfig)
+		got := scaleSourceConfidence(countSourceFiles(listDir(dir)), "cpp", ConfPrimaryConfig)
 		if got != ConfPrimaryConfig {
 			t.Errorf("non-source confidence should pass through, got %d", got)
 		}
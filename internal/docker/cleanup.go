@@ -4,34 +4,48 @@ import (
 	"context"
 	"fmt"
 	"strings"
+	"sync"
 
 	"github.com/docker/docker/api/types"
 	"github.com/docker/docker/api/types/filters"
+	"github.com/docker/docker/api/types/image"
 
+	"github.com/sungur/ccbox/internal/config"
 	"github.com/sungur/ccbox/internal/log"
 )
 
 // PruneContainers removes all stopped ccbox containers and returns the
-// number of containers successfully removed.
+// number of containers successfully removed. A single prune request
+// filtered on the ccbox label replaces listing and removing each container;
+// a follow-up pass by name catches stopped containers created by releases
+// that did not label them.
 func PruneContainers(ctx context.Context) (int, error) {
-	containers, err := ListCcbox(ctx)
+	cli, err := NewClient()
 	if err != nil {
-		return 0, fmt.Errorf("list ccbox containers: %w", err)
+		return 0, fmt.Errorf("docker client: %w", err)
 	}
 
-	removed := 0
+	f := filters.NewArgs()
+	f.Add("label", config.LabelManaged)
+
+	report, err := cli.ContainersPrune(ctx, f)
+	if err != nil {
+		return 0, fmt.Errorf("prune containers: %w", err)
+	}
+	removed := len(report.ContainersDeleted)
+
+	// Unlabeled leftovers are rare, so this listing is usually empty.
+	containers, err := ListCcbox(ctx)
+	if err != nil {
+		return removed, fmt.Errorf("list ccbox containers: %w", err)
+	}
+	var stopped []string
 	for _, c := range containers {
-		// Skip running containers -- only remove exited/dead ones
-		if c.State == "running" {
-			continue
-		}
-		if err := Remove(ctx, c.ID, true); err != nil {
-			log.Dim(fmt.Sprintf("Failed to remove container %s: %v", c.ID[:12], err))
-			continue
+		if c.State != "running" {
+			stopped = append(stopped, c.ID)
 		}
-		removed++
 	}
-	return removed, nil
+	return removed + removeContainers(ctx, stopped), nil
 }
 
 // PruneImages removes all ccbox images that are not currently in use by a
@@ -42,15 +56,16 @@ func PruneImages(ctx context.Context) (int, error) {
 		return 0, fmt.Errorf("list ccbox images: %w", err)
 	}
 
+	names := imageRefs(images)
+	errs := removeAll(ctx, names, func(ctx context.Context, name string) error {
+		return RemoveImage(ctx, name, false)
+	})
+
 	removed := 0
-	for _, img := range images {
-		name := img.ID
-		if len(img.RepoTags) > 0 {
-			name = img.RepoTags[0]
-		}
-		if err := RemoveImage(ctx, name, false); err != nil {
+	for i, err := range errs {
+		if err != nil {
 			// Image may be in use by a container; skip without failing
-			log.Dim(fmt.Sprintf("Skipped image %s: %v", name, err))
+			log.Dimf("Skipped image %s: %v", names[i], err)
 			continue
 		}
 		removed++
@@ -73,9 +88,9 @@ func PruneVolumes(ctx context.Context) error {
 	}
 
 	if len(report.VolumesDeleted) > 0 {
-		log.Dim(fmt.Sprintf("Pruned %d volumes (%.1f MB reclaimed)",
+		log.Dimf("Pruned %d volumes (%.1f MB reclaimed)",
 			len(report.VolumesDeleted),
-			float64(report.SpaceReclaimed)/1024/1024))
+			float64(report.SpaceReclaimed)/1024/1024)
 	}
 
 	return nil
@@ -103,17 +118,68 @@ func PruneBuilder(ctx context.Context, cacheAge string) error {
 
 	report, err := cli.BuildCachePrune(ctx, opts)
 	if err != nil {
+		if ctx.Err() != nil {
+			return fmt.Errorf("prune build cache interrupted: %w", ctx.Err())
+		}
 		return fmt.Errorf("prune build cache: %w", err)
 	}
 
 	if report != nil && report.SpaceReclaimed > 0 {
-		log.Dim(fmt.Sprintf("Pruned build cache (%.1f MB reclaimed)",
-			float64(report.SpaceReclaimed)/1024/1024))
+		log.Dimf("Pruned build cache (%.1f MB reclaimed)",
+			float64(report.SpaceReclaimed)/1024/1024)
 	}
 
 	return nil
 }
 
+// DiskUsage summarizes the disk space held by ccbox resources, in bytes.
+type DiskUsage struct {
+	Containers int64 // writable layers of ccbox containers
+	Images     int64 // ccbox images
+}
+
+// Total returns the combined size of all ccbox resources.
+func (u DiskUsage) Total() int64 {
+	return u.Containers + u.Images
+}
+
+// GetDiskUsage returns the disk space used by ccbox containers and images,
+// taken from the daemon's disk usage report. Only container and image
+// usage is requested; volume and build cache sizes are the expensive parts
+// of the report and are not needed here.
+func GetDiskUsage(ctx context.Context) (DiskUsage, error) {
+	cli, err := NewClient()
+	if err != nil {
+		return DiskUsage{}, fmt.Errorf("docker client: %w", err)
+	}
+
+	report, err := cli.DiskUsage(ctx, types.DiskUsageOptions{
+		Types: []types.DiskUsageObject{types.ContainerObject, types.ImageObject},
+	})
+	if err != nil {
+		return DiskUsage{}, fmt.Errorf("disk usage: %w", err)
+	}
+
+	var usage DiskUsage
+	for _, c := range report.Containers {
+		for _, name := range c.Names {
+			if strings.HasPrefix(strings.TrimPrefix(name, "/"), config.CcboxPrefix) {
+				usage.Containers += c.SizeRw
+				break
+			}
+		}
+	}
+	for _, img := range report.Images {
+		for _, tag := range img.RepoTags {
+			if strings.HasPrefix(tag, config.CcboxPrefix) {
+				usage.Images += img.Size
+				break
+			}
+		}
+	}
+	return usage, nil
+}
+
 // RemoveAllCcbox performs a comprehensive cleanup of all ccbox-related
 // Docker resources in order:
 //  1. Stop all running ccbox containers
@@ -126,57 +192,99 @@ func PruneBuilder(ctx context.Context, cacheAge string) error {
 func RemoveAllCcbox(ctx context.Context, deep bool) error {
 	var errs []string
 
-	// Phase 1: Stop all running ccbox containers
+	// The image listing does not depend on container state, so fetch it
+	// while the container phases run.
+	type imageListing struct {
+		images []image.Summary
+		err    error
+	}
+	imagesCh := make(chan imageListing, 1)
+	go func() {
+		images, err := ListCcboxImages(ctx)
+		imagesCh <- imageListing{images: images, err: err}
+	}()
+
+	// Phase 1: Stop all running ccbox containers. Each stop waits up to the
+	// container's grace period, so stop them concurrently rather than
+	// paying the timeouts one after another.
 	containers, err := ListCcbox(ctx)
 	if err != nil {
 		return fmt.Errorf("list ccbox containers: %w", err)
 	}
 
+	var running []string
 	for _, c := range containers {
 		if c.State == "running" {
-			if err := Stop(ctx, c.ID, 10); err != nil {
-				errs = append(errs, fmt.Sprintf("stop %s: %v", c.ID[:12], err))
-			}
+			running = append(running, c.ID)
+		}
+	}
+	stopErrs := removeAll(ctx, running, func(ctx context.Context, id string) error {
+		return Stop(ctx, id, 10)
+	})
+	for i, err := range stopErrs {
+		if err != nil {
+			errs = append(errs, fmt.Sprintf("stop %s: %v", running[i][:12], err))
 		}
 	}
 
-	// Phase 2: Remove all ccbox containers (now all should be stopped)
-	removedContainers, err := pruneAllContainers(ctx)
-	if err != nil {
-		errs = append(errs, fmt.Sprintf("prune containers: %v", err))
-	} else if removedContainers > 0 {
-		log.Dim(fmt.Sprintf("Removed %d containers", removedContainers))
+	// Phase 2: Remove all ccbox containers (now all should be stopped).
+	// The phase 1 listing is reused; force removal covers any container
+	// that failed to stop, so no second listing is needed.
+	if len(containers) > 0 {
+		ids := make([]string, len(containers))
+		for i, c := range containers {
+			ids[i] = c.ID
+		}
+		if removed := removeContainers(ctx, ids); removed > 0 {
+			log.Dimf("Removed %d containers", removed)
+		}
 	}
 
 	// Phase 3: Remove all ccbox images with force (containers are gone)
-	images, err := ListCcboxImages(ctx)
-	if err != nil {
-		errs = append(errs, fmt.Sprintf("list images: %v", err))
+	listing := <-imagesCh
+	if listing.err != nil {
+		errs = append(errs, fmt.Sprintf("list images: %v", listing.err))
 	} else {
+		names := imageRefs(listing.images)
+		removeErrs := removeAll(ctx, names, func(ctx context.Context, name string) error {
+			return RemoveImage(ctx, name, true)
+		})
+
 		removedImages := 0
-		for _, img := range images {
-			name := img.ID
-			if len(img.RepoTags) > 0 {
-				name = img.RepoTags[0]
-			}
-			if err := RemoveImage(ctx, name, true); err != nil {
-				errs = append(errs, fmt.Sprintf("remove image %s: %v", name, err))
+		for i, err := range removeErrs {
+			if err != nil {
+				errs = append(errs, fmt.Sprintf("remove image %s: %v", names[i], err))
 				continue
 			}
 			removedImages++
 		}
 		if removedImages > 0 {
-			log.Dim(fmt.Sprintf("Removed %d images", removedImages))
+			log.Dimf("Removed %d images", removedImages)
 		}
 	}
 
-	// Phase 4: Deep cleanup (volumes and builder cache)
+	// Phase 4: Deep cleanup (volumes and builder cache). These touch
+	// disjoint resource classes, so run them concurrently; the builder
+	// prune usually dominates and hides the volume prune entirely.
 	if deep {
-		if err := PruneVolumes(ctx); err != nil {
-			errs = append(errs, fmt.Sprintf("prune volumes: %v", err))
+		var volumesErr, builderErr error
+		var wg sync.WaitGroup
+		wg.Add(2)
+		go func() {
+			defer wg.Done()
+			volumesErr = PruneVolumes(ctx)
+		}()
+		go func() {
+			defer wg.Done()
+			builderErr = PruneBuilder(ctx, "")
+		}()
+		wg.Wait()
+
+		if volumesErr != nil {
+			errs = append(errs, fmt.Sprintf("prune volumes: %v", volumesErr))
 		}
-		if err := PruneBuilder(ctx, ""); err != nil {
-			errs = append(errs, fmt.Sprintf("prune builder: %v", err))
+		if builderErr != nil {
+			errs = append(errs, fmt.Sprintf("prune builder: %v", builderErr))
 		}
 	}
 
@@ -187,21 +295,67 @@ func RemoveAllCcbox(ctx context.Context, deep bool) error {
 	return nil
 }
 
-// pruneAllContainers removes ALL ccbox containers regardless of state.
-// This is used during full cleanup after containers have been stopped.
-func pruneAllContainers(ctx context.Context) (int, error) {
-	containers, err := ListCcbox(ctx)
-	if err != nil {
-		return 0, fmt.Errorf("list ccbox containers: %w", err)
-	}
+// removeContainers force-removes the given containers concurrently and
+// returns the number removed. Failures are logged and skipped.
+func removeContainers(ctx context.Context, ids []string) int {
+	errs := removeAll(ctx, ids, func(ctx context.Context, id string) error {
+		return Remove(ctx, id, true)
+	})
 
 	removed := 0
-	for _, c := range containers {
-		if err := Remove(ctx, c.ID, true); err != nil {
-			log.Dim(fmt.Sprintf("Failed to remove container %s: %v", c.ID[:12], err))
+	for i, err := range errs {
+		if err != nil {
+			log.Dimf("Failed to remove container %s: %v", ids[i][:12], err)
 			continue
 		}
 		removed++
 	}
-	return removed, nil
+	return removed
+}
+
+// imageRefs returns the name used to remove each image: its first repo tag,
+// or the image ID for untagged images.
+func imageRefs(images []image.Summary) []string {
+	names := make([]string, len(images))
+	for i, img := range images {
+		names[i] = img.ID
+		if len(img.RepoTags) > 0 {
+			names[i] = img.RepoTags[0]
+		}
+	}
+	return names
+}
+
+// removeConcurrency bounds the number of in-flight removal requests so a
+// large cleanup does not overwhelm the Docker daemon.
+const removeConcurrency = 8
+
+// removeAll calls remove for every target with at most removeConcurrency
+// calls in flight. It also drives other per-target operations, such as
+// stopping containers. Each removal is an independent daemon round-trip, so the
+// wall-clock cost drops from the sum of all round-trips to roughly
+// len(targets)/removeConcurrency of them. The returned errors are indexed
+// like targets (nil on success).
+func removeAll(ctx context.Context, targets []string, remove func(context.Context, string) error) []error {
+	errs := make([]error, len(targets))
+	sem := make(chan struct{}, removeConcurrency)
+
+	var wg sync.WaitGroup
+	for i, target := range targets {
+		select {
+		case sem <- struct{}{}:
+		case <-ctx.Done():
+			errs[i] = ctx.Err()
+			continue
+		}
+		wg.Add(1)
+		go func(i int, target string) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			errs[i] = remove(ctx, target)
+		}(i, target)
+	}
+	wg.Wait()
+
+	return errs
 }
@@ -0,0 +1,44 @@
+package docker
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"sync/atomic"
+	"testing"
+)
+
+func TestRemoveAll(t *testing.T) {
+	targets := make([]string, 50)
+	for i := range targets {
+		targets[i] = fmt.Sprintf("target-%d", i)
+	}
+
+	var inFlight, maxInFlight atomic.Int32
+	errs := removeAll(context.Background(), targets, func(_ context.Context, target string) error {
+		n := inFlight.Add(1)
+		defer inFlight.Add(-1)
+		for {
+			cur := maxInFlight.Load()
+			if n <= cur || maxInFlight.CompareAndSwap(cur, n) {
+				break
+			}
+		}
+		if target == "target-7" {
+			return errors.New("in use")
+		}
+		return nil
+	})
+
+	if len(errs) != len(targets) {
+		t.Fatalf("removeAll() returned %d errors, want %d", len(errs), len(targets))
+	}
+	for i, err := range errs {
+		if (err != nil) != (i == 7) {
+			t.Errorf("errs[%d] = %v, want error only at index 7", i, err)
+		}
+	}
+	if got := maxInFlight.Load(); got > removeConcurrency {
+		t.Errorf("max in-flight removals = %d, want <= %d", got, removeConcurrency)
+	}
+}
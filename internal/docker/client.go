@@ -4,6 +4,7 @@ package docker
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"io"
 	"os"
@@ -21,6 +22,7 @@ import (
 	"github.com/docker/docker/api/types/volume"
 	dockerclient "github.com/docker/docker/client"
 	ocispec "github.com/opencontainers/image-spec/specs-go/v1"
+	"github.com/sungur/ccbox/internal/config"
 	"github.com/sungur/ccbox/internal/log"
 )
 
@@ -50,8 +52,10 @@ type DockerAPI interface {
 	ImageList(ctx context.Context, options image.ListOptions) ([]image.Summary, error)
 	ImageRemove(ctx context.Context, imageID string, options image.RemoveOptions) ([]image.DeleteResponse, error)
 
+	ContainersPrune(ctx context.Context, pruneFilters filters.Args) (container.PruneReport, error)
 	VolumesPrune(ctx context.Context, pruneFilter filters.Args) (volume.PruneReport, error)
 	BuildCachePrune(ctx context.Context, opts types.BuildCachePruneOptions) (*types.BuildCachePruneReport, error)
+	DiskUsage(ctx context.Context, options types.DiskUsageOptions) (types.DiskUsage, error)
 }
 
 var (
@@ -85,26 +89,73 @@ func SetClientForTest(api DockerAPI) {
 	defer mu.Unlock()
 	instance = api
 	initErr = nil
+
+	healthMu.Lock()
+	lastHealthyAt = time.Time{}
+	healthMu.Unlock()
 }
 
+// healthCacheTTL is how long a successful health check is reused, so
+// back-to-back checks within one workflow cost a single ping.
+const healthCacheTTL = 2 * time.Second
+
+var (
+	healthMu      sync.Mutex
+	lastHealthyAt time.Time
+)
+
 // CheckHealth checks if Docker daemon is responsive
 func CheckHealth(ctx context.Context) bool {
+	healthMu.Lock()
+	fresh := !lastHealthyAt.IsZero() && time.Since(lastHealthyAt) < healthCacheTTL
+	healthMu.Unlock()
+	if fresh {
+		return true
+	}
+
 	cli, err := NewClient()
 	if err != nil {
 		return false
 	}
 	ctx, cancel := context.WithTimeout(ctx, 5*time.Second)
 	defer cancel()
-	_, err = cli.Ping(ctx)
-	return err == nil
+	if _, err = cli.Ping(ctx); err != nil {
+		return false
+	}
+
+	healthMu.Lock()
+	lastHealthyAt = time.Now()
+	healthMu.Unlock()
+	return true
+}
+
+var (
+	cliPathOnce sync.Once
+	cliPath     string
+)
+
+// CLIPath returns the docker CLI executable, resolved against PATH once per
+// process so repeated invocations skip the PATH search. Falls back to plain
+// "docker" when the lookup fails, leaving exec to report the error.
+func CLIPath() string {
+	cliPathOnce.Do(func() {
+		cliPath = "docker"
+		if path, err := exec.LookPath("docker"); err == nil {
+			cliPath = path
+		}
+	})
+	return cliPath
 }
 
 // AutoStart tries to start Docker Desktop based on platform
 func AutoStart() bool {
+	ctx, cancel := context.WithTimeout(context.Background(), config.DockerCommandTimeout)
+	defer cancel()
+
 	switch runtime.GOOS {
 	case "windows":
 		// Try docker desktop start command
-		cmd := exec.Command("docker", "desktop", "start")
+		cmd := exec.CommandContext(ctx, CLIPath(), "desktop", "start")
 		if err := cmd.Run(); err == nil {
 			return true
 		}
@@ -114,13 +165,12 @@ func AutoStart() bool {
 			programFiles = `C:\Program Files`
 		}
 		dockerExe := filepath.Join(programFiles, "Docker", "Docker", "Docker Desktop.exe")
-		if _, err := os.Stat(dockerExe); err == nil {
-			cmd := exec.Command(dockerExe)
-			_ = cmd.Start() // Start detached
+		// Start detached; a missing executable surfaces as a Start error
+		if err := exec.Command(dockerExe).Start(); err == nil {
 			return true
 		}
 	case "darwin":
-		cmd := exec.Command("open", "-a", "Docker")
+		cmd := exec.CommandContext(ctx, "open", "-a", "Docker")
 		if err := cmd.Run(); err == nil {
 			return true
 		}
@@ -128,6 +178,14 @@ func AutoStart() bool {
 	return false
 }
 
+// Startup polling backs off from startupPollInitial to startupPollMax, so a
+// daemon that comes up quickly is noticed within ~100ms while a slow start
+// costs only a few dozen pings.
+const (
+	startupPollInitial = 100 * time.Millisecond
+	startupPollMax     = 2 * time.Second
+)
+
 // EnsureRunning checks Docker health, tries auto-start, waits up to timeout
 func EnsureRunning(ctx context.Context, timeout time.Duration) error {
 	if CheckHealth(ctx) {
@@ -139,23 +197,43 @@ func EnsureRunning(ctx context.Context, timeout time.Duration) error {
 		return fmt.Errorf("docker is not running and could not be started")
 	}
 
-	deadline := time.Now().Add(timeout)
-	ticker := time.NewTicker(1 * time.Second)
-	defer ticker.Stop()
+	start := time.Now()
+	waitCtx, cancel := context.WithTimeout(ctx, timeout)
+	defer cancel()
+
+	// The caller's deadline may be shorter than timeout; report whichever
+	// limit actually applies when the wait runs out.
+	limit := timeout
+	if deadline, ok := ctx.Deadline(); ok && deadline.Sub(start) < limit {
+		limit = deadline.Sub(start).Round(time.Second)
+	}
 
-	elapsed := 0
-	for range ticker.C {
-		elapsed++
-		if CheckHealth(ctx) {
+	delay := startupPollInitial
+	nextNotice := config.DockerCheckInterval
+	timer := time.NewTimer(delay)
+	defer timer.Stop()
+
+	for {
+		// Wake on the next poll or as soon as the caller gives up,
+		// instead of sleeping through a cancellation.
+		select {
+		case <-waitCtx.Done():
+			if errors.Is(ctx.Err(), context.Canceled) {
+				return ctx.Err()
+			}
+			return fmt.Errorf("docker did not start within %v", limit)
+		case <-timer.C:
+		}
+
+		if CheckHealth(waitCtx) {
 			log.Success("Docker started successfully")
 			return nil
 		}
-		if time.Now().After(deadline) {
-			return fmt.Errorf("docker did not start within %v", timeout)
-		}
-		if elapsed%5 == 0 {
-			log.Dim(fmt.Sprintf("Waiting for Docker... (%ds)", elapsed))
+		if elapsed := time.Since(start); elapsed >= nextNotice {
+			log.Dimf("Waiting for Docker... (%ds)", int(elapsed.Seconds()))
+			nextNotice += config.DockerCheckInterval
 		}
+		delay = min(delay*3/2, startupPollMax)
+		timer.Reset(delay)
 	}
-	return fmt.Errorf("docker startup interrupted")
 }
@@ -1,6 +1,7 @@
 package docker
 
 import (
+	"archive/tar"
 	"bytes"
 	"context"
 	"fmt"
@@ -270,13 +271,67 @@ func ExtractProjectName(containerName string) string {
 	return name
 }
 
+// CopyFile writes data as a single file named name into dstDir inside the
+// container, through the Engine API rather than a forked docker cp.
+func CopyFile(ctx context.Context, containerID, dstDir, name string, data []byte, mode int64) error {
+	cli, err := NewClient()
+	if err != nil {
+		return fmt.Errorf("docker client: %w", err)
+	}
+
+	var buf bytes.Buffer
+	tw := tar.NewWriter(&buf)
+	header := &tar.Header{
+		Name: name,
+		Mode: mode,
+		Size: int64(len(data)),
+	}
+	if err := tw.WriteHeader(header); err != nil {
+		return fmt.Errorf("tar header: %w", err)
+	}
+	if _, err := tw.Write(data); err != nil {
+		return fmt.Errorf("tar write: %w", err)
+	}
+	if err := tw.Close(); err != nil {
+		return fmt.Errorf("tar close: %w", err)
+	}
+
+	if err := cli.CopyToContainer(ctx, containerID, dstDir, &buf, container.CopyToContainerOptions{}); err != nil {
+		return fmt.Errorf("copy to container: %w", err)
+	}
+	return nil
+}
+
 // Exec runs a command inside a running container and captures its output.
 // This is used by bridge mode to execute commands in the sandbox without
 // creating a new container.
 func Exec(ctx context.Context, containerID string, cmd []string) (*ExecResult, error) {
+	var stdout, stderr bytes.Buffer
+	exitCode, err := runExec(ctx, containerID, cmd, &stdout, &stderr)
+	if err != nil {
+		return nil, err
+	}
+
+	return &ExecResult{
+		ExitCode: exitCode,
+		Stdout:   stdout.String(),
+		Stderr:   stderr.String(),
+	}, nil
+}
+
+// ExecExitCode runs a command inside a running container and returns only
+// its exit code. Output is drained and discarded rather than buffered, which
+// suits status probes polled on every refresh.
+func ExecExitCode(ctx context.Context, containerID string, cmd []string) (int, error) {
+	return runExec(ctx, containerID, cmd, io.Discard, io.Discard)
+}
+
+// runExec runs cmd in the container, demultiplexing its output into stdout
+// and stderr, and returns the exit code once the command has finished.
+func runExec(ctx context.Context, containerID string, cmd []string, stdout, stderr io.Writer) (int, error) {
 	cli, err := NewClient()
 	if err != nil {
-		return nil, fmt.Errorf("docker client: %w", err)
+		return 0, fmt.Errorf("docker client: %w", err)
 	}
 
 	// Create the exec instance
@@ -288,31 +343,26 @@ func Exec(ctx context.Context, containerID string, cmd []string) (*ExecResult, e
 
 	created, err := cli.ContainerExecCreate(ctx, containerID, execCfg)
 	if err != nil {
-		return nil, fmt.Errorf("create exec: %w", err)
+		return 0, fmt.Errorf("create exec: %w", err)
 	}
 
 	// Attach to the exec instance to capture output
 	resp, err := cli.ContainerExecAttach(ctx, created.ID, container.ExecStartOptions{})
 	if err != nil {
-		return nil, fmt.Errorf("attach exec: %w", err)
+		return 0, fmt.Errorf("attach exec: %w", err)
 	}
 	defer resp.Close()
 
 	// Demultiplex stdout and stderr from the Docker stream
-	var stdout, stderr bytes.Buffer
-	if _, err := stdcopy.StdCopy(&stdout, &stderr, resp.Reader); err != nil {
-		return nil, fmt.Errorf("read exec output: %w", err)
+	if _, err := stdcopy.StdCopy(stdout, stderr, resp.Reader); err != nil {
+		return 0, fmt.Errorf("read exec output: %w", err)
 	}
 
 	// Retrieve the exit code from the completed exec
 	inspect, err := cli.ContainerExecInspect(ctx, created.ID)
 	if err != nil {
-		return nil, fmt.Errorf("inspect exec: %w", err)
+		return 0, fmt.Errorf("inspect exec: %w", err)
 	}
 
-	return &ExecResult{
-		ExitCode: inspect.ExitCode,
-		Stdout:   stdout.String(),
-		Stderr:   stderr.String(),
-	}, nil
+	return inspect.ExitCode, nil
 }
@@ -13,9 +13,13 @@ ENV HOME=/root
 
 # System packages - runtime only (no build deps needed - FUSE binary is pre-compiled)
 # Note: passwd provides useradd/groupadd (needed on minimal images like eclipse-temurin)
+# apt caches are BuildKit cache mounts: package lists and .debs persist
+# across builds (docker-clean would delete the .debs) and never enter a layer
 RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
     --mount=type=cache,target=/var/lib/apt,sharing=locked \
-    apt-get update && apt-get install -y --no-install-recommends \
+    rm -f /etc/apt/apt.conf.d/docker-clean \
+    && echo 'Binary::apt::APT::Keep-Downloaded-Packages "true";' > /etc/apt/apt.conf.d/keep-cache \
+    && apt-get update && apt-get install -y --no-install-recommends \
     # Essential runtime
     git curl ca-certificates bash openssh-client locales gosu passwd \
     # Search tools
@@ -28,7 +32,6 @@ RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
     tmux \
     # Core utilities (grep/sed/findutils come with base image)
     procps unzip make tree zip file patch wget vim-tiny \
-    && rm -rf /var/lib/apt/lists/* \
     # Locale setup
     && sed -i '/en_US.UTF-8/s/^# //g' /etc/locale.gen && locale-gen \
     # Create fd symlink (Debian package installs as fdfind)
@@ -128,9 +131,10 @@ RUN if [ "$TARGETARCH" = "arm64" ]; then \
 // pythonToolsBase installs Python dev tools (uv, ruff, mypy, pytest).
 const pythonToolsBase = `
 # Python 3 runtime
-RUN apt-get update && apt-get install -y --no-install-recommends \
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
     python3 python3-pip python3-venv \
-    && rm -rf /var/lib/apt/lists/* \
     && ln -sf /usr/bin/python3 /usr/local/bin/python
 
 # uv (ultra-fast Python package manager - 10-100x faster than pip)
@@ -141,14 +145,16 @@ RUN curl -LsSf https://astral.sh/uv/install.sh | sh \
     && chmod 755 /usr/local/bin/uv /usr/local/bin/uvx
 
 # ruff (Rust binary - standalone, no Python runtime needed)
-RUN uv tool install ruff \
+RUN --mount=type=cache,target=/tmp/.uv \
+    UV_LINK_MODE=copy uv tool install ruff \
     && cp /root/.local/bin/ruff /usr/local/bin/ruff \
     && chmod 755 /usr/local/bin/ruff \
     && rm -rf /root/.local
 
 # mypy and pytest - system-wide install (uses /usr/bin/python3)
 # UV_BREAK_SYSTEM_PACKAGES bypasses PEP 668 externally-managed-environment check
-RUN UV_BREAK_SYSTEM_PACKAGES=1 uv pip install --system mypy pytest
+RUN --mount=type=cache,target=/tmp/.uv \
+    UV_LINK_MODE=copy UV_BREAK_SYSTEM_PACKAGES=1 uv pip install --system mypy pytest
 
 # Disable runtime bytecode generation (SSD wear reduction)
 ENV PYTHONDONTWRITEBYTECODE=1
@@ -254,11 +260,11 @@ ENV TZ="${TZ}"
 
 ENV DEBIAN_FRONTEND=noninteractive
 ` + commonTools + fuseBuild + fakepathBuild + claudeCodeInstall + `
-# Maven (latest from Apache)
-RUN set -eux; \
-    MVN_VER=$(curl -sfL https://api.github.com/repos/apache/maven/releases/latest | jq -r .tag_name | sed 's/maven-//'); \
-    curl -sfL "https://archive.apache.org/dist/maven/maven-3/${MVN_VER}/binaries/apache-maven-${MVN_VER}-bin.tar.gz" | tar -xz -C /opt; \
-    ln -s /opt/apache-maven-${MVN_VER}/bin/mvn /usr/local/bin/mvn
+# Maven (latest 3.x) - copied from the official image instead of downloaded
+# in a RUN step, so it is cached by image digest independently of the layers
+# above and a rebuild never re-fetches the tarball
+COPY --from=maven:3-eclipse-temurin-21 /usr/share/maven /opt/maven
+RUN ln -s /opt/maven/bin/mvn /usr/local/bin/mvn
 
 # Java quality tools (google-java-format for formatting, checkstyle for linting)
 RUN GJF_VER=$(curl -sfL https://api.github.com/repos/google/google-java-format/releases/latest | jq -r .tag_name | sed 's/v//') \
@@ -287,10 +293,10 @@ RUN ARCH=$(dpkg --print-architecture | sed 's/amd64/x64/;s/arm64/arm64/') \
 
 # pnpm (via updated corepack to fix signature verification)
 # Corepack 0.31.0+ required for npm key rotation compatibility
-RUN npm install -g corepack@latest \
+RUN --mount=type=cache,target=/tmp/.npm \
+    npm install -g corepack@latest \
     && corepack enable \
-    && corepack prepare pnpm@latest --activate \
-    && npm cache clean --force
+    && corepack prepare pnpm@latest --activate
 
 # Bun (fast JavaScript runtime) - install then copy to /usr/local/bin
 # HOME=/root is set in base, so installer will use /root/.bun
@@ -300,8 +306,8 @@ RUN curl -fsSL https://bun.sh/install | bash \
     && rm -rf /root/.bun
 
 # Node.js/TypeScript dev tools (typescript, eslint, vitest, prettier)
-RUN npm install -g typescript eslint vitest prettier @types/node \
-    && npm cache clean --force
+RUN --mount=type=cache,target=/tmp/.npm \
+    npm install -g typescript eslint vitest prettier @types/node
 `
 }
 
@@ -312,13 +318,15 @@ FROM ccbox_base:latest
 LABEL org.opencontainers.image.title="ccbox/cpp"
 
 # C++ toolchain + CMake + Ninja + Python (needed for Conan)
-RUN apt-get update && apt-get install -y --no-install-recommends \
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
     build-essential cmake ninja-build clang clang-format clang-tidy \
-    python3 python3-pip \
-    && rm -rf /var/lib/apt/lists/*
+    python3 python3-pip
 
 # Conan (C++ package manager)
-RUN pip3 install --break-system-packages conan
+RUN --mount=type=cache,target=/tmp/.pip \
+    pip3 install --break-system-packages conan
 `
 }
 
@@ -329,8 +337,9 @@ FROM ccbox_base:latest
 LABEL org.opencontainers.image.title="ccbox/dotnet"
 
 # ICU libraries (required by .NET for globalization)
-RUN apt-get update && apt-get install -y --no-install-recommends libicu-dev \
-    && rm -rf /var/lib/apt/lists/*
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends libicu-dev
 
 # .NET SDK (latest LTS) - includes built-in tools: dotnet format, dotnet test
 RUN curl -fsSL https://dot.net/v1/dotnet-install.sh | bash -s -- --channel LTS --install-dir /usr/share/dotnet \
@@ -399,9 +408,10 @@ FROM ccbox_base:latest
 LABEL org.opencontainers.image.title="ccbox/lua"
 
 # Lua + LuaRocks
-RUN apt-get update && apt-get install -y --no-install-recommends \
-    lua5.4 liblua5.4-dev luarocks \
-    && rm -rf /var/lib/apt/lists/*
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
+    lua5.4 liblua5.4-dev luarocks
 
 # Lua quality tools (luacheck for linting, lua-formatter for formatting)
 RUN luarocks install luacheck \
@@ -442,9 +452,10 @@ FROM ccbox_base:latest
 LABEL org.opencontainers.image.title="ccbox/functional"
 
 # Build tools needed for GHC compilation
-RUN apt-get update && apt-get install -y --no-install-recommends \
-    build-essential libgmp-dev libnuma-dev libffi-dev \
-    && rm -rf /var/lib/apt/lists/*
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
+    build-essential libgmp-dev libnuma-dev libffi-dev
 
 # GHCup (manages GHC, Stack, Cabal for Haskell)
 # Install to /opt/ghcup instead of ~/.ghcup for non-root access
@@ -462,15 +473,17 @@ RUN curl --proto '=https' --tlsv1.2 -sSf https://get-ghcup.haskell.org | \
     && rm -rf /opt/.ghcup/cache /opt/.ghcup/tmp
 
 # opam (OCaml package manager) - use system opam, configure for non-root
-RUN apt-get update && apt-get install -y --no-install-recommends \
-    opam bubblewrap \
-    && rm -rf /var/lib/apt/lists/*
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
+    opam bubblewrap
 # Note: opam init should be run by user at runtime, not during build
 
 # Erlang + Elixir
-RUN apt-get update && apt-get install -y --no-install-recommends \
-    erlang elixir \
-    && rm -rf /var/lib/apt/lists/*
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
+    erlang elixir
 # Note: mix local.hex/rebar should be run by user at runtime
 `
 }
@@ -483,15 +496,17 @@ LABEL org.opencontainers.image.title="ccbox/scripting"
 
 # Ruby + Bundler + quality tools (rubocop for linting/formatting)
 # build-essential needed for native gem extensions (rubocop depends on them)
-RUN apt-get update && apt-get install -y --no-install-recommends \
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
     ruby ruby-dev ruby-bundler build-essential \
-    && rm -rf /var/lib/apt/lists/* \
     && gem install bundler rubocop --no-document
 
 # PHP + common extensions + Composer + quality tools (php-cs-fixer, phpstan)
-RUN apt-get update && apt-get install -y --no-install-recommends \
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
     php php-cli php-common php-curl php-json php-mbstring php-xml php-zip \
-    && rm -rf /var/lib/apt/lists/* \
     && curl -sS https://getcomposer.org/installer | php -- --install-dir=/usr/local/bin --filename=composer \
     && curl -L https://cs.symfony.com/download/php-cs-fixer-v3.phar -o /usr/local/bin/php-cs-fixer \
     && chmod +x /usr/local/bin/php-cs-fixer \
@@ -499,9 +514,10 @@ RUN apt-get update && apt-get install -y --no-install-recommends \
     && chmod +x /usr/local/bin/phpstan
 
 # Perl + cpanminus + quality tools (Perl::Critic, Perl::Tidy)
-RUN apt-get update && apt-get install -y --no-install-recommends \
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
     perl cpanminus liblocal-lib-perl \
-    && rm -rf /var/lib/apt/lists/* \
     && cpanm --notest Perl::Critic Perl::Tidy 2>/dev/null || true
 `
 }
@@ -540,9 +556,10 @@ FROM ccbox_python:latest
 LABEL org.opencontainers.image.title="ccbox/data"
 
 # R + common packages
-RUN apt-get update && apt-get install -y --no-install-recommends \
-    r-base r-base-dev \
-    && rm -rf /var/lib/apt/lists/*
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
+    r-base r-base-dev
 
 # Julia (latest stable) - dynamic version from julialang.org API
 # Note: Path uses x64/aarch64 but filename uses x86_64/aarch64
@@ -564,17 +581,20 @@ LABEL org.opencontainers.image.title="ccbox/ai"
 
 # Jupyter + core ML libraries
 # Using uv for faster installation
-RUN UV_BREAK_SYSTEM_PACKAGES=1 uv pip install --system \
+RUN --mount=type=cache,target=/tmp/.uv \
+    UV_LINK_MODE=copy UV_BREAK_SYSTEM_PACKAGES=1 uv pip install --system \
     jupyter jupyterlab notebook \
     numpy pandas scipy matplotlib seaborn \
     scikit-learn \
     && python -m compileall -q /usr/local/lib/python*/dist-packages 2>/dev/null || true
 
 # PyTorch (CPU version - GPU requires nvidia-docker)
-RUN UV_BREAK_SYSTEM_PACKAGES=1 uv pip install --system torch torchvision torchaudio --index-url https://download.pytorch.org/whl/cpu
+RUN --mount=type=cache,target=/tmp/.uv \
+    UV_LINK_MODE=copy UV_BREAK_SYSTEM_PACKAGES=1 uv pip install --system torch torchvision torchaudio --index-url https://download.pytorch.org/whl/cpu
 
 # TensorFlow (CPU version)
-RUN UV_BREAK_SYSTEM_PACKAGES=1 uv pip install --system tensorflow \
+RUN --mount=type=cache,target=/tmp/.uv \
+    UV_LINK_MODE=copy UV_BREAK_SYSTEM_PACKAGES=1 uv pip install --system tensorflow \
     && rm -rf /root/.cache/uv /root/.cache/pip
 `
 }
@@ -595,10 +615,11 @@ ENV PATH="/opt/flutter/bin:$PATH"
 
 # Android command-line tools (for flutter doctor)
 # Create man directory first (required by openjdk post-install with --no-install-recommends)
-RUN mkdir -p /usr/share/man/man1 \
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    mkdir -p /usr/share/man/man1 \
     && apt-get update && apt-get install -y --no-install-recommends \
-    openjdk-17-jdk-headless \
-    && rm -rf /var/lib/apt/lists/*
+    openjdk-17-jdk-headless
 ENV JAVA_HOME=/usr/lib/jvm/java-17-openjdk-amd64
 `
 }
@@ -611,16 +632,18 @@ FROM ccbox_cpp:latest
 LABEL org.opencontainers.image.title="ccbox/game"
 
 # SDL2 + OpenGL development libraries
-RUN apt-get update && apt-get install -y --no-install-recommends \
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
     libsdl2-dev libsdl2-image-dev libsdl2-mixer-dev libsdl2-ttf-dev \
     libglew-dev libglm-dev libglfw3-dev \
-    libopenal-dev libfreetype-dev \
-    && rm -rf /var/lib/apt/lists/*
+    libopenal-dev libfreetype-dev
 
 # Lua + LuaRocks (for game scripting)
-RUN apt-get update && apt-get install -y --no-install-recommends \
-    lua5.4 liblua5.4-dev luarocks \
-    && rm -rf /var/lib/apt/lists/*
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
+    lua5.4 liblua5.4-dev luarocks
 `
 }
 
@@ -634,9 +657,10 @@ LABEL org.opencontainers.image.title="ccbox/fullstack"
 ` + pythonToolsBase + `
 
 # Database clients (PostgreSQL, MySQL, SQLite) + Redis CLI
-RUN apt-get update && apt-get install -y --no-install-recommends \
-    postgresql-client default-mysql-client sqlite3 redis-tools \
-    && rm -rf /var/lib/apt/lists/*
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get update && apt-get install -y --no-install-recommends \
+    postgresql-client default-mysql-client sqlite3 redis-tools
 `
 }
 
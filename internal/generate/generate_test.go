@@ -1,10 +1,14 @@
 package generate
 
 import (
+	"os"
+	"path/filepath"
 	"strings"
 	"testing"
+	"time"
 
 	"github.com/sungur/ccbox/internal/config"
+	"github.com/sungur/ccbox/internal/detect"
 )
 
 func TestExtractBinaryName(t *testing.T) {
@@ -113,3 +117,72 @@ func TestGuardedBinaries(t *testing.T) {
 		}
 	}
 }
+
+func TestWriteFileIfChanged(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "Dockerfile")
+
+	if err := writeFileIfChanged(path, []byte("FROM a\n"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+
+	// Identical content must leave the existing file untouched.
+	old := time.Now().Add(-time.Hour)
+	if err := os.Chtimes(path, old, old); err != nil {
+		t.Fatal(err)
+	}
+	if err := writeFileIfChanged(path, []byte("FROM a\n"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	if info, err := os.Stat(path); err != nil || !info.ModTime().Equal(old) {
+		t.Errorf("unchanged content should not be rewritten (err=%v)", err)
+	}
+
+	// Same size, different content must be rewritten.
+	if err := writeFileIfChanged(path, []byte("FROM b\n"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	if got, _ := os.ReadFile(path); string(got) != "FROM b\n" {
+		t.Errorf("content = %q, want %q", got, "FROM b\n")
+	}
+
+	// Identical content with a different mode gets its permissions fixed.
+	if err := writeFileIfChanged(path, []byte("FROM b\n"), 0o755); err != nil {
+		t.Fatal(err)
+	}
+	if info, err := os.Stat(path); err != nil || info.Mode().Perm() != 0o755 {
+		t.Errorf("mode should be updated to 0755 (err=%v)", err)
+	}
+}
+
+func TestGenerateProjectDockerfile(t *testing.T) {
+	dir := t.TempDir()
+	for _, f := range []string{"package.json", "go.mod"} {
+		if err := os.WriteFile(filepath.Join(dir, f), []byte("{}"), 0o644); err != nil {
+			t.Fatal(err)
+		}
+	}
+	// A dangling symlink is not an existing dependency file
+	_ = os.Symlink(filepath.Join(dir, "missing"), filepath.Join(dir, "yarn.lock"))
+	deps := []detect.DepsInfo{{Name: "npm", Files: []string{"package.json", "*.lock"}, InstallAll: "npm install"}}
+
+	got := GenerateProjectDockerfile("ccbox_base:latest", deps, detect.DepsModeAll, dir)
+	want := `# Project-specific image with dependencies
+FROM ccbox_base:latest
+
+USER root
+WORKDIR /tmp/deps
+
+# Copy dependency files
+COPY go.mod ./
+COPY package.json ./
+
+# Install dependencies (skip if runtime not available in stack)
+RUN which npm >/dev/null 2>&1 && npm install || echo "Skipping npm (not in stack)"
+
+# Return to project directory (entrypoint will handle user switching via gosu)
+WORKDIR /ccbox
+`
+	if got != want {
+		t.Errorf("GenerateProjectDockerfile() =\n%s\nwant:\n%s", got, want)
+	}
+}
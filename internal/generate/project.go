@@ -2,8 +2,10 @@ package generate
 
 import (
 	"fmt"
+	"io/fs"
 	"os"
 	"path/filepath"
+	"runtime"
 	"sort"
 	"strings"
 
@@ -22,20 +24,24 @@ var guardedBinaries = map[string]bool{
 	"gem": true, "bundle": true, "bundler": true, "composer": true, "mvn": true, "gradle": true, "sbt": true,
 }
 
+// commonDepFiles are dependency files copied into the project image whenever
+// they exist, regardless of which package managers were detected.
+var commonDepFiles = []string{
+	"pyproject.toml", "setup.py", "setup.cfg",
+	"package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml",
+	"go.mod", "go.sum",
+	"Cargo.toml", "Cargo.lock",
+	"Gemfile", "Gemfile.lock",
+	"composer.json", "composer.lock",
+}
+
 // GenerateProjectDockerfile generates a project-specific Dockerfile with dependencies.
 func GenerateProjectDockerfile(baseImage string, depsList []detect.DepsInfo, depsMode detect.DepsMode, projectPath string) string {
-	var lines []string
-	lines = append(lines,
-		"# Project-specific image with dependencies",
-		fmt.Sprintf("FROM %s", baseImage),
-		"",
-		"USER root",
-		"WORKDIR /tmp/deps",
-		"",
-	)
-
-	// Collect candidate dependency files
-	candidateFiles := make(map[string]bool)
+	// Collect candidate dependency files, starting from the common ones
+	candidateFiles := make(map[string]bool, len(commonDepFiles)+2*len(depsList))
+	for _, f := range commonDepFiles {
+		candidateFiles[f] = true
+	}
 	for _, deps := range depsList {
 		for _, f := range deps.Files {
 			if !strings.Contains(f, "*") {
@@ -44,62 +50,88 @@ func GenerateProjectDockerfile(baseImage string, depsList []detect.DepsInfo, dep
 		}
 	}
 
-	// Add common dependency files
-	commonFiles := []string{
-		"pyproject.toml", "setup.py", "setup.cfg",
-		"package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml",
-		"go.mod", "go.sum",
-		"Cargo.toml", "Cargo.lock",
-		"Gemfile", "Gemfile.lock",
-		"composer.json", "composer.lock",
+	// Filter to only files that actually exist, using one directory read
+	// instead of a stat per candidate
+	var existingFiles []string
+	entries := make(map[string]fs.DirEntry)
+	// macOS and Windows filesystems are usually case-insensitive, where
+	// os.Stat finds "Gemfile" as "gemfile"; keep that behavior there.
+	var folded map[string]bool
+	if runtime.GOOS == "darwin" || runtime.GOOS == "windows" {
+		folded = make(map[string]bool)
 	}
-	for _, f := range commonFiles {
-		candidateFiles[f] = true
+	if list, err := os.ReadDir(projectPath); err == nil {
+		for _, e := range list {
+			entries[e.Name()] = e
+			if folded != nil {
+				folded[strings.ToLower(e.Name())] = true
+			}
+		}
 	}
-
-	// Filter to only files that actually exist
-	var existingFiles []string
 	for f := range candidateFiles {
-		if _, err := os.Stat(filepath.Join(projectPath, f)); err == nil {
-			existingFiles = append(existingFiles, f)
+		if strings.ContainsAny(f, `/\`) {
+			if _, err := os.Stat(filepath.Join(projectPath, f)); err == nil {
+				existingFiles = append(existingFiles, f)
+			}
+			continue
 		}
+		e, ok := entries[f]
+		if !ok {
+			// A case-only mismatch is confirmed with os.Stat, which
+			// answers according to the filesystem's case sensitivity.
+			if folded[strings.ToLower(f)] {
+				if _, err := os.Stat(filepath.Join(projectPath, f)); err == nil {
+					existingFiles = append(existingFiles, f)
+				}
+			}
+			continue
+		}
+		// Symlinks only count when their target exists, as with os.Stat
+		if e.Type()&fs.ModeSymlink != 0 {
+			if _, err := os.Stat(filepath.Join(projectPath, f)); err != nil {
+				continue
+			}
+		}
+		existingFiles = append(existingFiles, f)
 	}
 	sort.Strings(existingFiles)
 
+	// Get install commands
+	installCmds := detect.GetInstallCommands(depsList, depsMode)
+
+	// Build the Dockerfile in one buffer rather than joining a line slice.
+	var b strings.Builder
+	b.Grow(512 + 32*len(existingFiles) + 128*len(installCmds))
+	b.WriteString("# Project-specific image with dependencies\nFROM ")
+	b.WriteString(baseImage)
+	b.WriteString("\n\nUSER root\nWORKDIR /tmp/deps\n\n")
+
 	// Copy only existing dependency files
 	if len(existingFiles) > 0 {
-		lines = append(lines, "# Copy dependency files")
+		b.WriteString("# Copy dependency files\n")
 		for _, f := range existingFiles {
-			lines = append(lines, fmt.Sprintf("COPY %s ./", f))
+			b.WriteString("COPY " + f + " ./\n")
 		}
 	}
 
-	lines = append(lines, "")
-
-	// Get install commands
-	installCmds := detect.GetInstallCommands(depsList, depsMode)
+	b.WriteString("\n")
 
 	if len(installCmds) > 0 {
-		lines = append(lines, "# Install dependencies (skip if runtime not available in stack)")
+		b.WriteString("# Install dependencies (skip if runtime not available in stack)\n")
 		for _, cmd := range installCmds {
 			// Extract the binary name from the command
 			binary := extractBinaryName(cmd)
 			if guardedBinaries[binary] {
-				lines = append(lines, fmt.Sprintf(`RUN which %s >/dev/null 2>&1 && %s || echo "Skipping %s (not in stack)"`, binary, cmd, binary))
+				fmt.Fprintf(&b, "RUN which %s >/dev/null 2>&1 && %s || echo \"Skipping %s (not in stack)\"\n", binary, cmd, binary)
 			} else {
-				lines = append(lines, fmt.Sprintf("RUN %s", cmd))
+				b.WriteString("RUN " + cmd + "\n")
 			}
 		}
 	}
 
-	lines = append(lines,
-		"",
-		"# Return to project directory (entrypoint will handle user switching via gosu)",
-		"WORKDIR /ccbox",
-		"",
-	)
+	b.WriteString("\n# Return to project directory (entrypoint will handle user switching via gosu)\nWORKDIR /ccbox\n")
 
-	return strings.Join(lines, "\n")
+	return b.String()
 }
 
 // extractBinaryName extracts the first binary/command name from a shell command string.
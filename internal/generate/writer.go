@@ -1,44 +1,17 @@
 package generate
 
 import (
+	"bytes"
 	"os"
 	"path/filepath"
+	"sync"
 
 	"github.com/sungur/ccbox/embedded"
 	"github.com/sungur/ccbox/internal/config"
 )
 
-// WriteBuildFiles writes Dockerfile, entrypoint, and native binaries
-// to a temporary build directory for Docker image building.
-// Returns the build directory path.
-func WriteBuildFiles(stack config.LanguageStack) (string, error) {
-	buildDir := config.GetCcboxTempBuild(string(stack))
-	if err := os.MkdirAll(buildDir, 0o755); err != nil {
-		return "", err
-	}
-
-	// Generate and write Dockerfile (Unix line endings)
-	dockerfile := GenerateDockerfile(stack)
-	if err := os.WriteFile(filepath.Join(buildDir, "Dockerfile"), []byte(dockerfile), 0o644); err != nil {
-		return "", err
-	}
-
-	// Generate and write entrypoint.sh
-	entrypoint := GenerateEntrypoint()
-	if err := os.WriteFile(filepath.Join(buildDir, "entrypoint.sh"), []byte(entrypoint), 0o755); err != nil {
-		return "", err
-	}
-
-	// Write pre-compiled FUSE binaries (both architectures, Docker selects at build time)
-	if err := os.WriteFile(filepath.Join(buildDir, "ccbox-fuse-amd64"), embedded.FuseAmd64, 0o755); err != nil {
-		return "", err
-	}
-	if err := os.WriteFile(filepath.Join(buildDir, "ccbox-fuse-arm64"), embedded.FuseArm64, 0o755); err != nil {
-		return "", err
-	}
-
-	// Write architecture selector script
-	archSelector := `#!/bin/sh
+// archSelector picks the FUSE binary matching the build architecture.
+const archSelector = `#!/bin/sh
 # Select correct binary based on architecture
 ARCH=${TARGETARCH:-amd64}
 if [ "$ARCH" = "arm64" ]; then
@@ -48,22 +21,72 @@ else
 fi
 chmod 755 /usr/local/bin/ccbox-fuse
 `
-	if err := os.WriteFile(filepath.Join(buildDir, "install-fuse.sh"), []byte(archSelector), 0o755); err != nil {
-		return "", err
-	}
 
-	// Write pre-compiled fakepath.so binaries
-	if err := os.WriteFile(filepath.Join(buildDir, "fakepath-amd64.so"), embedded.FakepathAmd64, 0o755); err != nil {
+// buildFile is one file of a stack's build context.
+type buildFile struct {
+	name string
+	data []byte
+	mode os.FileMode
+}
+
+// WriteBuildFiles writes Dockerfile, entrypoint, and native binaries
+// to a temporary build directory for Docker image building.
+// Returns the build directory path.
+//
+// The files are independent, so they are written concurrently, and files
+// left over from a previous build with identical content are not rewritten
+// (the native binaries are several MB each).
+func WriteBuildFiles(stack config.LanguageStack) (string, error) {
+	buildDir := config.GetCcboxTempBuild(string(stack))
+	if err := os.MkdirAll(buildDir, 0o755); err != nil {
 		return "", err
 	}
-	if err := os.WriteFile(filepath.Join(buildDir, "fakepath-arm64.so"), embedded.FakepathArm64, 0o755); err != nil {
-		return "", err
+
+	files := []buildFile{
+		// Dockerfile (Unix line endings)
+		{"Dockerfile", []byte(GenerateDockerfile(stack)), 0o644},
+		{"entrypoint.sh", embedded.EntrypointSh, 0o755},
+		// Pre-compiled FUSE binaries (both architectures, Docker selects at build time)
+		{"ccbox-fuse-amd64", embedded.FuseAmd64, 0o755},
+		{"ccbox-fuse-arm64", embedded.FuseArm64, 0o755},
+		{"install-fuse.sh", []byte(archSelector), 0o755},
+		// Pre-compiled fakepath.so binaries
+		{"fakepath-amd64.so", embedded.FakepathAmd64, 0o755},
+		{"fakepath-arm64.so", embedded.FakepathArm64, 0o755},
+		// fakepath.c source for in-container source builds if needed
+		{"fakepath.c", embedded.FakepathSource, 0o644},
 	}
 
-	// Write fakepath.c source for in-container source builds if needed
-	if err := os.WriteFile(filepath.Join(buildDir, "fakepath.c"), embedded.FakepathSource, 0o644); err != nil {
-		return "", err
+	errs := make([]error, len(files))
+	var wg sync.WaitGroup
+	for i, f := range files {
+		wg.Add(1)
+		go func(i int, f buildFile) {
+			defer wg.Done()
+			errs[i] = writeFileIfChanged(filepath.Join(buildDir, f.name), f.data, f.mode)
+		}(i, f)
 	}
+	wg.Wait()
 
+	for _, err := range errs {
+		if err != nil {
+			return "", err
+		}
+	}
 	return buildDir, nil
 }
+
+// writeFileIfChanged writes data to path unless the file already holds
+// exactly that content. Only a same-size file is read back for comparison;
+// an unchanged file whose permissions differ from mode is chmod'ed.
+func writeFileIfChanged(path string, data []byte, mode os.FileMode) error {
+	if info, err := os.Stat(path); err == nil && info.Mode().IsRegular() && info.Size() == int64(len(data)) {
+		if existing, err := os.ReadFile(path); err == nil && bytes.Equal(existing, data) {
+			if info.Mode().Perm() != mode {
+				return os.Chmod(path, mode)
+			}
+			return nil
+		}
+	}
+	return os.WriteFile(path, data, mode)
+}
@@ -7,6 +7,7 @@ import (
 	"os"
 	"os/exec"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/sungur/ccbox/internal/log"
@@ -22,7 +23,14 @@ type Credentials struct {
 	Email string
 }
 
-// GetCredentials retrieves git credentials from the host system.
+var (
+	cachedCreds Credentials
+	credsOnce   sync.Once
+)
+
+// GetCredentials retrieves git credentials from the host system. The lookup
+// shells out to gh and git, so the result is computed once and reused for
+// the lifetime of the process.
 //
 // Priority for token:
 //  1. GITHUB_TOKEN or GH_TOKEN environment variable
@@ -33,6 +41,14 @@ type Credentials struct {
 //  1. GitHub API via gh CLI (most accurate)
 //  2. git config user.name/email (fallback)
 func GetCredentials() Credentials {
+	credsOnce.Do(func() {
+		cachedCreds = loadCredentials()
+	})
+	return cachedCreds
+}
+
+// loadCredentials performs the uncached credential lookup for GetCredentials.
+func loadCredentials() Credentials {
 	var creds Credentials
 	ghAvailable := false
 
@@ -82,8 +98,7 @@ func GetCredentials() Credentials {
 
 	// 5. Fallback to git config for identity
 	if creds.Name == "" || creds.Email == "" {
-		name := getGitConfigValue("user.name")
-		email := getGitConfigValue("user.email")
+		name, email := getGitConfigIdentity()
 		if creds.Name == "" && name != "" {
 			creds.Name = name
 		}
@@ -98,26 +113,79 @@ func GetCredentials() Credentials {
 	return creds
 }
 
-// getGitConfigValue retrieves a single git config value.
-// Returns empty string on any error.
-func getGitConfigValue(key string) string {
+// getGitConfigIdentity returns user.name and user.email from the global git
+// config, read with a single git subprocess.
+func getGitConfigIdentity() (name, email string) {
+	values := getGlobalGitConfig()
+	return values["user.name"], values["user.email"]
+}
+
+var (
+	toolPathsMu sync.Mutex
+	toolPaths   = map[string]string{}
+)
+
+// toolPath resolves a helper binary on PATH once per process. An empty
+// result means the tool is not installed and callers should skip it.
+func toolPath(name string) string {
+	toolPathsMu.Lock()
+	defer toolPathsMu.Unlock()
+
+	path, ok := toolPaths[name]
+	if !ok {
+		path, _ = exec.LookPath(name)
+		toolPaths[name] = path
+	}
+	return path
+}
+
+// getGlobalGitConfig reads the whole global git config with a single
+// "git config --global --list -z" call, so several keys cost one subprocess.
+// Values are sanitized for use in environment variables. Returns an empty
+// map on any error.
+func getGlobalGitConfig() map[string]string {
+	bin := toolPath("git")
+	if bin == "" {
+		return map[string]string{}
+	}
+
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
 	defer cancel()
 
-	cmd := exec.CommandContext(ctx, "git", "config", "--global", key)
+	cmd := exec.CommandContext(ctx, bin, "config", "--global", "--list", "-z")
 	out, err := cmd.Output()
 	if err != nil {
-		return ""
+		return map[string]string{}
 	}
-	return sanitizeEnvValue(strings.TrimSpace(string(out)))
+	return parseGitConfigList(string(out))
+}
+
+// parseGitConfigList parses "git config --list -z" output: NUL-terminated
+// records of the form "key\nvalue" (a key with no value has no newline).
+// Later entries win, matching git's own lookup for multi-valued keys.
+func parseGitConfigList(out string) map[string]string {
+	values := make(map[string]string)
+	for _, record := range strings.Split(out, "\x00") {
+		if record == "" {
+			continue
+		}
+		key, value, _ := strings.Cut(record, "\n")
+		values[key] = sanitizeEnvValue(value)
+	}
+	return values
 }
 
 // getGHAuthToken retrieves a GitHub token from the gh CLI.
 func getGHAuthToken() (string, bool) {
+	bin := toolPath("gh")
+	if bin == "" {
+		return "", false
+	}
+
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
 	defer cancel()
 
-	cmd := exec.CommandContext(ctx, "gh", "auth", "token")
+	cmd := exec.CommandContext(ctx, bin, "auth", "token")
 	out, err := cmd.Output()
 	if err != nil {
 		return "", false
@@ -131,10 +199,15 @@ func getGHAuthToken() (string, bool) {
 
 // getGHIdentity retrieves name and email from the GitHub API via gh CLI.
 func getGHIdentity() (name, email string, ok bool) {
+	bin := toolPath("gh")
+	if bin == "" {
+		return "", "", false
+	}
+
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
 	defer cancel()
 
-	cmd := exec.CommandContext(ctx, "gh", "api", "user", "--jq", ".name, .email")
+	cmd := exec.CommandContext(ctx, bin, "api", "user", "--jq", ".name, .email")
 	out, err := cmd.Output()
 	if err != nil {
 		return "", "", false
@@ -153,10 +226,15 @@ func getGHIdentity() (name, email string, ok bool) {
 // getGitCredentialToken retrieves a GitHub token from the git credential helper.
 // Uses the git credential fill command with stdin input.
 func getGitCredentialToken() (string, bool) {
+	bin := toolPath("git")
+	if bin == "" {
+		return "", false
+	}
+
 	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
 	defer cancel()
 
-	cmd := exec.CommandContext(ctx, "git", "credential", "fill")
+	cmd := exec.CommandContext(ctx, bin, "credential", "fill")
 	cmd.Stdin = strings.NewReader("protocol=https\nhost=github.com\n\n")
 
 	var stdout bytes.Buffer
@@ -1,6 +1,9 @@
 package git
 
 import (
+	"os"
+	"os/exec"
+	"path/filepath"
 	"testing"
 )
 
@@ -28,3 +31,55 @@ func TestSanitizeEnvValue(t *testing.T) {
 		})
 	}
 }
+
+func TestParseGitConfigList(t *testing.T) {
+	out := "user.name\nJane Doe\x00user.email\njane@example.com\x00core.bare\x00" +
+		"alias.lg\nlog --graph\nline two\x00user.name\nJane Q. Doe\x00"
+
+	got := parseGitConfigList(out)
+
+	tests := []struct {
+		key  string
+		want string
+	}{
+		{"user.name", "Jane Q. Doe"},
+		{"user.email", "jane@example.com"},
+		{"core.bare", ""},
+		{"alias.lg", "log --graph line two"},
+	}
+	for _, tt := range tests {
+		if got[tt.key] != tt.want {
+			t.Errorf("parseGitConfigList()[%q] = %q, want %q", tt.key, got[tt.key], tt.want)
+		}
+	}
+
+	if len(parseGitConfigList("")) != 0 {
+		t.Error("parseGitConfigList(\"\") should return an empty map")
+	}
+}
+
+func TestGetGitConfigIdentityRereadsConfig(t *testing.T) {
+	if _, err := exec.LookPath("git"); err != nil {
+		t.Skip("git not installed")
+	}
+
+	gitconfig := filepath.Join(t.TempDir(), "gitconfig")
+	t.Setenv("GIT_CONFIG_GLOBAL", gitconfig)
+
+	if err := os.WriteFile(gitconfig, []byte("[user]\n\tname = First Name\n\temail = first@example.com\n"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+	name, email := getGitConfigIdentity()
+	if name != "First Name" || email != "first@example.com" {
+		t.Errorf("getGitConfigIdentity() = (%q, %q), want first identity", name, email)
+	}
+
+	// A changed global config must be picked up, not served from a cache
+	if err := os.WriteFile(gitconfig, []byte("[user]\n\tname = Second Name\n\temail = second@example.com\n"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+	name, email = getGitConfigIdentity()
+	if name != "Second Name" || email != "second@example.com" {
+		t.Errorf("getGitConfigIdentity() = (%q, %q), want changed identity", name, email)
+	}
+}
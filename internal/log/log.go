@@ -201,6 +201,14 @@ func Dim(message string) {
 	}
 }
 
+// Dimf outputs a formatted subtle/dim message. Formatting is skipped
+// entirely when info output is suppressed.
+func Dimf(format string, args ...any) {
+	if canOutput(LevelInfo) {
+		Dim(fmt.Sprintf(format, args...))
+	}
+}
+
 // Bold outputs a bold/emphasized message (info level).
 func Bold(message string) {
 	if canOutput(LevelInfo) {
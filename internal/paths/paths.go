@@ -12,6 +12,7 @@ import (
 	"regexp"
 	"runtime"
 	"strings"
+	"sync"
 	"unicode/utf8"
 
 	"golang.org/x/text/unicode/norm"
@@ -236,13 +237,23 @@ func ValidateProjectPath(path string) (string, error) {
 	return projectPath, nil
 }
 
+var (
+	claudeConfigDir     string
+	claudeConfigDirOnce sync.Once
+)
+
 // GetClaudeConfigDir returns the default Claude config directory path (~/.claude).
+// The home directory does not change during a run, so the result is cached.
 func GetClaudeConfigDir() string {
-	home, err := os.UserHomeDir()
-	if err != nil {
-		return filepath.Join(".", ".claude")
-	}
-	return filepath.Join(home, ".claude")
+	claudeConfigDirOnce.Do(func() {
+		home, err := os.UserHomeDir()
+		if err != nil {
+			claudeConfigDir = filepath.Join(".", ".claude")
+			return
+		}
+		claudeConfigDir = filepath.Join(home, ".claude")
+	})
+	return claudeConfigDir
 }
 
 // --- Project directory name handling ---
@@ -169,6 +169,10 @@ func BuildClaudeArgs(opts ClaudeArgsOptions) []string {
 	return args
 }
 
+// dockerRunArgsCap covers the argument count of a typical docker run command
+// line, so it is built without repeatedly growing the slice.
+const dockerRunArgsCap = 160
+
 // BuildDockerRunConfig builds the complete docker run configuration.
 // This is the core function that assembles all Docker run arguments including
 // volume mounts, environment variables, resource limits, and security constraints.
@@ -196,7 +200,8 @@ func BuildDockerRunConfig(
 		return nil, fmt.Errorf("cannot resolve Docker path: %w", err)
 	}
 
-	cmd := []string{"run", "--rm"}
+	cmd := make([]string, 0, dockerRunArgsCap)
+	cmd = append(cmd, "run", "--rm")
 
 	// TTY allocation: interactive sessions need -it, headless/debug needs -i only
 	isHeadless := opts.Headless || opts.Debug >= 2
@@ -210,9 +215,11 @@ func BuildDockerRunConfig(
 	cmd = append(cmd, "--name", containerName)
 
 	// Container labels for bridge TUI filtering and metadata
-	cmd = append(cmd, "--label", "ccbox=true")
-	cmd = append(cmd, "--label", config.LabelStack+"="+string(stack))
-	cmd = append(cmd, "--label", config.LabelProject+"="+projectName)
+	cmd = append(cmd,
+		"--label", config.LabelManaged,
+		"--label", config.LabelStack+"="+string(stack),
+		"--label", config.LabelProject+"="+projectName,
+	)
 
 	// Host project path for session compatibility.
 	// Claude Code uses pwd to determine project path for sessions.
@@ -303,8 +310,7 @@ func BuildDockerRunConfig(
 	addResourceLimits(&cmd, opts)
 
 	// Environment variables
-	cmd = append(cmd, "-e", "HOME=/ccbox")
-	cmd = append(cmd, "-e", "CLAUDE_CONFIG_DIR=/ccbox/.claude")
+	cmd = append(cmd, "-e", "HOME=/ccbox", "-e", "CLAUDE_CONFIG_DIR=/ccbox/.claude")
 	addTerminalEnv(&cmd)
 
 	// fakepath.so: original Windows path for LD_PRELOAD-based getcwd translation.
@@ -400,9 +406,7 @@ func addResourceLimits(cmd *[]string, opts RunOptions) {
 		if cpuLimit == "" {
 			cpuLimit = config.DefaultCPULimit
 		}
-		*cmd = append(*cmd, "--memory="+memLimit)
-		*cmd = append(*cmd, "--cpus="+cpuLimit)
-		*cmd = append(*cmd, "--cpu-shares=512")
+		*cmd = append(*cmd, "--memory="+memLimit, "--cpus="+cpuLimit, "--cpu-shares=512")
 	}
 	if opts.ZeroResidue {
 		*cmd = append(*cmd, "-e", config.Env.ZeroResidue+"=1")
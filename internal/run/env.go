@@ -5,6 +5,7 @@ import (
 	"os"
 	"regexp"
 	"runtime"
+	"strconv"
 	"strings"
 
 	"github.com/sungur/ccbox/internal/config"
@@ -26,12 +27,10 @@ func addGitEnv(cmd *[]string, secrets *[]string) {
 	creds := git.GetCredentials()
 
 	if creds.Name != "" {
-		*cmd = append(*cmd, "-e", "GIT_AUTHOR_NAME="+creds.Name)
-		*cmd = append(*cmd, "-e", "GIT_COMMITTER_NAME="+creds.Name)
+		*cmd = append(*cmd, "-e", "GIT_AUTHOR_NAME="+creds.Name, "-e", "GIT_COMMITTER_NAME="+creds.Name)
 	}
 	if creds.Email != "" {
-		*cmd = append(*cmd, "-e", "GIT_AUTHOR_EMAIL="+creds.Email)
-		*cmd = append(*cmd, "-e", "GIT_COMMITTER_EMAIL="+creds.Email)
+		*cmd = append(*cmd, "-e", "GIT_AUTHOR_EMAIL="+creds.Email, "-e", "GIT_COMMITTER_EMAIL="+creds.Email)
 	}
 	if creds.Token != "" {
 		*secrets = append(*secrets, "GITHUB_TOKEN="+creds.Token)
@@ -65,8 +64,10 @@ func addSshAgent(cmd *[]string) {
 		const winSSHPipe = `\\.\pipe\openssh-ssh-agent`
 		if _, err := os.Stat(winSSHPipe); err == nil {
 			// Docker Desktop can forward Windows named pipes
-			*cmd = append(*cmd, "-v", winSSHPipe+":/run/ssh-agent.sock:ro")
-			*cmd = append(*cmd, "-e", "SSH_AUTH_SOCK=/run/ssh-agent.sock")
+			*cmd = append(*cmd,
+				"-v", winSSHPipe+":/run/ssh-agent.sock:ro",
+				"-e", "SSH_AUTH_SOCK=/run/ssh-agent.sock",
+			)
 			log.Dim("SSH: agent forwarded (Windows pipe)")
 			return
 		}
@@ -83,12 +84,39 @@ func addSshAgent(cmd *[]string) {
 	}
 
 	// Mount the socket and set env var in container
-	*cmd = append(*cmd, "-v", sshAuthSock+":"+sshAuthSock+":ro")
-	*cmd = append(*cmd, "-e", "SSH_AUTH_SOCK="+sshAuthSock)
+	*cmd = append(*cmd,
+		"-v", sshAuthSock+":"+sshAuthSock+":ro",
+		"-e", "SSH_AUTH_SOCK="+sshAuthSock,
+	)
 
 	log.Dim("SSH: agent forwarded")
 }
 
+// terminalPassthroughVars are terminal-specific variables forwarded to the
+// container when set on the host.
+var terminalPassthroughVars = []string{
+	"TERM_PROGRAM",
+	"TERM_PROGRAM_VERSION",
+	"ITERM_SESSION_ID",
+	"ITERM_PROFILE",
+	"KITTY_WINDOW_ID",
+	"KITTY_PID",
+	"WEZTERM_PANE",
+	"WEZTERM_UNIX_SOCKET",
+	"GHOSTTY_RESOURCES_DIR",
+	"ALACRITTY_SOCKET",
+	"ALACRITTY_LOG",
+	"VSCODE_GIT_IPC_HANDLE",
+	"VSCODE_INJECTION",
+	"WT_SESSION",
+	"WT_PROFILE_ID",
+	"KONSOLE_VERSION",
+	"KONSOLE_DBUS_SESSION",
+	"TMUX",
+	"TMUX_PANE",
+	"STY",
+}
+
 // addTerminalEnv adds terminal-related environment variables.
 func addTerminalEnv(cmd *[]string) {
 	term := os.Getenv("TERM")
@@ -100,38 +128,16 @@ func addTerminalEnv(cmd *[]string) {
 		colorterm = "truecolor"
 	}
 
-	*cmd = append(*cmd, "-e", "TERM="+term)
-	*cmd = append(*cmd, "-e", "COLORTERM="+colorterm)
-
 	columns, lines := GetTerminalSize()
-	*cmd = append(*cmd, "-e", fmt.Sprintf("COLUMNS=%d", columns))
-	*cmd = append(*cmd, "-e", fmt.Sprintf("LINES=%d", lines))
+	*cmd = append(*cmd,
+		"-e", "TERM="+term,
+		"-e", "COLORTERM="+colorterm,
+		"-e", "COLUMNS="+strconv.Itoa(columns),
+		"-e", "LINES="+strconv.Itoa(lines),
+	)
 
 	// Passthrough terminal-specific variables
-	passthroughVars := []string{
-		"TERM_PROGRAM",
-		"TERM_PROGRAM_VERSION",
-		"ITERM_SESSION_ID",
-		"ITERM_PROFILE",
-		"KITTY_WINDOW_ID",
-		"KITTY_PID",
-		"WEZTERM_PANE",
-		"WEZTERM_UNIX_SOCKET",
-		"GHOSTTY_RESOURCES_DIR",
-		"ALACRITTY_SOCKET",
-		"ALACRITTY_LOG",
-		"VSCODE_GIT_IPC_HANDLE",
-		"VSCODE_INJECTION",
-		"WT_SESSION",
-		"WT_PROFILE_ID",
-		"KONSOLE_VERSION",
-		"KONSOLE_DBUS_SESSION",
-		"TMUX",
-		"TMUX_PANE",
-		"STY",
-	}
-
-	for _, varName := range passthroughVars {
+	for _, varName := range terminalPassthroughVars {
 		if value := os.Getenv(varName); value != "" {
 			*cmd = append(*cmd, "-e", varName+"="+value)
 		}
@@ -142,8 +148,10 @@ func addTerminalEnv(cmd *[]string) {
 // Container starts as root for setup, then drops to non-root user via gosu.
 func addUserMapping(cmd *[]string) {
 	uid, gid := GetHostUserIds()
-	*cmd = append(*cmd, "-e", fmt.Sprintf("%s=%d", config.Env.UID, uid))
-	*cmd = append(*cmd, "-e", fmt.Sprintf("%s=%d", config.Env.GID, gid))
+	*cmd = append(*cmd,
+		"-e", config.Env.UID+"="+strconv.Itoa(uid),
+		"-e", config.Env.GID+"="+strconv.Itoa(gid),
+	)
 }
 
 // addContainerEssentials adds init process, resource limits, and shared memory.
@@ -191,23 +199,61 @@ func addTmpfsMounts(cmd *[]string) {
 	)
 }
 
+// logOptionArgs rotate container logs to limit disk usage.
+var logOptionArgs = []string{
+	"--log-driver", "json-file",
+	"--log-opt", "max-size=10m",
+	"--log-opt", "max-file=3",
+	"--log-opt", "compress=true",
+}
+
+// dnsOptionArgs tune the container DNS resolver for faster lookups.
+var dnsOptionArgs = []string{
+	"--dns-opt", "ndots:1",
+	"--dns-opt", "timeout:1",
+	"--dns-opt", "attempts:1",
+}
+
 // addLogOptions adds log rotation options to limit disk usage.
 func addLogOptions(cmd *[]string) {
-	*cmd = append(*cmd,
-		"--log-driver", "json-file",
-		"--log-opt", "max-size=10m",
-		"--log-opt", "max-file=3",
-		"--log-opt", "compress=true",
-	)
+	*cmd = append(*cmd, logOptionArgs...)
 }
 
 // addDnsOptions adds DNS resolver options for faster lookups.
 func addDnsOptions(cmd *[]string) {
-	*cmd = append(*cmd,
-		"--dns-opt", "ndots:1",
-		"--dns-opt", "timeout:1",
-		"--dns-opt", "attempts:1",
-	)
+	*cmd = append(*cmd, dnsOptionArgs...)
+}
+
+// claudeAuthVars are host credentials forwarded through the secrets env-file.
+var claudeAuthVars = []string{
+	"ANTHROPIC_API_KEY",
+	"CLAUDE_CODE_API_KEY",
+	"CLAUDE_CODE_OAUTH_TOKEN",
+}
+
+// claudeEnvVars are fixed Claude Code and runtime settings for the container.
+var claudeEnvVars = []string{
+	"FORCE_COLOR=1",
+	"CLAUDE_CODE_DISABLE_NONESSENTIAL_TRAFFIC=1",
+	"CLAUDE_CODE_HIDE_ACCOUNT_INFO=1",
+	"CLAUDE_CODE_IDE_SKIP_AUTO_INSTALL=1",
+	"CLAUDE_AUTOCOMPACT_PCT_OVERRIDE=85",
+	"CLAUDE_BASH_MAINTAIN_PROJECT_WORKING_DIR=1",
+	"BASH_DEFAULT_TIMEOUT_MS=600000",
+	"BASH_MAX_TIMEOUT_MS=1800000",
+	"DISABLE_NON_ESSENTIAL_MODEL_CALLS=1",
+	"FORCE_AUTOUPDATE_PLUGINS=0",
+	"DISABLE_AUTOUPDATER=1",
+	"PYTHONUNBUFFERED=1",
+	"DO_NOT_TRACK=1",
+	"BUN_RUNTIME_TRANSPILER_CACHE_PATH=0",
+	"CLAUDE_CODE_DISABLE_FEEDBACK_SURVEY=1",
+	"DISABLE_TELEMETRY=1",
+	"DISABLE_ERROR_REPORTING=1",
+	"DISABLE_INSTALLATION_CHECKS=1",
+	"ENABLE_TOOL_SEARCH=auto:5",
+	"MAX_MCP_OUTPUT_TOKENS=12000",
+	"BASH_MAX_OUTPUT_LENGTH=50000",
 }
 
 // addClaudeEnv adds Claude Code and runtime environment variables.
@@ -218,42 +264,13 @@ func addClaudeEnv(cmd *[]string, secrets *[]string) {
 
 	// Authentication: pass through API keys and OAuth tokens via env-file
 	// to prevent exposure in /proc/pid/cmdline
-	authVars := []string{
-		"ANTHROPIC_API_KEY",
-		"CLAUDE_CODE_API_KEY",
-		"CLAUDE_CODE_OAUTH_TOKEN",
-	}
-	for _, v := range authVars {
+	for _, v := range claudeAuthVars {
 		if val := os.Getenv(v); val != "" {
 			*secrets = append(*secrets, v+"="+val)
 		}
 	}
 
-	envVars := []string{
-		"FORCE_COLOR=1",
-		"CLAUDE_CODE_DISABLE_NONESSENTIAL_TRAFFIC=1",
-		"CLAUDE_CODE_HIDE_ACCOUNT_INFO=1",
-		"CLAUDE_CODE_IDE_SKIP_AUTO_INSTALL=1",
-		"CLAUDE_AUTOCOMPACT_PCT_OVERRIDE=85",
-		"CLAUDE_BASH_MAINTAIN_PROJECT_WORKING_DIR=1",
-		"BASH_DEFAULT_TIMEOUT_MS=600000",
-		"BASH_MAX_TIMEOUT_MS=1800000",
-		"DISABLE_NON_ESSENTIAL_MODEL_CALLS=1",
-		"FORCE_AUTOUPDATE_PLUGINS=0",
-		"DISABLE_AUTOUPDATER=1",
-		"PYTHONUNBUFFERED=1",
-		"DO_NOT_TRACK=1",
-		"BUN_RUNTIME_TRANSPILER_CACHE_PATH=0",
-		"CLAUDE_CODE_DISABLE_FEEDBACK_SURVEY=1",
-		"DISABLE_TELEMETRY=1",
-		"DISABLE_ERROR_REPORTING=1",
-		"DISABLE_INSTALLATION_CHECKS=1",
-		"ENABLE_TOOL_SEARCH=auto:5",
-		"MAX_MCP_OUTPUT_TOKENS=12000",
-		"BASH_MAX_OUTPUT_LENGTH=50000",
-	}
-
-	for _, e := range envVars {
+	for _, e := range claudeEnvVars {
 		*cmd = append(*cmd, "-e", e)
 	}
 }
@@ -6,6 +6,7 @@ import (
 	"runtime"
 	"strconv"
 	"strings"
+	"sync"
 
 	"github.com/sungur/ccbox/internal/platform"
 )
@@ -74,6 +75,11 @@ func GetHostUserIds() (uid, gid int) {
 	return os.Getuid(), os.Getgid()
 }
 
+var (
+	hostTimezone     string
+	hostTimezoneOnce sync.Once
+)
+
 // GetHostTimezone returns the host timezone in IANA format.
 //
 // Detection order:
@@ -81,7 +87,17 @@ func GetHostUserIds() (uid, gid int) {
 //  2. /etc/timezone (Debian/Ubuntu)
 //  3. /etc/localtime symlink target
 //  4. UTC fallback
+//
+// The host timezone does not change during a run, so the result is cached.
 func GetHostTimezone() string {
+	hostTimezoneOnce.Do(func() {
+		hostTimezone = detectHostTimezone()
+	})
+	return hostTimezone
+}
+
+// detectHostTimezone probes the environment and filesystem for the host timezone.
+func detectHostTimezone() string {
 	// 1. Check TZ environment variable
 	if tz := os.Getenv("TZ"); tz != "" && strings.Contains(tz, "/") {
 		return tz
@@ -1,6 +1,7 @@
 package run
 
 import (
+	"errors"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -12,6 +13,9 @@ import (
 	"github.com/sungur/ccbox/internal/paths"
 )
 
+// gitdirRe matches the "gitdir:" pointer in a worktree's .git file.
+var gitdirRe = regexp.MustCompile(`^gitdir:\s*(.+)$`)
+
 // addWorktreeMount detects git worktrees and mounts the main .git directory.
 func addWorktreeMount(cmd *[]string, absProjectPath, gitPath string) {
 	data, err := os.ReadFile(gitPath)
@@ -21,7 +25,6 @@ func addWorktreeMount(cmd *[]string, absProjectPath, gitPath string) {
 	}
 
 	content := strings.TrimSpace(string(data))
-	gitdirRe := regexp.MustCompile(`^gitdir:\s*(.+)$`)
 	match := gitdirRe.FindStringSubmatch(content)
 	if match == nil {
 		return
@@ -89,10 +92,7 @@ func addClaudeJsonMount(cmd *[]string, claudeConfig string) {
 	claudeJsonHome := filepath.Join(homeDir, ".claude.json")
 
 	// Create empty file if missing (Docker would create a directory instead)
-	if _, err := os.Stat(claudeJsonHome); os.IsNotExist(err) {
-		_ = os.MkdirAll(homeDir, 0755)
-		_ = os.WriteFile(claudeJsonHome, []byte("{}"), 0644)
-	}
+	ensureJSONFile(claudeJsonHome)
 
 	dockerPath, err := paths.ResolveForDocker(claudeJsonHome)
 	if err == nil {
@@ -101,24 +101,35 @@ func addClaudeJsonMount(cmd *[]string, claudeConfig string) {
 	// .claude/.claude.json is already available via the .claude/ directory mount
 }
 
+// ensureJSONFile creates path containing an empty JSON object unless it
+// already exists. O_EXCL makes the existence check and the create a single
+// syscall; the parent directory is only created when the first attempt
+// reports it missing.
+func ensureJSONFile(path string) {
+	f, err := os.OpenFile(path, os.O_WRONLY|os.O_CREATE|os.O_EXCL, 0644)
+	if errors.Is(err, os.ErrNotExist) {
+		_ = os.MkdirAll(filepath.Dir(path), 0755)
+		f, err = os.OpenFile(path, os.O_WRONLY|os.O_CREATE|os.O_EXCL, 0644)
+	}
+	if err != nil {
+		return
+	}
+	_, _ = f.WriteString("{}")
+	_ = f.Close()
+}
+
 // mountClaudeJson mounts both .claude.json locations for minimal mount mode.
 func mountClaudeJson(cmd *[]string, homeDir, claudeConfig string) {
 	// Mount 1: ~/.claude.json -> /ccbox/.claude.json
 	claudeJsonHome := filepath.Join(homeDir, ".claude.json")
-	if _, err := os.Stat(claudeJsonHome); os.IsNotExist(err) {
-		_ = os.MkdirAll(homeDir, 0755)
-		_ = os.WriteFile(claudeJsonHome, []byte("{}"), 0644)
-	}
+	ensureJSONFile(claudeJsonHome)
 	if dockerPath, err := paths.ResolveForDocker(claudeJsonHome); err == nil {
 		*cmd = append(*cmd, "-v", dockerPath+":/ccbox/.claude.json:rw")
 	}
 
 	// Mount 2: ~/.claude/.claude.json -> /ccbox/.claude/.claude.json
 	claudeJsonConfig := filepath.Join(claudeConfig, ".claude.json")
-	if _, err := os.Stat(claudeJsonConfig); os.IsNotExist(err) {
-		_ = os.MkdirAll(claudeConfig, 0755)
-		_ = os.WriteFile(claudeJsonConfig, []byte("{}"), 0644)
-	}
+	ensureJSONFile(claudeJsonConfig)
 	if dockerPath, err := paths.ResolveForDocker(claudeJsonConfig); err == nil {
 		*cmd = append(*cmd, "-v", dockerPath+":/ccbox/.claude/.claude.json:rw")
 	}
@@ -127,17 +138,18 @@ func mountClaudeJson(cmd *[]string, homeDir, claudeConfig string) {
 // addReadOnlyRoot enables read-only root filesystem with tmpfs overlays
 // for directories that need write access.
 func addReadOnlyRoot(cmd *[]string) {
-	*cmd = append(*cmd, "--read-only")
-	overlays := map[string]string{
-		"/etc":           "rw,size=8m,mode=755",
-		"/root":          "rw,size=8m,mode=700",
-		"/usr/local/bin": "rw,size=16m,mode=755",
-		"/ccbox/.cache":  "rw,size=256m,mode=755",
-		"/ccbox/.npm":    "rw,size=64m,mode=755",
-		"/ccbox/.local":  "rw,size=32m,mode=755",
-		"/ccbox/.config": "rw,size=16m,mode=755",
-	}
-	for path, opts := range overlays {
-		*cmd = append(*cmd, "--tmpfs", path+":"+opts)
-	}
+	*cmd = append(*cmd, readOnlyRootArgs...)
+}
+
+// readOnlyRootArgs are the --read-only flag plus tmpfs overlays for paths
+// that still need write access.
+var readOnlyRootArgs = []string{
+	"--read-only",
+	"--tmpfs", "/etc:rw,size=8m,mode=755",
+	"--tmpfs", "/root:rw,size=8m,mode=700",
+	"--tmpfs", "/usr/local/bin:rw,size=16m,mode=755",
+	"--tmpfs", "/ccbox/.cache:rw,size=256m,mode=755",
+	"--tmpfs", "/ccbox/.npm:rw,size=64m,mode=755",
+	"--tmpfs", "/ccbox/.local:rw,size=32m,mode=755",
+	"--tmpfs", "/ccbox/.config:rw,size=16m,mode=755",
 }
@@ -0,0 +1,35 @@
+package run
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+)
+
+func TestEnsureJSONFile(t *testing.T) {
+	dir := t.TempDir()
+
+	t.Run("creates missing file and parent", func(t *testing.T) {
+		path := filepath.Join(dir, "nested", ".claude.json")
+		ensureJSONFile(path)
+		data, err := os.ReadFile(path)
+		if err != nil {
+			t.Fatalf("file not created: %v", err)
+		}
+		if string(data) != "{}" {
+			t.Errorf("content = %q, want %q", data, "{}")
+		}
+	})
+
+	t.Run("keeps existing content", func(t *testing.T) {
+		path := filepath.Join(dir, "existing.json")
+		if err := os.WriteFile(path, []byte(`{"a":1}`), 0644); err != nil {
+			t.Fatal(err)
+		}
+		ensureJSONFile(path)
+		data, _ := os.ReadFile(path)
+		if string(data) != `{"a":1}` {
+			t.Errorf("content = %q, want existing content preserved", data)
+		}
+	})
+}
@@ -8,6 +8,7 @@ import (
 	"os/exec"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/sungur/ccbox/internal/config"
@@ -62,65 +63,79 @@ type DetectionResult struct {
 // When stackName is empty or "auto", the stack is auto-detected from project
 // files. Otherwise, the specified stack name is validated and used directly.
 func DetectAndReportStack(path string, stackName string, verbose bool) (*DetectionResult, error) {
+	detection, scan, err := resolveStack(path, stackName, verbose)
+	if err != nil {
+		return nil, err
+	}
+	reportStack(detection, scan, verbose)
+	return detection, nil
+}
+
+// resolveStack validates the project path and resolves the stack without
+// logging the outcome, so it can run concurrently with other startup work.
+// The returned scan is nil when the stack was specified explicitly.
+func resolveStack(path string, stackName string, verbose bool) (*DetectionResult, *detect.DetectionResult, error) {
 	projectPath, err := paths.ValidateProjectPath(path)
 	if err != nil {
-		return nil, fmt.Errorf("invalid project path: %w", err)
+		return nil, nil, fmt.Errorf("invalid project path: %w", err)
 	}
 
 	projectName := filepath.Base(projectPath)
 
 	// Resolve stack from CLI flag or auto-detection
 	var stack config.LanguageStack
+	var scan *detect.DetectionResult
 
 	if stackName != "" && stackName != "auto" {
 		parsed, ok := config.ParseStack(stackName)
 		if !ok {
-			return nil, fmt.Errorf("invalid stack: %q. Use 'ccbox stacks' to see available options", stackName)
+			return nil, nil, fmt.Errorf("invalid stack: %q. Use 'ccbox stacks' to see available options", stackName)
 		}
 		stack = parsed
-
-		if verbose {
-			log.Dim(fmt.Sprintf("Stack: %s (specified)", stack))
-		}
 	} else {
-		// Auto-detect from project files
-		stack = detectFromProject(projectPath, verbose)
+		// Auto-detect from project files. Delegates to the detect package
+		// which provides confidence scoring, content validation, mutual
+		// exclusion, and promotion rules. Defaults to StackBase if no
+		// specific language is detected.
+		result := detect.DetectProjectType(projectPath, verbose)
+		scan = &result
+		stack = result.RecommendedStack
 	}
 
 	return &DetectionResult{
 		ProjectPath: projectPath,
 		ProjectName: projectName,
 		Stack:       stack,
-	}, nil
+	}, scan, nil
 }
 
-// detectFromProject scans project files to determine the best language stack.
-// Delegates to the detect package which provides confidence scoring,
-// content validation, mutual exclusion, and promotion rules.
-// Returns StackBase as the default if no specific language is detected.
-func detectFromProject(projectPath string, verbose bool) config.LanguageStack {
-	result := detect.DetectProjectType(projectPath, verbose)
+// reportStack logs how the stack was resolved by resolveStack.
+func reportStack(detection *DetectionResult, scan *detect.DetectionResult, verbose bool) {
+	if scan == nil {
+		if verbose {
+			log.Dimf("Stack: %s (specified)", detection.Stack)
+		}
+		return
+	}
 
-	if len(result.DetectedLanguages) > 0 {
+	if len(scan.DetectedLanguages) > 0 {
 		if verbose {
 			log.Dim("Detection:")
-			for _, d := range result.DetectedLanguages {
-				log.Dim(fmt.Sprintf("  %-12s %2d  %s", d.Language, d.Confidence, d.Trigger))
+			for _, d := range scan.DetectedLanguages {
+				log.Dimf("  %-12s %2d  %s", d.Language, d.Confidence, d.Trigger)
 			}
-			log.Dim(fmt.Sprintf("  -> Stack: %s", result.RecommendedStack))
+			log.Dimf("  -> Stack: %s", scan.RecommendedStack)
 		} else {
-			summaryParts := make([]string, len(result.DetectedLanguages))
-			for i, d := range result.DetectedLanguages {
+			summaryParts := make([]string, len(scan.DetectedLanguages))
+			for i, d := range scan.DetectedLanguages {
 				summaryParts[i] = fmt.Sprintf("%s (%d)", d.Language, d.Confidence)
 			}
-			log.Dim(fmt.Sprintf("Detection: %s -> %s",
-				strings.Join(summaryParts, ", "), result.RecommendedStack))
+			log.Dimf("Detection: %s -> %s",
+				strings.Join(summaryParts, ", "), scan.RecommendedStack)
 		}
 	} else if verbose {
-		log.Dim(fmt.Sprintf("Detection: no languages found -> %s", config.StackBase))
+		log.Dimf("Detection: no languages found -> %s", config.StackBase)
 	}
-
-	return result.RecommendedStack
 }
 
 // --- Execute pipeline ---
@@ -137,16 +152,45 @@ func detectFromProject(projectPath string, verbose bool) config.LanguageStack {
 //  7. Run container
 //  8. Return exit code
 func Execute(opts ExecuteOptions) error {
+	// Resolve the stack while Docker is checked: the scan only touches the
+	// filesystem, so it overlaps with the daemon round-trip (or startup wait).
+	// Results are reported once the check has passed to keep output ordered.
+	// Verbose detection prints its scoring trace as it runs, so it stays
+	// sequential to avoid interleaving with the Docker startup messages.
+	type stackResult struct {
+		detection *DetectionResult
+		scan      *detect.DetectionResult
+		err       error
+	}
+	stackCh := make(chan stackResult, 1)
+	resolve := func() {
+		detection, scan, err := resolveStack(opts.ProjectPath, opts.StackName, opts.Verbose)
+		stackCh <- stackResult{detection, scan, err}
+	}
+	if !opts.Verbose {
+		go resolve()
+	}
+
 	// Phase 1: Ensure Docker is available
 	if err := checkDockerRunning(); err != nil {
 		return fmt.Errorf("check docker: %w", err)
 	}
 
+	if opts.Verbose {
+		resolve()
+	}
+
+	// Fetch the local ccbox image index while detection finishes, so the
+	// image checks in ensureImages are answered from memory.
+	go prefetchImageIndex()
+
 	// Phase 2: Detect project type and resolve stack
-	detection, err := DetectAndReportStack(opts.ProjectPath, opts.StackName, opts.Verbose)
-	if err != nil {
-		return fmt.Errorf("detect project: %w", err)
+	resolved := <-stackCh
+	if resolved.err != nil {
+		return fmt.Errorf("detect project: %w", resolved.err)
 	}
+	detection := resolved.detection
+	reportStack(detection, resolved.scan, opts.Verbose)
 
 	stack := detection.Stack
 
@@ -223,6 +267,10 @@ func ensureImages(stack string, opts ExecuteOptions) error {
 	}
 
 	// Fallback: build locally
+	// Write the stack's build context in the background so the file
+	// generation overlaps with preparing the base image below.
+	stackFiles := prepareBuildFiles(stack)
+
 	// Check if base image exists (required for most stacks)
 	dep := config.StackDependencies[config.LanguageStack(stack)]
 	if dep != "" {
@@ -237,7 +285,7 @@ func ensureImages(stack string, opts ExecuteOptions) error {
 			}
 			if !imageExists(baseImage) {
 				log.Bold("First-time setup: building base image...")
-				if err := buildImage(string(dep), opts.Cache, opts.Progress); err != nil {
+				if err := buildImage(string(dep), prepareBuildFiles(string(dep)), opts.Cache, opts.Progress); err != nil {
 					return fmt.Errorf("failed to build base image: %w", err)
 				}
 				log.Newline()
@@ -247,7 +295,7 @@ func ensureImages(stack string, opts ExecuteOptions) error {
 
 	// Build stack image
 	log.Bold(fmt.Sprintf("Building %s image...", stack))
-	if err := buildImage(stack, opts.Cache, opts.Progress); err != nil {
+	if err := buildImage(stack, stackFiles, opts.Cache, opts.Progress); err != nil {
 		return fmt.Errorf("failed to build %s image: %w", stack, err)
 	}
 	log.Newline()
@@ -272,34 +320,133 @@ func pullImage(stack, localName, version, progress string) bool {
 		log.Debugf("Tag failed: %v", err)
 		return false
 	}
+	markImageExists(localName)
 	log.Dim("Using pre-built image: " + ref)
 	return true
 }
 
+// imageExistsCache memoizes image existence checks for the lifetime of the
+// process. The local image set only changes when ccbox pulls or builds an
+// image, and those paths record the result via markImageExists, so repeated
+// checks for the same image cost a single daemon round-trip.
+//
+// On first use the cache is seeded from one listing of all local ccbox
+// images (imageIndexLoaded), which answers every ccbox image question --
+// stack and base image alike -- without per-image inspect calls.
+var (
+	imageExistsMu    sync.Mutex
+	imageExistsCache = map[string]bool{}
+	imageIndexLoaded bool
+	imageIndexOK     bool
+)
+
 // imageExists checks if a Docker image exists locally.
 func imageExists(imageName string) bool {
+	imageExistsMu.Lock()
+	defer imageExistsMu.Unlock()
+
+	if !imageIndexLoaded {
+		loadImageIndex()
+	}
+	if exists, ok := imageExistsCache[imageName]; ok {
+		return exists
+	}
+
+	// The listing covers every ccbox image, so a ccbox name missing from it
+	// does not exist locally.
+	if imageIndexOK && strings.HasPrefix(imageName, config.CcboxPrefix) {
+		imageExistsCache[imageName] = false
+		return false
+	}
+
 	ctx, cancel := context.WithTimeout(context.Background(), config.DockerCommandTimeout)
 	defer cancel()
 
-	return docker.Exists(ctx, imageName)
+	exists := docker.Exists(ctx, imageName)
+	imageExistsCache[imageName] = exists
+	return exists
 }
 
-// buildImage builds a Docker image for the given stack.
-func buildImage(stack string, cache bool, progress string) error {
-	buildDir, err := generate.WriteBuildFiles(config.LanguageStack(stack))
+// prefetchImageIndex loads the image index if no check has done so yet.
+func prefetchImageIndex() {
+	imageExistsMu.Lock()
+	defer imageExistsMu.Unlock()
+
+	if !imageIndexLoaded {
+		loadImageIndex()
+	}
+}
+
+// loadImageIndex seeds imageExistsCache with the tags of all local ccbox
+// images. Callers must hold imageExistsMu. On failure the cache is left
+// unseeded and imageExists falls back to per-image inspection.
+func loadImageIndex() {
+	imageIndexLoaded = true
+
+	ctx, cancel := context.WithTimeout(context.Background(), config.DockerCommandTimeout)
+	defer cancel()
+
+	images, err := docker.ListCcboxImages(ctx)
 	if err != nil {
-		return fmt.Errorf("generate build files: %w", err)
+		log.Debugf("List images: %v", err)
+		return
+	}
+	for _, img := range images {
+		for _, tag := range img.RepoTags {
+			imageExistsCache[tag] = true
+		}
+	}
+	imageIndexOK = true
+}
+
+// markImageExists records that an image is now present locally.
+func markImageExists(imageName string) {
+	imageExistsMu.Lock()
+	defer imageExistsMu.Unlock()
+
+	imageExistsCache[imageName] = true
+}
+
+// buildFilesResult is the outcome of writing a stack's build context.
+type buildFilesResult struct {
+	dir string
+	err error
+}
+
+// prepareBuildFiles writes the build context for stack in a goroutine and
+// returns a channel that yields the result once the files are on disk.
+func prepareBuildFiles(stack string) <-chan buildFilesResult {
+	ch := make(chan buildFilesResult, 1)
+	go func() {
+		dir, err := generate.WriteBuildFiles(config.LanguageStack(stack))
+		ch <- buildFilesResult{dir: dir, err: err}
+	}()
+	return ch
+}
+
+// buildImage builds a Docker image for the given stack once its build
+// context from prepareBuildFiles is ready.
+func buildImage(stack string, files <-chan buildFilesResult, cache bool, progress string) error {
+	result := <-files
+	if result.err != nil {
+		return fmt.Errorf("generate build files: %w", result.err)
 	}
+	buildDir := result.dir
 
 	imageName := config.GetImageName(stack)
 
 	ctx, cancel := context.WithTimeout(context.Background(), config.DockerBuildTimeout)
 	defer cancel()
 
-	return docker.Build(ctx, buildDir, imageName, docker.BuildOptions{
+	if err := docker.Build(ctx, buildDir, imageName, docker.BuildOptions{
 		NoCache:  !cache,
 		Progress: progress,
-	})
+	}); err != nil {
+		return err
+	}
+
+	markImageExists(imageName)
+	return nil
 }
 
 // executeContainer runs the Docker container with the given configuration
@@ -325,7 +472,7 @@ func executeContainer(runConfig *DockerRunConfig, projectName string, debug int,
 		log.Dim("Docker command: docker " + strings.Join(runConfig.Args, " "))
 	}
 
-	cmd := exec.Command("docker", runConfig.Args...)
+	cmd := exec.Command(docker.CLIPath(), runConfig.Args...)
 	cmd.Env = runConfig.Env
 
 	// stdin: inherit for interactive, nil for headless/watch-only (-dd)
@@ -405,15 +552,27 @@ func PruneStaleResources(debug bool) {
 	ctx, cancel := context.WithTimeout(context.Background(), config.PruneTimeout)
 	defer cancel()
 
+	// Containers and build cache are independent, so prune them concurrently.
+	var wg sync.WaitGroup
+	wg.Add(2)
+
 	// Remove stopped ccbox containers
-	if _, err := docker.PruneContainers(ctx); err != nil {
-		log.Debugf("Prune containers: %v", err)
-	}
+	go func() {
+		defer wg.Done()
+		if _, err := docker.PruneContainers(ctx); err != nil {
+			log.Debugf("Prune containers: %v", err)
+		}
+	}()
 
 	// Prune build cache older than configured age
-	if err := docker.PruneBuilder(ctx, config.PruneCacheAge); err != nil {
-		log.Debugf("Prune build cache: %v", err)
-	}
+	go func() {
+		defer wg.Done()
+		if err := docker.PruneBuilder(ctx, config.PruneCacheAge); err != nil {
+			log.Debugf("Prune build cache: %v", err)
+		}
+	}()
+
+	wg.Wait()
 
 	if debug {
 		log.Debug("Pruned stale Docker resources")